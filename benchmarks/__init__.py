@@ -0,0 +1,10 @@
+"""
+Micro-benchmarks for the boundary between Python and wasm.
+
+Run all benchmarks with `python -m benchmarks`, or only those whose name
+contains any of the given filters with `python -m benchmarks memory func`.
+
+Each benchmark reports the number of operations per second, the time per
+operation, and the peak number of bytes allocated by Python during a single
+operation as measured by `tracemalloc`.
+"""
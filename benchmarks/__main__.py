@@ -0,0 +1,7 @@
+import sys
+
+from .harness import run_all
+
+
+if __name__ == '__main__':
+    run_all(sys.argv[1:])
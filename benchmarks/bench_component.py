@@ -0,0 +1,77 @@
+# Benchmarks for calling component functions with non-scalar values.
+
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterator, Tuple
+
+from wasmtime import Engine, Store
+from wasmtime.component import Component, Linker, Instance
+
+from .harness import Benchmark
+
+# Each export returns its arguments back out, using a fixed scratch buffer in
+# linear memory for any lowered strings and lists.
+WAT = """
+    (component
+        (core module $m
+            (memory (export "mem") 1)
+            (func (export "realloc") (param i32 i32 i32 i32) (result i32)
+                i32.const 1024)
+            (func (export "echo") (param i32 i32) (result i32)
+                (i32.store (i32.const 0) (local.get 0))
+                (i32.store (i32.const 4) (local.get 1))
+                i32.const 0)
+            (func (export "echo-record") (param i32 i32 i32) (result i32)
+                (i32.store (i32.const 0) (local.get 0))
+                (i32.store (i32.const 4) (local.get 1))
+                (i32.store (i32.const 8) (local.get 2))
+                i32.const 0)
+        )
+        (core instance $i (instantiate $m))
+        (func (export "echo-string") (param "x" string) (result string)
+            (canon lift (core func $i "echo") (memory $i "mem")
+                (realloc (func $i "realloc"))))
+        (func (export "echo-list") (param "x" (list u32)) (result (list u32))
+            (canon lift (core func $i "echo") (memory $i "mem")
+                (realloc (func $i "realloc"))))
+        (type $record (record (field "a" u32) (field "b" string)))
+        (export $r "r" (type $record))
+        (func (export "echo-record") (param "x" $r) (result $r)
+            (canon lift (core func $i "echo-record") (memory $i "mem")
+                (realloc (func $i "realloc"))))
+    )
+"""
+
+
+@dataclass
+class Record:
+    a: int
+    b: str
+
+
+@lru_cache(maxsize=None)
+def setup() -> Tuple[Store, Instance]:
+    engine = Engine()
+    store = Store(engine)
+    component = Component(engine, WAT)
+    return store, Linker(engine).instantiate(store, component)
+
+
+def echo(name: str, arg: Any) -> Callable[[], Any]:
+    store, instance = setup()
+    f = instance.get_func(store, name)
+    assert(f is not None)
+
+    def call() -> Any:
+        ret = f(store, arg)
+        f.post_return(store)
+        return ret
+    return call
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield "component: string 16 bytes", partial(echo, "echo-string", 'x' * 16)
+    yield "component: string 4096 bytes", partial(echo, "echo-string", 'x' * 4096)
+    yield "component: list<u32> 16 items", partial(echo, "echo-list", list(range(16)))
+    yield "component: list<u32> 1024 items", partial(echo, "echo-list", list(range(1024)))
+    yield "component: record", partial(echo, "echo-record", Record(1, 'hello'))
@@ -0,0 +1,85 @@
+# Benchmarks for calling core wasm functions and host functions.
+
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterator, List, Tuple
+
+from wasmtime import Store, Module, Instance, Func, FuncType, ValType
+from wasmtime._instance import InstanceExports
+
+from .harness import Benchmark
+
+ARITIES = [0, 1, 4, 16]
+
+
+def wat() -> str:
+    funcs = []
+    for n in ARITIES:
+        params = ' '.join(['i32'] * n)
+        funcs.append('(func (export "args%d") (param %s) (result i32) i32.const 0)' % (n, params))
+    return """
+        (module
+            (import "" "host" (func $host (param i32 i32 i32 i32) (result i32)))
+            (import "" "host_unchecked" (func $host_unchecked (param i32 i32 i32 i32) (result i32)))
+            %s
+            (func (export "call_host") (result i32)
+                (call $host (i32.const 1) (i32.const 2) (i32.const 3) (i32.const 4)))
+            (func (export "call_host_unchecked") (result i32)
+                (call $host_unchecked (i32.const 1) (i32.const 2) (i32.const 3) (i32.const 4)))
+        )
+    """ % '\n'.join(funcs)
+
+
+@lru_cache(maxsize=None)
+def setup() -> Tuple[Store, InstanceExports]:
+    store = Store()
+    module = Module(store.engine, wat())
+    i32 = ValType.i32()
+    ty = FuncType([i32] * 4, [i32])
+
+    def host(a: int, b: int, c: int, d: int) -> int:
+        return a + b + c + d
+
+    imports = [
+        Func(store, ty, host),
+        Func(store, ty, host, unchecked=True),
+    ]
+    return store, Instance(store, module, imports).exports(store)
+
+
+def export(name: str) -> Func:
+    _, exports = setup()
+    f = exports[name]
+    assert(isinstance(f, Func))
+    return f
+
+
+def call(n: int) -> Callable[[], Any]:
+    store, _ = setup()
+    args: List[Any] = list(range(n))
+    return partial(export("args%d" % n), store, *args)
+
+
+def call_typed(n: int) -> Callable[[], Any]:
+    store, _ = setup()
+    args: List[Any] = list(range(n))
+    return partial(export("args%d" % n).typed(store), store, *args)
+
+
+def call_unchecked(n: int) -> Callable[[], Any]:
+    store, _ = setup()
+    args: List[Any] = list(range(n))
+    return partial(export("args%d" % n).typed(store).call_unchecked, store, *args)
+
+
+def call_host(name: str) -> Callable[[], Any]:
+    store, _ = setup()
+    return partial(export(name).typed(store).call_unchecked, store)
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    for n in ARITIES:
+        yield "func: Func.__call__ %d args" % n, partial(call, n)
+        yield "func: TypedFunc.__call__ %d args" % n, partial(call_typed, n)
+        yield "func: TypedFunc.call_unchecked %d args" % n, partial(call_unchecked, n)
+    yield "func: wasm -> host trampoline", partial(call_host, "call_host")
+    yield "func: wasm -> host unchecked_trampoline", partial(call_host, "call_host_unchecked")
@@ -0,0 +1,53 @@
+# Benchmarks for creating stores and instances.
+
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Tuple
+
+from wasmtime import Engine, Store, Module, Instance, Linker, InstancePre
+
+from .harness import Benchmark
+
+WAT = """
+    (module
+        (memory (export "memory") 1)
+        (global (export "g") (mut i32) (i32.const 0))
+        (table (export "t") 10 funcref)
+        (func (export "f") (param i32) (result i32) local.get 0)
+        (data (i32.const 0) "hello")
+    )
+"""
+
+
+@lru_cache(maxsize=None)
+def setup() -> Tuple[Engine, Module, Linker, InstancePre]:
+    engine = Engine()
+    module = Module(engine, WAT)
+    linker = Linker(engine)
+    return engine, module, linker, linker.instantiate_pre(module)
+
+
+def store() -> Callable[[], Any]:
+    engine, _, _, _ = setup()
+    return lambda: Store(engine)
+
+
+def instance() -> Callable[[], Any]:
+    engine, module, _, _ = setup()
+    return lambda: Instance(Store(engine), module, [])
+
+
+def linker_instantiate() -> Callable[[], Any]:
+    engine, module, linker, _ = setup()
+    return lambda: linker.instantiate(Store(engine), module)
+
+
+def instance_pre_instantiate() -> Callable[[], Any]:
+    engine, _, _, pre = setup()
+    return lambda: pre.instantiate(Store(engine))
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield "instance: Store()", store
+    yield "instance: Instance(...)", instance
+    yield "instance: Linker.instantiate", linker_instantiate
+    yield "instance: InstancePre.instantiate", instance_pre_instantiate
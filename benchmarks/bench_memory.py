@@ -0,0 +1,40 @@
+# Benchmarks for reading and writing linear memory.
+
+from functools import lru_cache, partial
+from typing import Iterator, Tuple
+
+from wasmtime import Store, Memory, MemoryType, Limits
+
+from .harness import Benchmark
+
+SIZES = [16, 4096, 1 << 20]
+
+
+@lru_cache(maxsize=None)
+def setup() -> Tuple[Store, Memory]:
+    store = Store()
+    return store, Memory(store, MemoryType(Limits(32, None)))
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    def read(size: int) -> partial:
+        store, memory = setup()
+        return partial(memory.read, store, 0, size)
+
+    def write(size: int) -> partial:
+        store, memory = setup()
+        return partial(memory.write, store, bytes(size), 0)
+
+    def read_into(size: int) -> partial:
+        store, memory = setup()
+        return partial(memory.read_into, store, bytearray(size), 0)
+
+    def write_from(size: int) -> partial:
+        store, memory = setup()
+        return partial(memory.write_from, store, bytearray(size), 0)
+
+    for size in SIZES:
+        yield "memory: read %d bytes" % size, partial(read, size)
+        yield "memory: write %d bytes" % size, partial(write, size)
+        yield "memory: read_into %d bytes" % size, partial(read_into, size)
+        yield "memory: write_from %d bytes" % size, partial(write_from, size)
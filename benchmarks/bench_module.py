@@ -0,0 +1,51 @@
+# Benchmarks for compiling and deserializing modules.
+
+import atexit
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Tuple
+
+from wasmtime import Engine, Module, wat2wasm
+
+from .harness import Benchmark
+
+
+def wat(funcs: int) -> str:
+    body = '\n'.join(
+        '(func (export "f%d") (param i32 i32) (result i32) (i32.add (local.get 0) (local.get 1)))' % i
+        for i in range(funcs))
+    return '(module %s)' % body
+
+
+@lru_cache(maxsize=None)
+def setup() -> Tuple[Engine, bytearray, bytes, str]:
+    engine = Engine()
+    wasm = wat2wasm(wat(100))
+    serialized = bytes(Module(engine, wasm).serialize())
+    fd, path = tempfile.mkstemp(suffix='.cwasm')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(serialized)
+    atexit.register(os.unlink, path)
+    return engine, wasm, serialized, path
+
+
+def module_new() -> Callable[[], Any]:
+    engine, wasm, _, _ = setup()
+    return lambda: Module(engine, wasm)
+
+
+def deserialize() -> Callable[[], Any]:
+    engine, _, serialized, _ = setup()
+    return lambda: Module.deserialize(engine, serialized)
+
+
+def deserialize_file() -> Callable[[], Any]:
+    engine, _, _, path = setup()
+    return lambda: Module.deserialize_file(engine, path)
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield "module: Module(...) 100 funcs", module_new
+    yield "module: Module.deserialize 100 funcs", deserialize
+    yield "module: Module.deserialize_file 100 funcs", deserialize_file
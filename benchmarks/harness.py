@@ -0,0 +1,47 @@
+import statistics
+import timeit
+import tracemalloc
+from typing import Any, Callable, Iterable, List, Tuple
+
+# A benchmark's name and a function which performs any setup it needs and
+# returns the function to time. Setup is deferred so that benchmarks excluded
+# by a filter never run it.
+Benchmark = Tuple[str, Callable[[], Callable[[], Any]]]
+
+
+def measure(f: Callable[[], Any]) -> Tuple[float, float]:
+    """
+    Returns the best time, in seconds, taken per call of `f` and the median
+    peak number of bytes allocated by a single call.
+    """
+    timer = timeit.Timer(f)
+    number, _ = timer.autorange()
+    elapsed = min(timer.repeat(repeat=5, number=number)) / number
+
+    samples = []
+    tracemalloc.start()
+    try:
+        for _ in range(11):
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            f()
+            samples.append(tracemalloc.get_traced_memory()[1] - start)
+    finally:
+        tracemalloc.stop()
+    return elapsed, statistics.median(samples)
+
+
+def run(benchmarks: Iterable[Benchmark], filters: List[str]) -> None:
+    for name, setup in benchmarks:
+        if filters and not any(pattern in name for pattern in filters):
+            continue
+        elapsed, allocated = measure(setup())
+        print("%-45s %12.0f ops/sec %12.3f us/op %10d peak B/op" %
+              (name, 1 / elapsed, elapsed * 1e6, allocated), flush=True)
+
+
+def run_all(filters: List[str]) -> None:
+    from . import bench_func, bench_memory, bench_instance, bench_module, bench_component
+
+    for module in [bench_func, bench_memory, bench_instance, bench_module, bench_component]:
+        run(module.benchmarks(), filters)
@@ -30,6 +30,7 @@ class TestComponent(unittest.TestCase):
         component = Component(engine, '(component)')
         encoded = component.serialize()
         component = Component.deserialize(engine, encoded)
+        Component.deserialize(engine, memoryview(bytes(encoded)))
         with tempfile.TemporaryDirectory() as d:
             path = d + '/component.bin'
             with open(path, 'wb') as f:
@@ -39,6 +40,13 @@ class TestComponent(unittest.TestCase):
             with Component.deserialize_file(engine, path):
                 pass
 
+    def test_compile_many(self):
+        engine = Engine()
+        results = Component.compile_many(engine, ['(component)', '(module)', b'\0asm\x0d\0\x01\0'])
+        assert(isinstance(results[0].value, Component))
+        assert(isinstance(results[1].error, WasmtimeError))
+        assert(isinstance(results[2].value, Component))
+
     def test_exports(self):
         engine = Engine()
 
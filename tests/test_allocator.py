@@ -0,0 +1,86 @@
+import unittest
+
+from wasmtime import *
+
+ALLOCATOR_WAT = """
+    (module
+        (memory (export "memory") 1)
+        (global $next (mut i32) (i32.const 1024))
+        (global $frees (export "frees") (mut i32) (i32.const 0))
+        (func (export "malloc") (param i32) (result i32)
+            (local $ret i32)
+            (local.set $ret (global.get $next))
+            (global.set $next (i32.add (global.get $next) (local.get 0)))
+            (local.get $ret))
+        (func (export "free") (param i32)
+            (global.set $frees (i32.add (global.get $frees) (i32.const 1))))
+        (func (export "sum") (param $ptr i32) (param $len i32) (result i32)
+            (local $sum i32)
+            (block $done
+                (loop $next
+                    (br_if $done (i32.eqz (local.get $len)))
+                    (local.set $sum (i32.add (local.get $sum) (i32.load8_u (local.get $ptr))))
+                    (local.set $ptr (i32.add (local.get $ptr) (i32.const 1)))
+                    (local.set $len (i32.sub (local.get $len) (i32.const 1)))
+                    (br $next)))
+            (local.get $sum))
+    )
+"""
+
+
+class TestGuestAllocator(unittest.TestCase):
+    def setUp(self):
+        self.store = Store()
+        module = Module(self.store.engine, ALLOCATOR_WAT)
+        self.instance = Instance(self.store, module, [])
+        self.exports = self.instance.exports(self.store)
+
+    def frees(self) -> int:
+        frees = self.exports["frees"]
+        assert(isinstance(frees, Global))
+        return frees.value(self.store)
+
+    def test_pass_and_release(self):
+        allocator = GuestAllocator(self.store, self.instance)
+        ptr, length = allocator.pass_bytes(b'\x01\x02\x03')
+        self.assertEqual(length, 3)
+        total = self.exports["sum"]
+        assert(isinstance(total, Func))
+        self.assertEqual(total(self.store, ptr, length), 6)
+
+        # Released buffers are reused for data of a similar size.
+        allocator.release(ptr)
+        ptr2, length = allocator.pass_str('héllo')
+        self.assertEqual(ptr2, ptr)
+        self.assertEqual(length, 6)
+        self.assertEqual(allocator.return_bytes(ptr2, length, free=False), 'héllo'.encode('utf-8'))
+        self.assertEqual(allocator.return_str(ptr2, length, free=False), 'héllo')
+
+        ptr3, _ = allocator.pass_bytes(bytearray(100))
+        self.assertNotEqual(ptr3, ptr2)
+        with self.assertRaises(WasmtimeError):
+            allocator.release(12345)
+
+        allocator.release(ptr2)
+        allocator.release(ptr3)
+        self.assertEqual(self.frees(), 0)
+        allocator.close()
+        self.assertEqual(self.frees(), 2)
+
+    def test_return_bytes(self):
+        with GuestAllocator(self.store, self.instance) as allocator:
+            memory = self.exports["memory"]
+            assert(isinstance(memory, Memory))
+            memory.write(self.store, b'guest', 200)
+            self.assertEqual(allocator.return_bytes(200, 5), b'guest')
+            self.assertEqual(self.frees(), 1)
+            with self.assertRaises(IndexError):
+                allocator.return_bytes(65535, 2)
+
+    def test_errors(self):
+        with self.assertRaises(WasmtimeError):
+            GuestAllocator(self.store, self.instance, memory="sum")
+        with self.assertRaises(WasmtimeError):
+            GuestAllocator(self.store, self.instance, alloc="memory")
+        with self.assertRaises(KeyError):
+            GuestAllocator(self.store, self.instance, free="missing")
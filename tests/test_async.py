@@ -0,0 +1,202 @@
+import asyncio
+import unittest
+from typing import List, Optional
+
+from wasmtime import *
+
+
+LOOP = """
+    (module
+        (func (export "count") (param i32) (result i32)
+            (local i32)
+            (loop $l
+                (local.set 1 (i32.add (local.get 1) (i32.const 1)))
+                (br_if $l (i32.lt_u (local.get 1) (local.get 0))))
+            local.get 1)
+        (func (export "trap") unreachable)
+    )
+"""
+
+
+def fuel_store(engine: Engine) -> Store:
+    store = Store(engine)
+    store.set_fuel(1_000_000_000)
+    store.fuel_async_yield_interval(1000)
+    return store
+
+
+class TestAsync(unittest.TestCase):
+    def test_call_async(self):
+        store = Store()
+        func = Func(store, FuncType([ValType.i32(), ValType.i32()], [ValType.i32()]), lambda a, b: a + b)
+        self.assertEqual(asyncio.run(func.call_async(store, 1, 2)), 3)
+
+        func = Func(store, FuncType([], []), lambda: None)
+        self.assertEqual(asyncio.run(func.call_async(store)), None)
+        with self.assertRaises(WasmtimeError):
+            asyncio.run(func.call_async(store, 1))
+
+    def test_yields_to_event_loop(self):
+        config = Config()
+        config.consume_fuel = True
+        engine = Engine(config)
+        module = Module(engine, LOOP)
+        linker = Linker(engine)
+
+        async def run_guest() -> int:
+            store = fuel_store(engine)
+            instance = await linker.instantiate_async(store, module)
+            count = instance.exports(store)["count"]
+            assert(isinstance(count, Func))
+            result = await count.call_async(store, 100000)
+            assert(isinstance(result, int))
+            return result
+
+        ticks = []
+
+        async def ticker() -> None:
+            for i in range(10):
+                ticks.append(i)
+                await asyncio.sleep(0)
+
+        async def main() -> List[Optional[int]]:
+            return list(await asyncio.gather(run_guest(), run_guest(), ticker()))
+
+        results = asyncio.run(main())
+        self.assertEqual(results[:2], [100000, 100000])
+        self.assertEqual(len(ticks), 10)
+
+    def test_trap(self):
+        config = Config()
+        config.consume_fuel = True
+        engine = Engine(config)
+        store = fuel_store(engine)
+        module = Module(engine, LOOP)
+        pre = Linker(engine).instantiate_pre(module)
+        instance = asyncio.run(pre.instantiate_async(store))
+        trap = instance.exports(store)["trap"]
+        assert(isinstance(trap, Func))
+        with self.assertRaises(Trap):
+            asyncio.run(trap.call_async(store))
+
+        store.set_fuel(10)
+        count = instance.exports(store)["count"]
+        assert(isinstance(count, Func))
+        with self.assertRaises(Trap):
+            asyncio.run(count.call_async(store, 100000))
+
+    def test_host_exception(self):
+        store = Store()
+
+        def do_raise() -> None:
+            raise Exception("hello")
+
+        func = Func(store, FuncType([], []), do_raise)
+        with self.assertRaises(Exception, msg="hello"):
+            asyncio.run(func.call_async(store))
+
+    def test_fuel_yield_requires_fuel(self):
+        store = Store()
+        with self.assertRaises(WasmtimeError):
+            store.fuel_async_yield_interval(1000)
+
+    def test_epoch_yield(self):
+        config = Config()
+        config.epoch_interruption = True
+        engine = Engine(config)
+        module = Module(engine, LOOP)
+        ticks = []
+
+        async def run_guest() -> int:
+            store = Store(engine)
+            store.set_epoch_deadline(1)
+            store.epoch_deadline_async_yield_and_update(1)
+            instance = await Linker(engine).instantiate_async(store, module)
+            count = instance.exports(store)["count"]
+            assert(isinstance(count, Func))
+            result = await count.call_async(store, 100000)
+            assert(isinstance(result, int))
+            return result
+
+        async def ticker() -> None:
+            for i in range(10):
+                ticks.append(i)
+                engine.increment_epoch()
+                await asyncio.sleep(0)
+
+        async def main() -> List[Optional[int]]:
+            return list(await asyncio.gather(run_guest(), ticker()))
+
+        self.assertEqual(asyncio.run(main())[0], 100000)
+        self.assertEqual(len(ticks), 10)
+
+    def test_define_async_func(self):
+        engine = Engine()
+        linker = Linker(engine)
+        log = []
+
+        async def lookup(key: int) -> int:
+            log.append(('start', key))
+            await asyncio.sleep(0.01)
+            log.append(('end', key))
+            return key * 10
+
+        ty = FuncType([ValType.i32()], [ValType.i32()])
+        linker.define_async_func("host", "lookup", ty, lookup)
+        module = Module(engine, """
+            (module
+                (import "host" "lookup" (func $lookup (param i32) (result i32)))
+                (func (export "run") (param i32) (result i32)
+                    (i32.add
+                        (call $lookup (local.get 0))
+                        (call $lookup (i32.const 1))))
+            )
+        """)
+
+        async def run_guest(key: int) -> int:
+            store = Store(engine)
+            instance = await linker.instantiate_async(store, module)
+            run = instance.exports(store)["run"]
+            assert(isinstance(run, Func))
+            result = await run.call_async(store, key)
+            assert(isinstance(result, int))
+            return result
+
+        async def main() -> List[int]:
+            return list(await asyncio.gather(run_guest(2), run_guest(3)))
+
+        self.assertEqual(asyncio.run(main()), [30, 40])
+        # Both guests were suspended on the host at the same time.
+        self.assertEqual(log[:2], [('start', 2), ('start', 3)])
+
+    def test_async_func_exception(self):
+        engine = Engine()
+        linker = Linker(engine)
+
+        async def fail() -> None:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def wrong_results() -> int:
+            return 1
+
+        linker.define_async_func("host", "fail", FuncType([], []), fail)
+        linker.define_async_func("host", "wrong", FuncType([], []), wrong_results)
+        module = Module(engine, """
+            (module
+                (import "host" "fail" (func $fail))
+                (import "host" "wrong" (func $wrong))
+                (func (export "fail") call $fail)
+                (func (export "wrong") call $wrong)
+            )
+        """)
+        store = Store(engine)
+        instance = asyncio.run(linker.instantiate_async(store, module))
+        fail_export = instance.exports(store)["fail"]
+        assert(isinstance(fail_export, Func))
+        with self.assertRaises(ValueError):
+            asyncio.run(fail_export.call_async(store))
+        wrong = instance.exports(store)["wrong"]
+        assert(isinstance(wrong, Func))
+        with self.assertRaises(WasmtimeError):
+            asyncio.run(wrong.call_async(store))
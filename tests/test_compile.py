@@ -0,0 +1,59 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from wasmtime import *
+from wasmtime.component import Component
+from wasmtime.compile import main
+
+
+class TestCompile(unittest.TestCase):
+    def test_compile_directory(self):
+        with tempfile.TemporaryDirectory() as d:
+            src = os.path.join(d, 'src')
+            out = os.path.join(d, 'out')
+            os.makedirs(os.path.join(src, 'nested'))
+            with open(os.path.join(src, 'a.wasm'), 'wb') as f:
+                f.write(wat2wasm('(module (func (export "f")))'))
+            with open(os.path.join(src, 'nested', 'b.wasm'), 'wb') as f:
+                f.write(wat2wasm('(component)'))
+
+            self.assertEqual(main([src, out, '-O', 'speed', '--enable', 'simd', '-j', '2']), 0)
+            with open(os.path.join(out, 'manifest.json')) as f:
+                manifest = json.load(f)
+            artifacts = manifest['artifacts']
+            self.assertEqual([a['source'] for a in artifacts], ['a.wasm', 'nested/b.wasm'])
+            self.assertEqual([a['kind'] for a in artifacts], ['module', 'component'])
+
+            engine = Engine()
+            with Module.deserialize_file(engine, os.path.join(out, 'a.cwasm')) as module:
+                self.assertEqual(len(module.exports), 1)
+            with Component.deserialize_file(engine, os.path.join(out, 'nested', 'b.cwasm')):
+                pass
+
+            with open(os.path.join(src, 'broken.wasm'), 'wb') as f:
+                f.write(b'\0asm\1\0\0\0\xff')
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(main([src, out]), 1)
+            self.assertIn('broken.wasm', stderr.getvalue())
+
+    def test_unknown_feature(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(['src', 'out', '--enable', 'not-a-feature'])
+
+    def test_no_sources(self):
+        with tempfile.TemporaryDirectory() as d:
+            out = os.path.join(d, 'out')
+            with open(os.path.join(d, 'a.txt'), 'w') as f:
+                f.write('not wasm')
+            for src in [os.path.join(d, 'missing'), os.path.join(d, 'a.txt'), d]:
+                with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                    with self.assertRaises(SystemExit) as cm:
+                        main([src, out])
+                self.assertNotEqual(cm.exception.code, 0)
+                self.assertIn(src, stderr.getvalue())
+                self.assertFalse(os.path.exists(out))
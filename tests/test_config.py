@@ -54,6 +54,7 @@ class TestConfig(unittest.TestCase):
 
         config.consume_fuel = True
         config.max_wasm_stack = 1024 * 1024
+        config.async_stack_size = 2 * 1024 * 1024
         config.gc_support = True
         config.native_unwind_info = True
         config.macos_use_mach_ports = True
@@ -90,3 +91,43 @@ class TestConfig(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             config.cache = True
+
+    def test_pooling_allocator(self):
+        pooling = PoolingAllocationConfig()
+        pooling.total_memories = 2
+        pooling.total_tables = 2
+        pooling.total_stacks = 2
+        pooling.total_core_instances = 2
+        pooling.total_component_instances = 2
+        pooling.total_gc_heaps = 2
+        pooling.max_memory_size = 1 << 20
+        pooling.max_core_instance_size = 1 << 20
+        pooling.max_component_instance_size = 1 << 20
+        pooling.max_memories_per_module = 1
+        pooling.max_tables_per_module = 1
+        pooling.max_memories_per_component = 1
+        pooling.max_tables_per_component = 1
+        pooling.max_core_instances_per_component = 1
+        pooling.table_elements = 100
+        pooling.max_unused_warm_slots = 1
+        pooling.decommit_batch_size = 1
+        pooling.linear_memory_keep_resident = 1 << 16
+        pooling.table_keep_resident = 1 << 12
+        pooling.async_stack_keep_resident = 1 << 12
+        with self.assertRaises(TypeError):
+            pooling.total_memories = 'x'
+
+        config = Config()
+        config.allocation_strategy = pooling
+        with self.assertRaises(TypeError):
+            config.allocation_strategy = 'pooling'
+        engine = Engine(config)
+        module = Module(engine, '(module (memory 1))')
+        store = Store(engine)
+        Instance(store, module, [])
+        Instance(store, module, [])
+        # The pool only has room for two instances.
+        with self.assertRaises(WasmtimeError):
+            Instance(store, module, [])
+        with self.assertRaises(WasmtimeError):
+            Instance(Store(engine), Module(engine, '(module (memory 17))'), [])
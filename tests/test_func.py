@@ -1,4 +1,6 @@
+import array
 import unittest
+from typing import Optional
 
 from wasmtime import *
 
@@ -134,6 +136,313 @@ class TestFunc(unittest.TestCase):
         func = Func(store, ty, rev)
         self.assertEqual(func(store, 1, 2, 3.0, 4.0), [4.0, 3.0, 2, 1])
 
+    def test_typed(self):
+        store = Store()
+        i32 = ValType.i32()
+        i64 = ValType.i64()
+        f32 = ValType.f32()
+        f64 = ValType.f64()
+        ty = FuncType([i32, i64, f32, f64], [f64, f32, i64, i32])
+
+        def rev(*args):
+            ret = list(args)
+            ret.reverse()
+            return ret
+
+        func = Func(store, ty, rev).typed(store)
+        self.assertTrue(isinstance(func, TypedFunc))
+        self.assertEqual(func(store, 1, 2, 3.0, 4.0), [4.0, 3.0, 2, 1])
+        self.assertEqual(func(store, 5, Val.i64(6), 7.0, 8.0), [8.0, 7.0, 6, 5])
+
+        add = Func(store, FuncType([i32, i32], [i32]), lambda a, b: a + b)
+        typed = add.typed(store, [i32, i32], [i32])
+        self.assertEqual(typed.func, add)
+        for i in range(100):
+            self.assertEqual(typed(store, i, 1), i + 1)
+        self.assertEqual(typed(store, 0x7fffffff, 1), -0x80000000)
+
+        typed = Func(store, FuncType([], []), lambda: None).typed(store)
+        self.assertEqual(typed(store), None)
+
+        typed = Func(store, FuncType([], [ValType.externref()]), lambda: 'x').typed(store)
+        self.assertEqual(typed(store), 'x')
+
+    def test_typed_reentrant(self):
+        store = Store()
+        module = Module(store.engine, """
+            (module
+                (import "" "host" (func $host (param externref i32) (result externref)))
+                (func (export "f") (param externref i32) (result externref)
+                    (call $host (local.get 0) (local.get 1)))
+            )
+        """)
+        typed: Optional[TypedFunc] = None
+
+        def host(x, depth):
+            if depth > 0:
+                assert(typed is not None)
+                self.assertEqual(typed(store, 'inner', depth - 1), 'inner')
+            return x
+
+        ty = FuncType([ValType.externref(), ValType.i32()], [ValType.externref()])
+        f = Instance(store, module, [Func(store, ty, host)]).exports(store)["f"]
+        assert(isinstance(f, Func))
+        typed = f.typed(store)
+        # Each call must unroot its own reference parameters, even though the
+        # nested call shares the same argument buffer.
+        for _ in range(100):
+            self.assertEqual(typed(store, 'outer', 1), 'outer')
+        store.gc()
+
+    def test_typed_errors(self):
+        store = Store()
+        i32 = ValType.i32()
+        func = Func(store, FuncType([i32], []), lambda a: None)
+        with self.assertRaises(WasmtimeError):
+            func.typed(store, [ValType.i64()], [])
+        with self.assertRaises(WasmtimeError):
+            func.typed(store, [i32], [i32])
+        typed = func.typed(store, [i32], [])
+        with self.assertRaises(WasmtimeError):
+            typed(store)
+        with self.assertRaises(WasmtimeError):
+            typed(store, 1, 2)
+        with self.assertRaises(TypeError):
+            typed(store, 3.0)
+        with self.assertRaises(TypeError):
+            typed(store, Val.i64(3))
+
+        def do_raise(a):
+            raise Exception("hello")
+
+        typed = Func(store, FuncType([i32], []), do_raise).typed(store)
+        with self.assertRaises(Exception, msg="hello"):
+            typed(store, 1)
+
+    def test_call_unchecked(self):
+        store = Store()
+        module = Module(store.engine, """
+            (module
+                (func (export "add") (param i32 i32) (result i32)
+                    local.get 0
+                    local.get 1
+                    i32.add)
+                (func (export "swap") (param i64 f64) (result f64 i64)
+                    local.get 1
+                    local.get 0)
+                (func (export "nop"))
+                (func (export "ref") (param externref) (result externref)
+                    local.get 0)
+            )
+        """)
+        instance = Instance(store, module, [])
+        exports = instance.exports(store)
+
+        add = exports["add"]
+        assert(isinstance(add, Func))
+        typed = add.typed(store)
+        self.assertEqual(typed.call_unchecked(store, 1, 2), 3)
+        self.assertEqual(typed.call_unchecked(store, 0x7fffffff, 1), -0x80000000)
+        with self.assertRaises(WasmtimeError):
+            typed.call_unchecked(store, 1)
+
+        swap = exports["swap"]
+        assert(isinstance(swap, Func))
+        self.assertEqual(swap.typed(store).call_unchecked(store, 1, 2.5), [2.5, 1])
+
+        nop = exports["nop"]
+        assert(isinstance(nop, Func))
+        self.assertEqual(nop.typed(store).call_unchecked(store), None)
+
+        ref = exports["ref"]
+        assert(isinstance(ref, Func))
+        with self.assertRaises(WasmtimeError):
+            ref.typed(store).call_unchecked(store, None)
+
+        host = Func(store, FuncType([ValType.i32()], [ValType.i32()]), lambda a: a * 2)
+        self.assertEqual(host.typed(store).call_unchecked(store, 21), 42)
+
+        # The store must be the one the function was typed with, although a
+        # caller of that store is fine.
+        other = Store()
+        with self.assertRaises(WasmtimeError):
+            typed.call_unchecked(other, 1, 2)
+        with self.assertRaises(WasmtimeError):
+            typed.call_batch(other, [1], [2])
+        double = Func(store, FuncType([], [ValType.i32()]),
+                      lambda caller: typed.call_unchecked(caller, 20, 22), access_caller=True)
+        self.assertEqual(double(store), 42)
+
+    def test_call_batch(self):
+        store = Store()
+        module = Module(store.engine, """
+            (module
+                (func (export "add") (param i32 i32) (result i32)
+                    local.get 0
+                    local.get 1
+                    i32.add)
+                (func (export "divmod") (param i64 i64) (result i64 i64)
+                    (i64.div_s (local.get 0) (local.get 1))
+                    (i64.rem_s (local.get 0) (local.get 1)))
+                (func (export "scale") (param f64 f32))
+            )
+        """)
+        exports = Instance(store, module, []).exports(store)
+        add = exports["add"]
+        assert(isinstance(add, Func))
+
+        a = array.array('i', range(100))
+        b = array.array('i', [1] * 100)
+        out = add.call_batch(store, a, b)
+        self.assertTrue(isinstance(out, array.array))
+        self.assertEqual(out.typecode, 'i')
+        self.assertEqual(list(out), list(range(1, 101)))
+
+        out = add.typed(store).call_batch(store, memoryview(a)[10:20], [2] * 10)
+        self.assertEqual(list(out), list(range(12, 22)))
+
+        out = add.call_batch(store, array.array('i'), [])
+        self.assertEqual(len(out), 0)
+
+        # Enough rows to need several chunks, with columns that are strided,
+        # unsigned, or need converting.
+        n = 5000
+        a = array.array('i', range(2 * n))
+        b = array.array('I', [2 ** 32 - 1] * n)
+        out = add.call_batch(store, memoryview(a)[::2], b)
+        self.assertEqual(list(out), [i - 1 for i in range(0, 2 * n, 2)])
+        out = add.call_batch(store, array.array('h', [1] * n), range(n))
+        self.assertEqual(list(out), list(range(1, n + 1)))
+
+        divmod = exports["divmod"]
+        assert(isinstance(divmod, Func))
+        q, r = divmod.call_batch(store, array.array('q', [7, 9, -7]), array.array('q', [2, 3, 2]))
+        self.assertEqual(q.typecode, 'q')
+        self.assertEqual(list(q), [3, 3, -3])
+        self.assertEqual(list(r), [1, 0, -1])
+        with self.assertRaises(Trap):
+            divmod.call_batch(store, [1, 2], [1, 0])
+
+        scale = exports["scale"]
+        assert(isinstance(scale, Func))
+        self.assertEqual(scale.call_batch(store, [1.0, 2.0], array.array('f', [1.0, 2.0])), None)
+
+        # Functions without parameters are given the number of rows instead.
+        counter = Global(store, GlobalType(ValType.i32(), True), Val.i32(0))
+        module = Module(store.engine, """
+            (module
+                (global $g (import "" "g") (mut i32))
+                (func (export "next") (result i32)
+                    (global.set $g (i32.add (global.get $g) (i32.const 1)))
+                    global.get $g)
+                (func (export "bump")
+                    (global.set $g (i32.add (global.get $g) (i32.const 1))))
+            )
+        """)
+        counters = Instance(store, module, [counter]).exports(store)
+        count = counters["next"]
+        bump = counters["bump"]
+        assert(isinstance(count, Func))
+        assert(isinstance(bump, Func))
+        self.assertEqual(list(count.call_batch(store, rows=3)), [1, 2, 3])
+        self.assertEqual(len(count.typed(store).call_batch(store, rows=0)), 0)
+        self.assertEqual(bump.call_batch(store, rows=n), None)
+        self.assertEqual(counter.value(store), n + 3)
+        self.assertEqual(list(add.call_batch(store, [1, 2], [3, 4], rows=2)), [4, 6])
+        with self.assertRaises(ValueError):
+            count.call_batch(store)
+        with self.assertRaises(ValueError):
+            count.call_batch(store, rows=-1)
+        with self.assertRaises(WasmtimeError):
+            add.call_batch(store, [1, 2], [3, 4], rows=3)
+
+        with self.assertRaises(WasmtimeError):
+            add.call_batch(store, a)
+        with self.assertRaises(WasmtimeError):
+            add.call_batch(store, a, [1])
+        with self.assertRaises(WasmtimeError):
+            add.call_batch(store, memoryview(bytearray(4)).cast('B', (2, 2)), [1, 2])
+
+        ref = Func(store, FuncType([ValType.externref()], []), lambda x: None)
+        with self.assertRaises(WasmtimeError):
+            ref.call_batch(store, [None])
+
+    def test_unchecked_host(self):
+        store = Store()
+        i32 = ValType.i32()
+        i64 = ValType.i64()
+        f32 = ValType.f32()
+        f64 = ValType.f64()
+        ty = FuncType([i32, i64, f32, f64], [f64, f32, i64, i32])
+
+        def rev(*args):
+            ret = list(args)
+            ret.reverse()
+            return ret
+
+        func = Func(store, ty, rev, unchecked=True)
+        self.assertEqual(func(store, 1, 2, 3.0, 4.0), [4.0, 3.0, 2, 1])
+
+        func = Func(store, FuncType([], []), lambda: None, unchecked=True)
+        self.assertEqual(func(store), None)
+
+        func = Func(store, FuncType([i32, i32], [i32]), lambda a, b: a + b, unchecked=True)
+        self.assertEqual(func(store, 1, 2), 3)
+        self.assertEqual(func.typed(store).call_unchecked(store, 3, 4), 7)
+
+        module = Module(store.engine, """
+            (module
+                (import "" "" (func $add (param i32 i32) (result i32)))
+                (memory (export "mem") 1)
+                (func (export "run") (param i32) (result i32)
+                    local.get 0
+                    i32.const 1
+                    call $add)
+            )
+        """)
+        instance = Instance(store, module, [func])
+        run = instance.exports(store)["run"]
+        assert(isinstance(run, Func))
+        self.assertEqual(run(store, 41), 42)
+
+        def with_caller(caller, a, b):
+            mem = caller["mem"]
+            self.assertTrue(isinstance(mem, Memory))
+            return a - b
+
+        func = Func(store, FuncType([i32, i32], [i32]), with_caller, access_caller=True, unchecked=True)
+        instance = Instance(store, module, [func])
+        run = instance.exports(store)["run"]
+        assert(isinstance(run, Func))
+        self.assertEqual(run(store, 43), 42)
+
+    def test_unchecked_host_errors(self):
+        store = Store()
+        with self.assertRaises(WasmtimeError):
+            Func(store, FuncType([ValType.externref()], []), lambda a: None, unchecked=True)
+        with self.assertRaises(WasmtimeError):
+            Func(store, FuncType([], [ValType.funcref()]), lambda: None, unchecked=True)
+
+        func = Func(store, FuncType([], []), lambda: 1, unchecked=True)
+        with self.assertRaises(WasmtimeError, msg="produced results"):
+            func(store)
+
+        ty = FuncType([], [ValType.i32(), ValType.i32()])
+        func = Func(store, ty, lambda: [1, 2, 3], unchecked=True)
+        with self.assertRaises(WasmtimeError, msg="wrong number of results"):
+            func(store)
+
+        func = Func(store, FuncType([], [ValType.i32()]), lambda: 1.0, unchecked=True)
+        with self.assertRaises(Exception):
+            func(store)
+
+        def do_raise():
+            raise KeyboardInterrupt
+
+        func = Func(store, FuncType([], []), do_raise, unchecked=True)
+        with self.assertRaises(KeyboardInterrupt):
+            func(store)
+
     def test_access_caller(self):
         # Test that we get *something*
         store = Store()
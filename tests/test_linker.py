@@ -160,6 +160,30 @@ class TestLinker(unittest.TestCase):
         linker.instantiate(Store(engine), module)
         assert(called['hits'] == 2)
 
+    def test_define_func_unchecked(self):
+        engine = Engine()
+        linker = Linker(engine)
+        ty = FuncType([ValType.i64(), ValType.f64()], [ValType.f64()])
+        linker.define_func('a', 'b', ty, lambda a, b: a * b, unchecked=True)
+        module = Module(engine, """
+            (module
+                (import "a" "b" (func $b (param i64 f64) (result f64)))
+                (func (export "run") (param i64 f64) (result f64)
+                    local.get 0
+                    local.get 1
+                    call $b)
+            )
+        """)
+        for _ in range(2):
+            store = Store(engine)
+            instance = linker.instantiate(store, module)
+            run = instance.exports(store)["run"]
+            assert(isinstance(run, Func))
+            self.assertEqual(run(store, 3, 1.5), 4.5)
+
+        with self.assertRaises(WasmtimeError):
+            linker.define_func('a', 'c', FuncType([ValType.externref()], []), lambda a: None, unchecked=True)
+
     def test_define_unknown_imports_as_traps(self):
         engine = Engine()
         linker = Linker(engine)
@@ -1,3 +1,5 @@
+import array
+import struct
 import unittest
 
 from wasmtime import *
@@ -105,6 +107,170 @@ class TestMemory(unittest.TestCase):
         out = memory.read(store, -ba_size)
         self.assertEqual(ba, out)
 
+    def test_view(self):
+        store = Store()
+        memory = Memory(store, MemoryType(Limits(1, None)))
+        view = memory.view(store)
+        self.assertTrue(view.valid)
+        self.assertEqual(len(view), 65536)
+        view[10] = 42
+        view[20:23] = b'abc'
+        self.assertEqual(memory.read(store, 10, 11), bytearray([42]))
+        self.assertEqual(memory.read(store, 20, 23), bytearray(b'abc'))
+        memory.write(store, b'xyz', 100)
+        self.assertEqual(view[100], ord('x'))
+        self.assertEqual(bytes(view[100:103]), b'xyz')
+        self.assertEqual(view.tobytes()[100:103], b'xyz')
+
+        memory.grow(store, 1)
+        self.assertFalse(view.valid)
+        with self.assertRaises(WasmtimeError):
+            view[0]
+        with self.assertRaises(WasmtimeError):
+            len(view)
+
+        with memory.view(store) as view:
+            self.assertEqual(len(view), 65536 * 2)
+            self.assertEqual(view[100], ord('x'))
+        self.assertFalse(view.valid)
+        with self.assertRaises(ValueError):
+            view[0]
+
+    def test_read_into_write_from(self):
+        store = Store()
+        memory = Memory(store, MemoryType(Limits(1, None)))
+        self.assertEqual(memory.write_from(store, b'hello', 10), 5)
+        self.assertEqual(memory.write_from(store, memoryview(b'world'), 15), 5)
+        self.assertEqual(memory.write_from(store, array.array('i', [1, 2]), 20), 8)
+        self.assertEqual(memory.read(store, 10, 28), bytearray(b'helloworld\x01\0\0\0\x02\0\0\0'))
+
+        dest = bytearray(10)
+        self.assertEqual(memory.read_into(store, dest, 10), 10)
+        self.assertEqual(dest, bytearray(b'helloworld'))
+        ints = array.array('i', [0, 0])
+        self.assertEqual(memory.read_into(store, ints, 20), 8)
+        self.assertEqual(list(ints), [1, 2])
+        view = memoryview(dest)[2:4]
+        memory.read_into(store, view, 20)
+        self.assertEqual(dest, bytearray(b'he\x01\0oworld'))
+        self.assertEqual(memory.read_into(store, bytearray(0), 65536), 0)
+        self.assertEqual(memory.write(store, [7, 8], 30), 2)
+        self.assertEqual(memory.write(store, memoryview(b'ab'), 32), 2)
+        self.assertEqual(memory.read(store, 30, 34), bytearray(b'\x07\x08ab'))
+
+        with self.assertRaises(TypeError):
+            memory.read_into(store, b'readonly', 0)
+        with self.assertRaises(TypeError):
+            memory.read_into(store, memoryview(dest)[::2], 0)
+        with self.assertRaises(IndexError):
+            memory.read_into(store, bytearray(2), 65535)
+        with self.assertRaises(IndexError):
+            memory.write_from(store, b'ab', 65535)
+        with self.assertRaises(IndexError):
+            memory.write_from(store, b'ab', -1)
+
+    def test_readv_writev(self):
+        store = Store()
+        memory = Memory(store, MemoryType(Limits(1, None)))
+        memory.write(store, b'hello world', 100)
+        memory.write(store, struct.pack('<IIII', 106, 5, 100, 5), 0)
+        self.assertEqual(memory.readv(store, 0, 2), bytearray(b'worldhello'))
+        self.assertEqual(memory.readv(store, [(100, 5), (105, 1)]), bytearray(b'hello '))
+        self.assertEqual(memory.readv(store, []), bytearray())
+
+        self.assertEqual(memory.writev(store, 0, b'WORLDHEL', 2), 8)
+        self.assertEqual(memory.read(store, 100, 111), bytearray(b'HELlo WORLD'))
+        self.assertEqual(memory.writev(store, [(200, 2), (300, 3)], [b'ab', bytearray(b'cd')]), 4)
+        self.assertEqual(memory.read(store, 200, 202), bytearray(b'ab'))
+        self.assertEqual(memory.read(store, 300, 303), bytearray(b'cd\0'))
+
+        with self.assertRaises(TypeError):
+            memory.readv(store, 0)
+        with self.assertRaises(IndexError):
+            memory.readv(store, 65535, 1)
+        with self.assertRaises(IndexError):
+            memory.readv(store, [(0, 1), (65535, 2)])
+        with self.assertRaises(IndexError):
+            memory.writev(store, [(200, 1)], [b'xy'])
+        with self.assertRaises(ValueError):
+            memory.writev(store, [(200, 1)], [b'x', b'y'])
+        # Nothing is written if any segment is invalid.
+        with self.assertRaises(IndexError):
+            memory.writev(store, [(200, 2), (65535, 2)], b'zzzz')
+        self.assertEqual(memory.read(store, 200, 202), bytearray(b'ab'))
+
+    def test_typed_views(self):
+        store = Store()
+        memory = Memory(store, MemoryType(Limits(1, None)))
+        memory.write(store, struct.pack('<3f', 1.5, 2.5, 3.5), 4)
+        floats = memory.array(store, 4, 'f', 3)
+        self.assertEqual(floats.tolist(), [1.5, 2.5, 3.5])
+        floats[1] = 9.0
+        self.assertEqual(memory.read(store, 8, 12), bytearray(struct.pack('<f', 9.0)))
+        memory.write(store, struct.pack('<q', -2), 20)
+        self.assertEqual(memory.array(store, 20, 'q', 1)[0], -2)
+        self.assertEqual(len(memory.array(store, 0, 'i', 0)), 0)
+
+        self.assertEqual(memory.struct(store, 4, 'fff'), (1.5, 9.0, 3.5))
+        self.assertEqual(memory.struct(store, 4, struct.Struct('<f'), 3), [(1.5,), (9.0,), (3.5,)])
+        self.assertEqual(memory.struct(store, 4, 'fB', 0), [])
+        memory.write(store, b'\x01\x02\x00\x00\x00', 100)
+        self.assertEqual(memory.struct(store, 100, 'BI'), (1, 2))
+
+        with self.assertRaises(IndexError):
+            memory.array(store, 65532, 'q', 1)
+        with self.assertRaises(IndexError):
+            memory.struct(store, 65532, 'I', 2)
+        with self.assertRaises(TypeError):
+            memory.array(store, 0, 'x', 1)  # type: ignore
+        with self.assertRaises(TypeError):
+            memory.array(store, 0, 'l', 1)  # type: ignore
+
+    def test_snapshot_restore(self):
+        store = Store()
+        module = Module(store.engine, """
+            (module
+                (memory (export "memory") 2)
+                (global $g (export "g") (mut i32) (i32.const 1))
+                (global (export "c") i32 (i32.const 2))
+                (func (export "run") (param i32)
+                    (i32.store (local.get 0) (i32.const 0xdeadbeef))
+                    (global.set $g (i32.add (global.get $g) (i32.const 1))))
+            )
+        """)
+        exports = Instance(store, module, []).exports(store)
+        memory = exports["memory"]
+        g = exports["g"]
+        c = exports["c"]
+        run = exports["run"]
+        assert(isinstance(memory, Memory))
+        assert(isinstance(g, Global))
+        assert(isinstance(c, Global))
+        assert(isinstance(run, Func))
+
+        memory.write(store, b'hello', 10)
+        snapshot = memory.snapshot(store, [g, c])
+        self.assertEqual(len(snapshot), 65536 * 2)
+        self.assertEqual(memory.restore(store, snapshot), 0)
+
+        run(store, 100000)
+        self.assertEqual(g.value(store), 2)
+        self.assertEqual(memory.restore(store, snapshot), 1)
+        self.assertEqual(g.value(store), 1)
+        self.assertEqual(memory.read(store, 100000, 100004), bytearray(4))
+        self.assertEqual(memory.read(store, 10, 15), bytearray(b'hello'))
+
+        memory.grow(store, 1)
+        run(store, 65536 * 2 + 4)
+        run(store, 0)
+        self.assertEqual(memory.restore(store, snapshot), 2)
+        self.assertEqual(memory.read(store, 0, 4), bytearray(4))
+        self.assertEqual(memory.read(store, 65536 * 2, 65536 * 3), bytearray(65536))
+
+        other = Memory(store, MemoryType(Limits(1, None)))
+        with self.assertRaises(WasmtimeError):
+            other.restore(store, snapshot)
+
     def test_page_size_default(self):
         store = Store()
         ty = MemoryType(Limits(1, None))
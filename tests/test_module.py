@@ -1,5 +1,9 @@
 import unittest
+import mmap
+import os
+import pathlib
 import tempfile
+from typing import List, Union
 
 from wasmtime import *
 
@@ -118,6 +122,10 @@ class TestModule(unittest.TestCase):
         module = Module.deserialize(engine, encoded)
         assert(len(module.imports) == 0)
         assert(len(module.exports) == 0)
+        for buf in [bytes(encoded), memoryview(encoded), memoryview(bytes(encoded))]:
+            assert(len(Module.deserialize(engine, buf).exports) == 0)
+        with self.assertRaises(TypeError):
+            Module.deserialize(engine, 1)
         with tempfile.TemporaryDirectory() as d:
             path = d + '/module.bin'
             with open(path, 'wb') as f:
@@ -128,3 +136,37 @@ class TestModule(unittest.TestCase):
             with Module.deserialize_file(engine, path) as module:
                 assert(len(module.imports) == 0)
                 assert(len(module.exports) == 0)
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    with Module.deserialize(engine, m) as module:
+                        assert(len(module.exports) == 0)
+
+    def test_compile_many(self):
+        engine = Engine()
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'module.wat'
+            path.write_text('(module (func (export "f")))')
+            sources: List[Union[str, bytes, os.PathLike]] = [
+                '(module (memory 1))',
+                b'\0asm\1\0\0\0',
+                '(module',
+                path,
+                pathlib.Path(d) / 'missing.wasm',
+            ]
+            results = Module.compile_many(engine, sources, max_workers=2)
+            self.assertEqual(len(results), 5)
+            assert(isinstance(results[0].value, Module))
+            assert(isinstance(results[1].value, Module))
+            assert(isinstance(results[2].error, WasmtimeError))
+            self.assertIsNone(results[2].value)
+            assert(isinstance(results[3].value, Module))
+            self.assertEqual(len(results[3].value.exports), 1)
+            assert(isinstance(results[4].error, OSError))
+
+            cache = ModuleCache(pathlib.Path(d) / 'cache')
+            results = Module.compile_many(engine, sources[:2], cache=cache)
+            self.assertIsNone(results[0].error)
+            self.assertEqual(len(os.listdir(cache.directory)), 2)
+            for result in results:
+                assert(result.value is not None)
+                result.value.close()
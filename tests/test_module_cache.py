@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from wasmtime import *
+
+WAT = '(module (func (export "f") (result i32) i32.const 42))'
+
+
+class TestModuleCache(unittest.TestCase):
+    def test_load(self):
+        engine = Engine()
+        with tempfile.TemporaryDirectory() as d:
+            cache = ModuleCache(d)
+            path = cache.path(engine, WAT)
+            self.assertFalse(os.path.exists(path))
+            with cache.load(engine, WAT) as module:
+                self.assertEqual(len(module.exports), 1)
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(cache.size(), os.path.getsize(path))
+
+            # Run the destructor for `Module` which has an mmap to the file
+            # which prevents deletion on Windows.
+            with cache.load(engine, WAT) as module:
+                self.assertEqual(len(module.exports), 1)
+            self.assertEqual(len(os.listdir(d)), 1)
+
+            # Different configurations don't share artifacts.
+            config = Config()
+            config.cranelift_opt_level = 'none'
+            self.assertNotEqual(cache.path(Engine(config), WAT), path)
+            self.assertEqual(cache.path(Engine(), WAT), path)
+            self.assertNotEqual(cache.path(engine, WAT, component=True), path)
+
+            # Corrupt artifacts are recompiled.
+            with open(path, 'wb') as f:
+                f.write(b'not an artifact')
+            with cache.load(engine, WAT) as module:
+                self.assertEqual(len(module.exports), 1)
+
+            cache.clear()
+            self.assertEqual(cache.size(), 0)
+
+    def test_evict(self):
+        engine = Engine()
+        with tempfile.TemporaryDirectory() as d:
+            cache = ModuleCache(d)
+            for i in range(3):
+                cache.load(engine, '(module (func (export "f%d")))' % i).close()
+            size = cache.size()
+            self.assertEqual(cache.evict(), 0)
+            self.assertEqual(cache.evict(size - 1), 1)
+            self.assertEqual(len(os.listdir(d)), 2)
+            self.assertEqual(cache.evict(0), 2)
+            self.assertEqual(cache.size(), 0)
+
+            cache = ModuleCache(d, max_size=0)
+            cache.load(engine, WAT).close()
+            self.assertEqual(cache.size(), 0)
+
+    def test_component(self):
+        engine = Engine()
+        with tempfile.TemporaryDirectory() as d:
+            cache = ModuleCache(d)
+            with cache.load_component(engine, '(component)'):
+                pass
+            with cache.load_component(engine, '(component)'):
+                pass
+            self.assertEqual(len(os.listdir(d)), 1)
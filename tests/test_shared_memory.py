@@ -1,10 +1,14 @@
+import threading
+import time
 import unittest
+from typing import List, Union
 
 from wasmtime import *
 
 def engine_with_shared_memory() -> Engine:
     config = Config()
     config.shared_memory = True
+    config.wasm_threads = True
     return Engine(config)
 
 class TestSharedMemory(unittest.TestCase):
@@ -58,3 +62,71 @@ class TestSharedMemory(unittest.TestCase):
         ty = MemoryType(Limits(1, 2))
         with self.assertRaises(WasmtimeError):
             SharedMemory(engine, ty)
+
+    def test_read_write(self):
+        engine = engine_with_shared_memory()
+        shared_memory = SharedMemory(engine, MemoryType(Limits(1, 2), shared=True))
+        self.assertEqual(shared_memory.size(), 1)
+        self.assertEqual(shared_memory.write(b'hello', 10), 5)
+        self.assertEqual(shared_memory.read(10, 15), bytearray(b'hello'))
+        self.assertEqual(len(shared_memory.read(-10)), 10)
+        dest = bytearray(5)
+        self.assertEqual(shared_memory.read_into(dest, 10), 5)
+        self.assertEqual(dest, bytearray(b'hello'))
+        self.assertEqual(shared_memory.write_from(memoryview(b'world'), 15), 5)
+
+        view = shared_memory.view()
+        self.assertEqual(len(view), 65536)
+        self.assertEqual(bytes(view[10:20]), b'helloworld')
+        view[0] = 7
+        self.assertEqual(shared_memory.data_ptr()[0], 7)
+        shared_memory.grow(1)
+        self.assertEqual(bytes(view[10:20]), b'helloworld')
+
+        with self.assertRaises(IndexError):
+            shared_memory.write(b'ab', 65536 * 2 - 1)
+        with self.assertRaises(IndexError):
+            shared_memory.read_into(bytearray(2), 65536 * 2 - 1)
+
+    def test_atomics(self):
+        engine = engine_with_shared_memory()
+        shared_memory = SharedMemory(engine, MemoryType(Limits(1, 1), shared=True))
+        atomics = SharedMemoryAtomics(engine, shared_memory)
+        atomics.store(0, 5)
+        self.assertEqual(atomics.load(0), 5)
+        self.assertEqual(atomics.add(0, 2), 5)
+        self.assertEqual(atomics.compare_exchange(0, 7, 10), 7)
+        self.assertEqual(atomics.compare_exchange(0, 7, 11), 10)
+        self.assertEqual(atomics.load(0), 10)
+        atomics.store(8, 1 << 40, width=64)
+        self.assertEqual(atomics.load(8, width=64), 1 << 40)
+        self.assertEqual(shared_memory.read(8, 16), bytearray((1 << 40).to_bytes(8, 'little')))
+
+        with self.assertRaises(Trap):
+            atomics.load(1)
+        with self.assertRaises(WasmtimeError):
+            atomics.load(0, width=16)
+
+        self.assertEqual(atomics.wait(0, 0), 'not-equal')
+        self.assertEqual(atomics.wait(0, 10, timeout=0.001), 'timed-out')
+        self.assertEqual(atomics.notify(0), 0)
+
+    def test_wait_notify(self):
+        engine = engine_with_shared_memory()
+        shared_memory = SharedMemory(engine, MemoryType(Limits(1, 1), shared=True))
+        atomics = SharedMemoryAtomics(engine, shared_memory)
+        results: List[Union[str, int]] = []
+
+        def waiter():
+            results.append(atomics.wait(16, 0, timeout=10))
+            results.append(atomics.load(20))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        atomics.store(20, 42)
+        woken = 0
+        while woken == 0 and thread.is_alive():
+            woken = atomics.notify(16)
+            time.sleep(0.001)
+        thread.join()
+        self.assertEqual(results, ['ok', 42])
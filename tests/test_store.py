@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from wasmtime import *
@@ -58,6 +59,166 @@ class TestStore(unittest.TestCase):
             Instance(store, module, [hit, interrupt])
         self.assertTrue(was_hit)
 
+    def test_deadline(self):
+        config = Config()
+        config.epoch_interruption = True
+        engine = Engine(config)
+        store = Store(engine)
+        with self.assertRaises(WasmtimeError):
+            with store.deadline(1):
+                pass
+
+        engine.start_epoch_timer(0.01)
+        self.assertEqual(engine.epoch_timer_interval, 0.01)
+        with self.assertRaises(WasmtimeError):
+            engine.start_epoch_timer(0.01)
+        module = Module(engine, """
+            (module
+                (func (export "spin") (loop br 0))
+                (func (export "nop"))
+            )
+        """)
+        exports = Instance(store, module, []).exports(store)
+        spin = exports["spin"]
+        nop = exports["nop"]
+        assert(isinstance(spin, Func))
+        assert(isinstance(nop, Func))
+
+        with store.deadline(10):
+            nop(store)
+        with self.assertRaises(Trap):
+            with store.deadline(0.05):
+                spin(store)
+        with self.assertRaises(Trap):
+            spin(store, timeout=0.05)
+        with store.deadline(10):
+            with self.assertRaises(Trap):
+                with store.deadline(0.05):
+                    spin(store)
+            nop(store)
+        # Leaving the outermost deadline restores wasmtime's default of an
+        # expired deadline, so epoch interruption stays in effect.
+        with self.assertRaises(Trap):
+            nop(store)
+
+        # A deadline set by the caller still applies within `deadline`, and
+        # is restored rather than removed on exit.
+        store.set_epoch_deadline(1)
+        time.sleep(0.05)
+        with self.assertRaises(Trap):
+            with store.deadline(10):
+                spin(store)
+        start = time.monotonic()
+        with self.assertRaises(Trap):
+            spin(store, timeout=10)
+        self.assertLess(time.monotonic() - start, 5)
+        store.set_epoch_deadline(1 << 40)
+
+        engine.stop_epoch_timer()
+        self.assertIsNone(engine.epoch_timer_interval)
+        with self.assertRaises(WasmtimeError):
+            nop(store, timeout=1)
+        engine.start_epoch_timer(0.01)
+        engine.close()
+
+    def test_epoch_deadline_callback(self):
+        config = Config()
+        config.epoch_interruption = True
+        engine = Engine(config)
+        store = Store(engine)
+        module = Module(engine, """
+            (module
+                (import "" "tick" (func $tick))
+                (func (export "run") (param i32)
+                    (loop
+                        call $tick
+                        (local.tee 0 (i32.sub (local.get 0) (i32.const 1)))
+                        br_if 0))
+            )
+        """)
+        tick = Func(store, FuncType([], []), engine.increment_epoch)
+        run = Instance(store, module, [tick]).exports(store)["run"]
+        assert(isinstance(run, Func))
+
+        calls = []
+
+        def extend(context: StoreContext):
+            calls.append(context)
+            return 1
+
+        store.set_epoch_deadline_callback(extend)
+        store.set_epoch_deadline(1)
+        run(store, 5)
+        # The epoch is checked on entry and on each loop back-edge. Every
+        # iteration ticks once, and the final iteration exits without taking
+        # the back-edge, so five iterations reach the deadline four times.
+        self.assertEqual(len(calls), 4)
+
+        store.set_epoch_deadline_callback(lambda context: UpdateDeadline.continue_(2))
+        store.set_epoch_deadline(1)
+        run(store, 5)
+
+        def fail(context: StoreContext):
+            raise ValueError("stop")
+
+        store.set_epoch_deadline_callback(fail)
+        store.set_epoch_deadline(1)
+        with self.assertRaises(ValueError):
+            run(store, 5)
+
+    def test_epoch_deadline_callback_with_deadline(self):
+        config = Config()
+        config.epoch_interruption = True
+        engine = Engine(config)
+        engine.start_epoch_timer(0.01)
+        store = Store(engine)
+        module = Module(engine, """
+            (module
+                (func (export "spin") (loop br 0))
+                (func (export "nop"))
+            )
+        """)
+        store.set_epoch_deadline(1 << 40)
+        exports = Instance(store, module, []).exports(store)
+        spin = exports["spin"]
+        nop = exports["nop"]
+        assert(isinstance(spin, Func))
+        assert(isinstance(nop, Func))
+
+        calls = []
+
+        def extend(context: StoreContext) -> int:
+            calls.append(context)
+            if len(calls) > 100:
+                raise ValueError("extended too often")
+            return 1
+
+        # The callback would keep extending the deadline, but `deadline`
+        # traps once its own deadline is reached.
+        store.set_epoch_deadline_callback(extend)
+        with self.assertRaises(Trap):
+            with store.deadline(0.1):
+                spin(store)
+        with self.assertRaises(Trap):
+            spin(store, timeout=0.1)
+        self.assertEqual(len(calls), 0)
+
+        # A deadline set by the caller which is reached first is still
+        # extended by the callback, up to that of `deadline`.
+        store.set_epoch_deadline(1)
+        with self.assertRaises(Trap):
+            with store.deadline(0.1):
+                spin(store)
+        self.assertGreater(len(calls), 0)
+        self.assertLessEqual(len(calls), 100)
+
+        # Outside of `deadline` the callback is in charge again.
+        calls.clear()
+        store.set_epoch_deadline(0)
+        nop(store)
+        self.assertEqual(len(calls), 1)
+        engine.stop_epoch_timer()
+
     def test_fuel(self):
         store = Store()
 
@@ -0,0 +1,84 @@
+import unittest
+
+from wasmtime import *
+
+COUNTER_WAT = """
+    (module
+        (memory (export "memory") 1 4)
+        (global $calls (export "calls") (mut i32) (i32.const 0))
+        (func (export "bump") (result i32)
+            (i32.store (i32.const 0) (i32.add (i32.load (i32.const 0)) (i32.const 1)))
+            (global.set $calls (i32.add (global.get $calls) (i32.const 1)))
+            (i32.load (i32.const 0)))
+        (func (export "grow") (result i32)
+            (memory.grow (i32.const 2)))
+        (func (export "fail")
+            unreachable)
+    )
+"""
+
+
+class TestStorePool(unittest.TestCase):
+    def setUp(self):
+        self.engine = Engine()
+        module = Module(self.engine, COUNTER_WAT)
+        self.pre = Linker(self.engine).instantiate_pre(module)
+
+    def call(self, entry: PooledStore, name: str):
+        func = entry.instance.exports(entry.store)[name]
+        assert(isinstance(func, Func))
+        return func(entry.store)
+
+    def test_reuse_and_reset(self):
+        pool = StorePool(self.engine, self.pre, size=2)
+        with pool.checkout() as entry:
+            self.assertEqual(self.call(entry, "bump"), 1)
+            self.assertEqual(self.call(entry, "bump"), 2)
+            store = entry.store
+        self.assertEqual(pool.idle(), 1)
+
+        with pool.checkout() as entry:
+            self.assertIs(entry.store, store)
+            self.assertEqual(self.call(entry, "bump"), 1)
+            calls = entry.instance.exports(entry.store)["calls"]
+            assert(isinstance(calls, Global))
+            self.assertEqual(calls.value(entry.store), 1)
+
+    def test_discard(self):
+        pool = StorePool(self.engine, self.pre)
+        with self.assertRaises(Trap):
+            with pool.checkout() as entry:
+                self.call(entry, "fail")
+        self.assertEqual(pool.idle(), 0)
+
+        pool = StorePool(self.engine, self.pre, max_memory=65536)
+        with pool.checkout() as entry:
+            self.call(entry, "grow")
+        self.assertEqual(pool.idle(), 0)
+        entry = pool.checkout()
+        entry.release()
+        entry.release()
+        self.assertEqual(pool.idle(), 1)
+
+    def test_lru_eviction(self):
+        pool = StorePool(self.engine, self.pre, size=2)
+        entries = [pool.checkout() for _ in range(3)]
+        for entry in entries:
+            entry.release()
+        self.assertEqual(pool.idle(), 2)
+        self.assertIs(pool.checkout().store, entries[2].store)
+        self.assertIs(pool.checkout().store, entries[1].store)
+        pool.clear()
+        self.assertEqual(pool.idle(), 0)
+
+    def test_fuel(self):
+        config = Config()
+        config.consume_fuel = True
+        engine = Engine(config)
+        pre = Linker(engine).instantiate_pre(Module(engine, COUNTER_WAT))
+        pool = StorePool(engine, pre, fuel=1000)
+        with pool.checkout() as entry:
+            self.call(entry, "bump")
+            self.assertLess(entry.store.get_fuel(), 1000)
+        with pool.checkout() as entry:
+            self.assertEqual(entry.store.get_fuel(), 1000)
@@ -0,0 +1,221 @@
+import struct
+import threading
+import unittest
+from typing import Callable, List, Union
+
+from wasmtime import *
+from wasmtime._slab import Slab
+
+
+THREADS = 8
+
+
+def run_threads(target: Callable[[int], None]) -> None:
+    errors: List[BaseException] = []
+    barrier = threading.Barrier(THREADS)
+
+    def run(i: int) -> None:
+        try:
+            barrier.wait()
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+class ThreadError(Exception):
+    pass
+
+
+class TestThreads(unittest.TestCase):
+    def test_slab(self):
+        slab: Slab[int] = Slab()
+
+        def churn(i: int) -> None:
+            for j in range(1000):
+                idx = slab.allocate(i * 1000 + j)
+                assert(slab.get(idx) == i * 1000 + j)
+                slab.deallocate(idx)
+
+        run_threads(churn)
+        # Every slot was freed, so the free list should hand out each slot
+        # exactly once.
+        size = len(slab.list)
+        self.assertEqual(sorted(slab.allocate(0) for _ in range(size)), list(range(size)))
+
+    def test_slab_reentrant_deallocate(self):
+        # Finalizers may deallocate in the middle of an allocation, for
+        # example when growing the slab triggers a garbage collection.
+        slab: Slab[str] = Slab()
+        first = slab.allocate('a')
+        slab.allocate('b')
+
+        class Reentrant(List[Union[int, str]]):
+            def append(self, val: Union[int, str]) -> None:
+                slab.deallocate(first)
+                super().append(val)
+
+        slab.list = Reentrant(slab.list)
+        idx = slab.allocate('c')
+        self.assertEqual(idx, 2)
+        self.assertEqual(slab.get(idx), 'c')
+        self.assertEqual(slab.allocate('d'), first)
+        self.assertEqual(len(slab.list), 3)
+
+    def test_exceptions_stay_on_their_thread(self):
+        engine = Engine()
+        module = Module(engine, """
+            (module
+                (import "" "" (func $host (param i32) (result i32)))
+                (func (export "run") (param i32) (result i32)
+                    local.get 0
+                    call $host)
+            )
+        """)
+
+        def run(i: int) -> None:
+            store = Store(engine)
+
+            def host(x: int) -> int:
+                if x % 2 == 1:
+                    raise ThreadError(i, x)
+                return x
+
+            func = Func(store, FuncType([ValType.i32()], [ValType.i32()]), host)
+            instance = Instance(store, module, [func])
+            export = instance.exports(store)["run"]
+            assert(isinstance(export, Func))
+            for x in range(200):
+                if x % 2 == 1:
+                    try:
+                        export(store, x)
+                    except ThreadError as e:
+                        assert(e.args == (i, x))
+                    else:
+                        raise AssertionError("expected an exception")
+                else:
+                    assert(export(store, x) == x)
+
+        run_threads(run)
+
+    def test_linker_funcs(self):
+        engine = Engine()
+        linker = Linker(engine)
+
+        def host(x: int) -> int:
+            if x < 0:
+                raise ThreadError(x)
+            return x + 1
+
+        linker.define_func("", "", FuncType([ValType.i32()], [ValType.i32()]), host)
+        module = Module(engine, """
+            (module
+                (import "" "" (func $host (param i32) (result i32)))
+                (func (export "run") (param i32) (result i32)
+                    local.get 0
+                    call $host)
+            )
+        """)
+        pre = linker.instantiate_pre(module)
+
+        def run(i: int) -> None:
+            for _ in range(50):
+                store = Store(engine)
+                instance = pre.instantiate(store)
+                export = instance.exports(store)["run"]
+                assert(isinstance(export, Func))
+                assert(export(store, i) == i + 1)
+                try:
+                    export(store, -i - 1)
+                except ThreadError as e:
+                    assert(e.args == (-i - 1,))
+                else:
+                    raise AssertionError("expected an exception")
+                # Create and drop host functions to churn the shared slab.
+                Func(store, FuncType([], []), lambda: None)
+
+        run_threads(run)
+
+    def test_shared_memory_pool(self):
+        config = Config()
+        config.shared_memory = True
+        config.wasm_threads = True
+        engine = Engine(config)
+        memory = SharedMemory(engine, MemoryType(Limits(1, 1), shared=True))
+        # Doubles each i32 in [start, stop), trapping if it finds a negative one,
+        # and returns the sum of the doubled values.
+        module = Module(engine, """
+            (module
+                (import "" "memory" (memory 1 1 shared))
+                (func (export "run") (param $start i32) (param $stop i32) (result i32)
+                    (local $addr i32)
+                    (local $sum i32)
+                    (block $done
+                        (loop $next
+                            (br_if $done (i32.ge_u (local.get $start) (local.get $stop)))
+                            (local.set $addr (i32.shl (local.get $start) (i32.const 2)))
+                            (if (i32.lt_s (i32.load (local.get $addr)) (i32.const 0))
+                                (then unreachable))
+                            (i32.store (local.get $addr) (i32.shl (i32.load (local.get $addr)) (i32.const 1)))
+                            (local.set $sum (i32.add (local.get $sum) (i32.load (local.get $addr))))
+                            (local.set $start (i32.add (local.get $start) (i32.const 1)))
+                            (br $next)))
+                    (local.get $sum))
+            )
+        """)
+        memory.write(struct.pack('<100i', *range(100)), 0)
+        with SharedMemoryPool(engine, module, memory, workers=4) as pool:
+            self.assertEqual(pool.workers, 4)
+            results = pool.map("run", 100, chunk_size=10)
+            self.assertEqual([(r.start, r.stop) for r in results], [(i, i + 10) for i in range(0, 100, 10)])
+            self.assertTrue(all(r.error is None for r in results))
+            self.assertEqual(sum(r.value for r in results), 2 * sum(range(100)))
+            self.assertEqual(list(struct.unpack('<100i', memory.read(0, 400))), [2 * i for i in range(100)])
+
+            memory.write(struct.pack('<i', -1), 4 * 55)
+            results = pool.map("run", 100)
+            self.assertEqual(len(results), 4)
+            errors = [r for r in results if r.error is not None]
+            self.assertEqual([(r.start, r.stop) for r in errors], [(50, 75)])
+            self.assertIsInstance(errors[0].error, Trap)
+            self.assertEqual(results[0].value, 4 * sum(range(25)))
+
+            results = pool.map("missing", 1)
+            self.assertIsInstance(results[0].error, KeyError)
+
+        with self.assertRaises(WasmtimeError):
+            SharedMemoryPool(engine, Module(engine, '(module (import "" "f" (func)))'), memory)
+
+    def test_shared_memory_pool_linker(self):
+        config = Config()
+        config.shared_memory = True
+        config.wasm_threads = True
+        engine = Engine(config)
+        memory = SharedMemory(engine, MemoryType(Limits(1, 1), shared=True))
+        # Stores `start` at the address given by the `slot` import, so every
+        # worker's write to the shared memory is visible to the host.
+        module = Module(engine, """
+            (module
+                (import "" "memory" (memory 1 1 shared))
+                (import "" "slot" (func $slot (result i32)))
+                (func (export "run") (param $start i32) (param $stop i32) (result i32)
+                    (i32.store (i32.add (call $slot) (i32.shl (local.get $start) (i32.const 2)))
+                               (local.get $stop))
+                    (local.get $stop))
+            )
+        """)
+        linker = Linker(engine)
+        linker.define(Store(engine), "", "memory", memory)
+        linker.define_func("", "slot", FuncType([], [ValType.i32()]), lambda: 64)
+        with SharedMemoryPool(engine, module, memory, workers=2, linker=linker) as pool:
+            results = pool.map("run", 4, chunk_size=1)
+            self.assertEqual([r.error for r in results], [None] * 4)
+            self.assertEqual([r.value for r in results], [1, 2, 3, 4])
+        self.assertEqual(list(struct.unpack('<4i', memory.read(64, 80))), [1, 2, 3, 4])
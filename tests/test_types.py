@@ -10,6 +10,18 @@ class TestTypes(unittest.TestCase):
         ValType.f32()
         ValType.f64()
 
+    def test_valtypes_interned(self):
+        self.assertIs(ValType.i32(), ValType.i32())
+        self.assertIs(ValType.externref(), ValType.externref())
+        ValType.i32().close()
+        self.assertEqual(str(ValType.i32()), 'i32')
+
+        ty = FuncType([ValType.i32(), ValType.funcref()], [ValType.f64()])
+        self.assertEqual(ty.params, [ValType.i32(), ValType.funcref()])
+        self.assertEqual(ty.results, [ValType.f64()])
+        self.assertNotEqual(ty.params[0], ValType.i64())
+        self.assertEqual(len({ValType.i32(), ty.params[0], ty.params[1]}), 2)
+
     def test_new(self):
         FuncType([], [])
         FuncType([ValType.i32()], [ValType.i64()])
@@ -15,29 +15,34 @@ libraries are intended to be quite similar.
 
 from ._managed import Managed
 from ._error import WasmtimeError, ExitTrap
-from ._config import Config
+from ._config import Config, PoolingAllocationConfig
 from ._engine import Engine
-from ._store import Store, Storelike, StoreContext
+from ._store import Store, Storelike, StoreContext, UpdateDeadline
 from ._types import FuncType, GlobalType, MemoryType, TableType
 from ._types import ValType, Limits, ImportType, ExportType, TagType
 from ._wat2wasm import wat2wasm
-from ._module import Module
+from ._module import Module, CompileResult
 from ._value import Val
 from ._trap import Trap, Frame, TrapCode
-from ._func import Func, Caller
+from ._func import Func, TypedFunc, Caller
 from ._globals import Global
 from ._table import Table
-from ._memory import Memory
+from ._memory import Memory, MemoryView, MemorySnapshot
 from ._instance import Instance
 from ._wasi import WasiConfig, FilePerms, DirPerms
 from ._linker import Linker
 from ._tag import Tag
 from ._instance_pre import InstancePre
-from ._sharedmemory import SharedMemory
+from ._store_pool import StorePool, PooledStore
+from ._allocator import GuestAllocator
+from ._sharedmemory import SharedMemory, SharedMemoryAtomics
+from ._parallel import SharedMemoryPool, ChunkResult
+from ._module_cache import ModuleCache
 
 __all__ = [
     'wat2wasm',
     'Config',
+    'PoolingAllocationConfig',
     'Engine',
     'Store',
     'FuncType',
@@ -50,16 +55,24 @@ __all__ = [
     'ExportType',
     'Val',
     'Func',
+    'TypedFunc',
     'Caller',
     'Table',
     'Memory',
+    'MemoryView',
+    'MemorySnapshot',
     'SharedMemory',
+    'SharedMemoryAtomics',
+    'SharedMemoryPool',
+    'ChunkResult',
     'Global',
     'Trap',
     'TrapCode',
     'ExitTrap',
     'Frame',
     'Module',
+    'ModuleCache',
+    'CompileResult',
     'Instance',
     'WasiConfig',
     'FilePerms',
@@ -67,7 +80,11 @@ __all__ = [
     'Linker',
     'WasmtimeError',
     'StoreContext',
+    'UpdateDeadline',
     'TagType',
     'Tag',
     'InstancePre',
+    'StorePool',
+    'PooledStore',
+    'GuestAllocator',
 ]
@@ -0,0 +1,150 @@
+import ctypes
+from typing import Any, Dict, List, Tuple
+
+from wasmtime import Func, TypedFunc, Memory, WasmtimeError
+from ._instance import Instance
+from ._store import Storelike
+
+# Smallest size class of pooled buffers, in bytes.
+_MIN_CAPACITY = 16
+
+# Maximum number of idle buffers kept in each size class.
+_MAX_POOLED = 8
+
+
+class GuestAllocator:
+    """
+    Passes bytes and strings into, and out of, an instance of a core wasm
+    module which exports its own memory allocator.
+
+    The allocator exports are looked up and bound once. Buffers passed into
+    the guest with `pass_bytes` or `pass_str` are rounded up to a power of two
+    and, once returned with `release`, pooled so that later calls of a
+    similar size reuse them instead of calling into the guest allocator.
+    """
+
+    _store: Storelike
+    _memory: Memory
+    _alloc: TypedFunc
+    _free: TypedFunc
+    _free_takes_size: bool
+    _pool: Dict[int, List[int]]
+    _capacities: Dict[int, int]
+
+    def __init__(self,
+                 store: Storelike,
+                 instance: Instance,
+                 memory: str = "memory",
+                 alloc: str = "malloc",
+                 free: str = "free"):
+        """
+        Binds to the `memory`, `alloc` and `free` exports of `instance`.
+
+        `alloc` must take a size in bytes and return a pointer. `free` must
+        take a pointer and, optionally, the size that was allocated.
+        """
+        exports = instance.exports(store)
+        mem = exports[memory]
+        alloc_func = exports[alloc]
+        free_func = exports[free]
+        if not isinstance(mem, Memory):
+            raise WasmtimeError("export `%s` is not a memory" % memory)
+        if not isinstance(alloc_func, Func) or not isinstance(free_func, Func):
+            raise WasmtimeError("exports `%s` and `%s` must be functions" % (alloc, free))
+        self._store = store
+        self._memory = mem
+        self._alloc = alloc_func.typed(store)
+        self._free = free_func.typed(store)
+        self._free_takes_size = len(free_func.type(store).params) == 2
+        self._pool = {}
+        self._capacities = {}
+
+    def pass_bytes(self, data: Any) -> Tuple[int, int]:
+        """
+        Copies `data`, which may be any object supporting the buffer protocol,
+        into a guest buffer.
+
+        Returns the `(pointer, length)` of the data in guest memory. The
+        buffer should be handed back with `release` once the guest is done
+        with it.
+        """
+        with memoryview(data) as view:
+            size = view.nbytes
+        ptr = self._acquire(size)
+        self._memory.write_from(self._store, data, ptr)
+        return ptr, size
+
+    def pass_str(self, s: str) -> Tuple[int, int]:
+        """
+        Encodes `s` as UTF-8 into a guest buffer, as with `pass_bytes`.
+        """
+        return self.pass_bytes(s.encode('utf-8'))
+
+    def release(self, ptr: int) -> None:
+        """
+        Returns a buffer created by `pass_bytes` or `pass_str` to the pool for
+        reuse.
+        """
+        capacity = self._capacities.pop(ptr, None)
+        if capacity is None:
+            raise WasmtimeError("pointer %d was not passed to the guest by this allocator" % ptr)
+        pool = self._pool.setdefault(capacity, [])
+        if len(pool) < _MAX_POOLED:
+            pool.append(ptr)
+        else:
+            self._guest_free(ptr, capacity)
+
+    def return_bytes(self, ptr: int, length: int, free: bool = True) -> bytes:
+        """
+        Copies `length` bytes at `ptr` out of guest memory.
+
+        If `free` is true then the guest buffer, which must have been allocated
+        by the guest, is then deallocated with the guest's `free` export.
+        """
+        address = self._memory._address_of(self._store, ptr, length)
+        ret = ctypes.string_at(address, length)
+        if free:
+            self._guest_free(ptr, length)
+        return ret
+
+    def return_str(self, ptr: int, length: int, free: bool = True) -> str:
+        """
+        Decodes `length` bytes of UTF-8 at `ptr`, as with `return_bytes`.
+        """
+        return self.return_bytes(ptr, length, free).decode('utf-8')
+
+    def close(self) -> None:
+        """
+        Deallocates all pooled buffers in the guest.
+        """
+        for capacity, pool in self._pool.items():
+            for ptr in pool:
+                self._guest_free(ptr, capacity)
+        self._pool.clear()
+
+    def __enter__(self) -> "GuestAllocator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _acquire(self, size: int) -> int:
+        capacity = _MIN_CAPACITY
+        while capacity < size:
+            capacity <<= 1
+        pool = self._pool.get(capacity)
+        ptr: int
+        if pool:
+            ptr = pool.pop()
+        else:
+            ptr = self._alloc(self._store, capacity)
+            if ptr == 0:
+                raise WasmtimeError("guest failed to allocate %d bytes" % capacity)
+        self._capacities[ptr] = capacity
+        return ptr
+
+    def _guest_free(self, ptr: int, size: int) -> None:
+        if self._free_takes_size:
+            self._free(self._store, ptr, size)
+        else:
+            self._free(self._store, ptr)
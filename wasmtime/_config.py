@@ -397,6 +397,18 @@ class Config(Managed["ctypes._Pointer[ffi.wasm_config_t]"]):
             raise TypeError('expected an int')
         ffi.wasmtime_config_max_wasm_stack_set(self.ptr(), size)
 
+    @setter_property
+    def async_stack_size(self, size: int) -> None:
+        """
+        Configures the size, in bytes, of the stacks allocated for wasm
+        executing asynchronously, for example through `Func.call_async`.
+
+        This must be larger than `max_wasm_stack`.
+        """
+        if not isinstance(size, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_config_async_stack_size_set(self.ptr(), size)
+
     @setter_property
     def gc_support(self, enable: bool) -> None:
         """
@@ -554,6 +566,20 @@ class Config(Managed["ctypes._Pointer[ffi.wasm_config_t]"]):
             raise TypeError('expected a bool')
         ffi.wasmtime_config_signals_based_traps_set(self.ptr(), enable)
 
+    @setter_property
+    def allocation_strategy(self, strategy: "PoolingAllocationConfig") -> None:
+        """
+        Configures the instance allocation strategy to use the pooling
+        allocator configured by `strategy`, a `PoolingAllocationConfig`.
+
+        By default instances are allocated on demand. The settings of
+        `strategy` are copied, so later changes to it have no effect on this
+        config.
+        """
+        if not isinstance(strategy, PoolingAllocationConfig):
+            raise TypeError('expected a PoolingAllocationConfig')
+        ffi.wasmtime_pooling_allocation_strategy_set(self.ptr(), strategy.ptr())
+
     @setter_property
     def memory_init_cow(self, enable: bool) -> None:
         """
@@ -566,3 +592,212 @@ class Config(Managed["ctypes._Pointer[ffi.wasm_config_t]"]):
         if not isinstance(enable, bool):
             raise TypeError('expected a bool')
         ffi.wasmtime_config_memory_init_cow_set(self.ptr(), enable)
+
+
+class PoolingAllocationConfig(Managed["ctypes._Pointer[ffi.wasmtime_pooling_allocation_config_t]"]):
+    """
+    Configuration of the pooling instance allocator, which can be enabled with
+    `Config.allocation_strategy`.
+
+    The pooling allocator reserves memory for a fixed number of instances,
+    memories, tables and stacks up front. Instantiating a module then reuses
+    one of these slots instead of asking the OS for fresh memory, which makes
+    instantiation dramatically faster. Each option limits the size of the
+    pool; exceeding a limit makes instantiation fail.
+
+    For more information see the Rust documentation at
+    https://docs.wasmtime.dev/api/wasmtime/struct.PoolingAllocationConfig.html
+    """
+
+    def __init__(self) -> None:
+        self._set_ptr(ffi.wasmtime_pooling_allocation_config_new())
+
+    def _delete(self, ptr: "ctypes._Pointer[ffi.wasmtime_pooling_allocation_config_t]") -> None:
+        ffi.wasmtime_pooling_allocation_config_delete(ptr)
+
+    @setter_property
+    def total_memories(self, value: int) -> None:
+        """
+        Configures the maximum number of concurrent linear memories in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_memories_set(self.ptr(), value)
+
+    @setter_property
+    def total_tables(self, value: int) -> None:
+        """
+        Configures the maximum number of concurrent tables in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_tables_set(self.ptr(), value)
+
+    @setter_property
+    def total_stacks(self, value: int) -> None:
+        """
+        Configures the maximum number of execution stacks allocated for asynchronous
+        execution in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_stacks_set(self.ptr(), value)
+
+    @setter_property
+    def total_core_instances(self, value: int) -> None:
+        """
+        Configures the maximum number of concurrent core module instances in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_core_instances_set(self.ptr(), value)
+
+    @setter_property
+    def total_component_instances(self, value: int) -> None:
+        """
+        Configures the maximum number of concurrent component instances in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_component_instances_set(self.ptr(), value)
+
+    @setter_property
+    def total_gc_heaps(self, value: int) -> None:
+        """
+        Configures the maximum number of concurrent GC heaps in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_total_gc_heaps_set(self.ptr(), value)
+
+    @setter_property
+    def max_memory_size(self, value: int) -> None:
+        """
+        Configures the maximum byte size that any linear memory in the pool may grow to.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_memory_size_set(self.ptr(), value)
+
+    @setter_property
+    def max_core_instance_size(self, value: int) -> None:
+        """
+        Configures the maximum size, in bytes, of the metadata of a core module instance.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_core_instance_size_set(self.ptr(), value)
+
+    @setter_property
+    def max_component_instance_size(self, value: int) -> None:
+        """
+        Configures the maximum size, in bytes, of the metadata of a component instance.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_component_instance_size_set(self.ptr(), value)
+
+    @setter_property
+    def max_memories_per_module(self, value: int) -> None:
+        """
+        Configures the maximum number of linear memories a core module may define.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_memories_per_module_set(self.ptr(), value)
+
+    @setter_property
+    def max_tables_per_module(self, value: int) -> None:
+        """
+        Configures the maximum number of tables a core module may define.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_tables_per_module_set(self.ptr(), value)
+
+    @setter_property
+    def max_memories_per_component(self, value: int) -> None:
+        """
+        Configures the maximum number of linear memories across all core instances of a
+        component.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_memories_per_component_set(self.ptr(), value)
+
+    @setter_property
+    def max_tables_per_component(self, value: int) -> None:
+        """
+        Configures the maximum number of tables across all core instances of a component.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_tables_per_component_set(self.ptr(), value)
+
+    @setter_property
+    def max_core_instances_per_component(self, value: int) -> None:
+        """
+        Configures the maximum number of core instances a component may create.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_core_instances_per_component_set(self.ptr(), value)
+
+    @setter_property
+    def table_elements(self, value: int) -> None:
+        """
+        Configures the maximum number of elements in any table in the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_table_elements_set(self.ptr(), value)
+
+    @setter_property
+    def max_unused_warm_slots(self, value: int) -> None:
+        """
+        Configures the maximum number of unused slots kept warm, with their previous
+        contents still mapped, to speed up reinstantiation of the same module.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_max_unused_warm_slots_set(self.ptr(), value)
+
+    @setter_property
+    def decommit_batch_size(self, value: int) -> None:
+        """
+        Configures how many memories, tables and stacks are batched together before
+        being decommitted when they're returned to the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_decommit_batch_size_set(self.ptr(), value)
+
+    @setter_property
+    def linear_memory_keep_resident(self, value: int) -> None:
+        """
+        Configures how many bytes of each linear memory are reset with `memset` and
+        kept resident instead of being decommitted when returned to the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_linear_memory_keep_resident_set(self.ptr(), value)
+
+    @setter_property
+    def table_keep_resident(self, value: int) -> None:
+        """
+        Configures how many bytes of each table are reset with `memset` and kept
+        resident instead of being decommitted when returned to the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_table_keep_resident_set(self.ptr(), value)
+
+    @setter_property
+    def async_stack_keep_resident(self, value: int) -> None:
+        """
+        Configures how many bytes of each async stack are reset with `memset` and kept
+        resident instead of being decommitted when returned to the pool.
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected an int')
+        ffi.wasmtime_pooling_allocation_config_async_stack_keep_resident_set(self.ptr(), value)
@@ -2,9 +2,14 @@ from . import _ffi as ffi
 from wasmtime import Config, WasmtimeError, Managed
 from typing import Optional
 import ctypes
+import threading
+import weakref
 
 
 class Engine(Managed["ctypes._Pointer[ffi.wasm_engine_t]"]):
+    _epoch: int
+    _epoch_lock: threading.Lock
+    _epoch_timer: Optional["_EpochTimer"]
 
     def __init__(self, config: Optional[Config] = None):
         if config is None:
@@ -14,12 +19,96 @@ class Engine(Managed["ctypes._Pointer[ffi.wasm_engine_t]"]):
         else:
             ptr = config._consume()
             self._set_ptr(ffi.wasm_engine_new_with_config(ptr))
+        self._epoch = 0
+        self._epoch_lock = threading.Lock()
+        self._epoch_timer = None
 
     def _delete(self, ptr: "ctypes._Pointer[ffi.wasm_engine_t]") -> None:
+        self.stop_epoch_timer()
         ffi.wasm_engine_delete(ptr)
 
     def increment_epoch(self) -> None:
-        ffi.wasmtime_engine_increment_epoch(self.ptr())
+        # The epoch timer's thread may race with other callers, so keep the
+        # count of ticks used by `Store.deadline` in step with the engine's.
+        with self._epoch_lock:
+            ffi.wasmtime_engine_increment_epoch(self.ptr())
+            self._epoch += 1
+
+    def start_epoch_timer(self, interval: float) -> None:
+        """
+        Starts a background thread which calls `increment_epoch` every
+        `interval` seconds until `stop_epoch_timer` is called or this engine is
+        closed.
+
+        Combined with `Config.epoch_interruption` this allows wall-clock
+        deadlines to be placed on wasm with `Store.deadline`. The thread only
+        briefly needs the GIL once per tick. Raises a `WasmtimeError` if a
+        timer is already running.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if self._epoch_timer is not None:
+            raise WasmtimeError("an epoch timer is already running for this engine")
+        self.ptr()
+        self._epoch_timer = _EpochTimer(self, interval)
+
+    def stop_epoch_timer(self) -> None:
+        """
+        Stops the timer started by `start_epoch_timer`, if any.
+        """
+        timer = self._epoch_timer
+        if timer is not None:
+            self._epoch_timer = None
+            timer.stop()
+
+    @property
+    def epoch_timer_interval(self) -> Optional[float]:
+        """
+        Returns the interval, in seconds, of the timer started with
+        `start_epoch_timer`, or `None` if it isn't running.
+        """
+        timer = self._epoch_timer
+        return None if timer is None else timer.interval
 
     def is_pulley(self) -> bool:
         return ffi.wasmtime_engine_is_pulley(self.ptr())
+
+
+class _EpochTimer:
+    """
+    Background thread which increments the epoch of an engine at a fixed
+    interval.
+
+    The thread only holds a weak reference to the engine between ticks so that
+    it doesn't keep the engine alive.
+    """
+
+    def __init__(self, engine: Engine, interval: float):
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(engine),),
+            name='wasmtime-epoch-timer',
+            daemon=True)
+        self._thread.start()
+
+    def _run(self, engine_ref: "weakref.ref[Engine]") -> None:
+        while not self._stopped.wait(self.interval):
+            engine = engine_ref()
+            if engine is None:
+                return
+            try:
+                engine.increment_epoch()
+            except ValueError:
+                return
+            finally:
+                # Drop the strong reference before sleeping. If this was the
+                # last reference then the engine is closed here, on this
+                # thread, which stops this timer.
+                del engine
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
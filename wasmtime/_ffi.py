@@ -1,5 +1,6 @@
 from ctypes import POINTER, Structure, Union, addressof, byref, cdll, string_at
 from ctypes import c_double, c_float, c_int32, c_int64, c_uint8
+from contextlib import contextmanager
 from pathlib import Path
 import ctypes
 import sys
@@ -179,6 +180,64 @@ def bytes_to_capi(s: typing.Union[bytes, bytearray]) -> wasm_byte_vec_t:
     ctypes.memmove(vec.data, buf, len(s))
     return vec
 
+
+class Py_buffer(Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.py_object),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+# `ctypes` has no way to get the address of a read-only buffer other than
+# `bytes`, so on CPython ask for it through the buffer protocol directly.
+PyObject_GetBuffer: typing.Any = None
+if platform.python_implementation() == 'CPython':
+    PyObject_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+    PyObject_GetBuffer.argtypes = [ctypes.py_object, POINTER(Py_buffer), ctypes.c_int]
+    PyObject_GetBuffer.restype = ctypes.c_int
+    PyBuffer_Release = ctypes.pythonapi.PyBuffer_Release
+    PyBuffer_Release.argtypes = [POINTER(Py_buffer)]
+    PyBuffer_Release.restype = None
+
+
+@contextmanager
+def borrow_buffer(obj: typing.Any) -> typing.Iterator[typing.Tuple["ctypes._Pointer[c_uint8]", int]]:
+    """
+    Yields a pointer to, and the length of, the contents of `obj`, which may
+    be any contiguous object supporting the buffer protocol.
+
+    The contents aren't copied where possible, so the pointer is only valid
+    within the `with` block.
+    """
+    with memoryview(obj) as view:
+        if not view.contiguous:
+            raise TypeError("expected a contiguous buffer")
+        size = view.nbytes
+        readonly = view.readonly
+    if isinstance(obj, bytes):
+        yield ctypes.cast(ctypes.c_char_p(obj), POINTER(c_uint8)), size
+    elif not readonly:
+        yield ctypes.cast((c_uint8 * size).from_buffer(obj), POINTER(c_uint8)), size
+    elif PyObject_GetBuffer is not None:
+        buf = Py_buffer()
+        PyObject_GetBuffer(obj, byref(buf), 0)
+        try:
+            yield ctypes.cast(buf.buf, POINTER(c_uint8)), size
+        finally:
+            PyBuffer_Release(byref(buf))
+    else:
+        yield ctypes.cast((c_uint8 * size).from_buffer_copy(obj), POINTER(c_uint8)), size
+
+
 def take_pointer(structure: ctypes._Pointer, field_name: str) -> ctypes._Pointer:
     """
     Moral equivalent of `mem::replace(&mut structure.field_name, NULL)`
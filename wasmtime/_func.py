@@ -1,23 +1,49 @@
 from contextlib import contextmanager
 from ctypes import POINTER, byref, CFUNCTYPE, c_void_p, cast
+import array
+import asyncio
 import ctypes
-from wasmtime import Store, FuncType, Val, Trap, WasmtimeError
+import struct
+import threading
+from wasmtime import Store, FuncType, ValType, Val, Trap, WasmtimeError
 from . import _ffi as ffi
 from ._extern import wrap_extern
-from typing import Callable, Optional, Generic, TypeVar, List, Union, Tuple, cast as cast_type, Sequence, Any
+from typing import Callable, Optional, Generic, TypeVar, List, Union, Tuple, cast as cast_type, Sequence, Any, Dict, Literal
 from ._exportable import AsExtern
-from ._store import Storelike
+from ._store import Storelike, StoreContext
 from ._slab import Slab
 
 
 FUNCTIONS: "Slab[Tuple]"
-LAST_EXCEPTION: Optional[Exception] = None
+
+
+class ThreadState(threading.local):
+    """
+    State used to communicate between host function trampolines and the
+    Python code that called into wasm.
+
+    Host functions always run on the same thread that entered wasm, so this is
+    kept per-thread to allow independent stores to be used concurrently from
+    multiple threads.
+    """
+
+    # An exception raised by a host function, to be re-raised once wasm
+    # returns back to Python.
+    last_exception: Optional[BaseException] = None
+
+    # The `asyncio` task most recently started by `async_trampoline`, which
+    # `await_wasm` waits on instead of busy-polling the wasm future.
+    pending_task: "Optional[asyncio.Future]" = None
+
+
+STATE = ThreadState()
 
 
 class Func:
     _func: ffi.wasmtime_func_t
 
-    def __init__(self, store: Storelike, ty: FuncType, func: Callable, access_caller: bool = False):
+    def __init__(self, store: Storelike, ty: FuncType, func: Callable, access_caller: bool = False,
+                 unchecked: bool = False):
         """
         Creates a new func in `store` with the given `ty` which calls the closure
         given
@@ -26,21 +52,38 @@ class Func:
         Python values rather than being wrapped in `Val`. If `access_caller` is
         set to `True` then the first argument given to `func` is an instance of
         type `Caller` below.
+
+        If `unchecked` is set to `True` then the function is created with
+        `wasmtime_func_new_unchecked`. This is only supported when `ty` has
+        only `i32`, `i64`, `f32`, and `f64` parameters and results. Arguments
+        are decoded and results are encoded with a `struct.Struct` computed
+        once up front, so results must be in range for their type rather than
+        being wrapped like they are otherwise.
         """
 
         if not isinstance(store, Store):
             raise TypeError("expected a Store")
         if not isinstance(ty, FuncType):
             raise TypeError("expected a FuncType")
-        idx = FUNCTIONS.allocate((func, ty.results, access_caller))
         _func = ffi.wasmtime_func_t()
-        ffi.wasmtime_func_new(
-            store._context(),
-            ty.ptr(),
-            trampoline,
-            idx,
-            finalize,
-            byref(_func))
+        if unchecked:
+            idx = FUNCTIONS.allocate(unchecked_plan(ty, func, access_caller))
+            ffi.wasmtime_func_new_unchecked(
+                store._context(),
+                ty.ptr(),
+                unchecked_trampoline,
+                idx,
+                finalize,
+                byref(_func))
+        else:
+            idx = FUNCTIONS.allocate((func, ty.results, access_caller))
+            ffi.wasmtime_func_new(
+                store._context(),
+                ty.ptr(),
+                trampoline,
+                idx,
+                finalize,
+                byref(_func))
         self._func = _func
 
     @classmethod
@@ -56,7 +99,7 @@ class Func:
         ptr = ffi.wasmtime_func_type(store._context(), byref(self._func))
         return FuncType._from_ptr(ptr, None)
 
-    def __call__(self, store: Storelike, *params: Any) -> Any:
+    def __call__(self, store: Storelike, *params: Any, timeout: Optional[float] = None) -> Any:
         """
         Calls this function with the given parameters
 
@@ -67,25 +110,25 @@ class Func:
         Returns a single value if the func has 1 return type
         Returns a list if the func has more than 1 return type
 
+        If `timeout` is given then the call traps once that many seconds have
+        elapsed, as with `Store.deadline`. This requires `store` to be a
+        `Store` whose engine has an epoch timer running.
+
         Note that you can also use the `__call__` method and invoke a `Func` as
         if it were a function directly.
         """
 
-        ty = self.type(store)
-        param_tys = ty.params
-        if len(params) > len(param_tys):
-            raise WasmtimeError("too many parameters provided: given %s, expected %s" %
-                                (len(params), len(param_tys)))
-        if len(params) < len(param_tys):
-            raise WasmtimeError("too few parameters provided: given %s, expected %s" %
-                                (len(params), len(param_tys)))
+        if timeout is not None:
+            if not isinstance(store, Store):
+                raise TypeError("a timeout requires a Store")
+            with store.deadline(timeout):
+                return self(store, *params)
 
+        ty = self.type(store)
         params_ptr = (ffi.wasmtime_val_t * len(params))()
         params_set = 0
         try:
-            for val in params:
-                params_ptr[params_set] = Val._convert_to_raw(store, param_tys[params_set], val)
-                params_set += 1
+            params_set = self._lower_params(store, ty.params, params, params_ptr)
 
             result_tys = ty.results
             results_ptr = (ffi.wasmtime_val_t * len(result_tys))()
@@ -105,8 +148,73 @@ class Func:
             for i in range(0, params_set):
                 ffi.wasmtime_val_unroot(byref(params_ptr[i]))
 
+        return self._lift_results(store, results_ptr)
+
+    async def call_async(self, store: Storelike, *params: Any) -> Any:
+        """
+        Calls this function asynchronously with the given parameters.
+
+        This is the same as `__call__` except that the call is made with
+        `wasmtime_func_call_async` and driven by the running `asyncio` event
+        loop. Each time the guest yields, for example because of
+        `Store.fuel_async_yield_interval` or
+        `Store.epoch_deadline_async_yield_and_update`, control is handed back
+        to the event loop which allows many calls to be interleaved on one
+        thread.
+
+        The `store` must not be used for anything else until the returned
+        coroutine completes.
+        """
+
+        ty = self.type(store)
+        params_ptr = (ffi.wasmtime_val_t * len(params))()
+        params_set = 0
+        try:
+            params_set = self._lower_params(store, ty.params, params, params_ptr)
+
+            result_tys = ty.results
+            results_ptr = (ffi.wasmtime_val_t * len(result_tys))()
+
+            await await_wasm(lambda trap, error: ffi.wasmtime_func_call_async(
+                store._context(),
+                byref(self._func),
+                params_ptr,
+                len(params),
+                results_ptr,
+                len(result_tys),
+                trap,
+                error))
+        finally:
+            for i in range(0, params_set):
+                ffi.wasmtime_val_unroot(byref(params_ptr[i]))
+
+        return self._lift_results(store, results_ptr)
+
+    @staticmethod
+    def _lower_params(store: Storelike, param_tys: List[ValType], params: Sequence[Any],
+                      params_ptr: "ctypes.Array[ffi.wasmtime_val_t]") -> int:
+        if len(params) > len(param_tys):
+            raise WasmtimeError("too many parameters provided: given %s, expected %s" %
+                                (len(params), len(param_tys)))
+        if len(params) < len(param_tys):
+            raise WasmtimeError("too few parameters provided: given %s, expected %s" %
+                                (len(params), len(param_tys)))
+
+        params_set = 0
+        try:
+            for val in params:
+                params_ptr[params_set] = Val._convert_to_raw(store, param_tys[params_set], val)
+                params_set += 1
+        except BaseException:
+            for i in range(0, params_set):
+                ffi.wasmtime_val_unroot(byref(params_ptr[i]))
+            raise
+        return params_set
+
+    @staticmethod
+    def _lift_results(store: Storelike, results_ptr: "ctypes.Array[ffi.wasmtime_val_t]") -> Any:
         results = []
-        for i in range(0, len(result_tys)):
+        for i in range(0, len(results_ptr)):
             results.append(Val._from_raw(store, results_ptr[i]).value)
         if len(results) == 0:
             return None
@@ -115,11 +223,379 @@ class Func:
         else:
             return results
 
+    def typed(self, store: Storelike,
+              params: Optional[Sequence[ValType]] = None,
+              results: Optional[Sequence[ValType]] = None) -> "TypedFunc":
+        """
+        Returns a `TypedFunc` which can be used to call this function without
+        looking up its type on each call.
+
+        The type of this function is fetched once here. If `params` or
+        `results` are provided then they're checked against the function's
+        actual type and a `WasmtimeError` is raised if they don't match.
+        """
+        ty = self.type(store)
+        param_tys = ty.params
+        result_tys = ty.results
+        if params is not None and list(params) != param_tys:
+            raise WasmtimeError("parameter types do not match: expected %s, found %s" %
+                                (list(params), param_tys))
+        if results is not None and list(results) != result_tys:
+            raise WasmtimeError("result types do not match: expected %s, found %s" %
+                                (list(results), result_tys))
+        return TypedFunc(self, store, param_tys, result_tys)
+
+    def call_batch(self, store: Storelike, *columns: Any, rows: Optional[int] = None) -> Any:
+        """
+        Calls this function once per row of the `columns` provided.
+
+        This is a shorthand for
+        `self.typed(store).call_batch(store, *columns, rows=rows)`, see
+        `TypedFunc.call_batch` for more information.
+        """
+        return self.typed(store).call_batch(store, *columns, rows=rows)
+
     def _as_extern(self) -> ffi.wasmtime_extern_t:
         union = ffi.wasmtime_extern_union(func=self._func)
         return ffi.wasmtime_extern_t(ffi.WASMTIME_EXTERN_FUNC, union)
 
 
+# Mapping of `wasm_valkind_t` to `wasmtime_valkind_t` for the numeric types
+# which `TypedFunc` can convert without going through `Val`.
+_NUMERIC_KINDS = {
+    ffi.WASM_I32.value: ffi.WASMTIME_I32.value,
+    ffi.WASM_I64.value: ffi.WASMTIME_I64.value,
+    ffi.WASM_F32.value: ffi.WASMTIME_F32.value,
+    ffi.WASM_F64.value: ffi.WASMTIME_F64.value,
+}
+
+# Name of the field in `wasmtime_val_raw_t` for each numeric `wasmtime_valkind_t`.
+_RAW_FIELDS = {
+    ffi.WASMTIME_I32.value: 'i32',
+    ffi.WASMTIME_I64.value: 'i64',
+    ffi.WASMTIME_F32.value: 'f32',
+    ffi.WASMTIME_F64.value: 'f64',
+}
+
+
+class TypedFunc:
+    """
+    A `Func` paired with its type, created via `Func.typed`.
+
+    Calling a `TypedFunc` skips the type reflection that `Func.__call__`
+    performs on every call and reuses argument and result buffers that were
+    allocated up front. Numeric arguments and results are written to and read
+    from these buffers directly, while reference types fall back to `Val`
+    conversions.
+
+    Since these buffers belong to the `TypedFunc`, it must not be called from
+    more than one thread at a time; create one per thread with `Func.typed`
+    instead. Calling it again from a host function it calls is fine.
+    """
+
+    _func: Func
+    _context: "ctypes._Pointer[ffi.wasmtime_context_t]"
+    _context_address: int
+    _param_tys: List[ValType]
+    _param_kinds: List[Optional[int]]
+    _result_kinds: List[Optional[int]]
+    _raw: "Optional[ctypes.Array[ffi.wasmtime_val_raw_t]]"
+    _raw_slots: List[ffi.wasmtime_val_raw_t]
+    _raw_param_fields: List[str]
+    _raw_result_fields: List[str]
+    _raw_param_codes: List["_RawFormat"]
+    _raw_result_codes: List["_RawFormat"]
+
+    def __init__(self, func: Func, store: Storelike, params: List[ValType], results: List[ValType]):
+        self._func = func
+        # Unchecked calls rely on Python to check the store, and a `Caller`
+        # for the same store has a different pointer at the same address.
+        self._context = store._context()
+        self._context_address = ctypes.addressof(self._context.contents)
+        self._param_tys = params
+        self._param_kinds = [_NUMERIC_KINDS.get(ty._kind) for ty in params]
+        self._result_kinds = [_NUMERIC_KINDS.get(ty._kind) for ty in results]
+        self._params = (ffi.wasmtime_val_t * len(params))()
+        self._results = (ffi.wasmtime_val_t * len(results))()
+        for i, kind in enumerate(self._param_kinds):
+            if kind is not None:
+                self._params[i].kind = ffi.wasmtime_valkind_t(kind)
+        # Cache the union of each slot so the hot path doesn't have to index
+        # into the ctypes arrays on each call.
+        self._param_slots = [self._params[i].of for i in range(len(params))]
+        self._result_slots = [self._results[i].of for i in range(len(results))]
+
+        # Unchecked calls share one buffer for both parameters and results and
+        # are only available when every value is numeric.
+        self._raw = None
+        self._raw_slots = []
+        self._raw_param_fields = []
+        self._raw_result_fields = []
+        if None not in self._param_kinds and None not in self._result_kinds:
+            self._raw = (ffi.wasmtime_val_raw_t * max(len(params), len(results)))()
+            self._raw_slots = [self._raw[i] for i in range(len(self._raw))]
+            self._raw_param_fields = [_RAW_FIELDS[cast_type(int, k)] for k in self._param_kinds]
+            self._raw_result_fields = [_RAW_FIELDS[cast_type(int, k)] for k in self._result_kinds]
+            self._raw_param_codes = [_raw_format(ty) for ty in params]
+            self._raw_result_codes = [_raw_format(ty) for ty in results]
+
+    @property
+    def func(self) -> Func:
+        """
+        Returns the `Func` that this typed function calls.
+        """
+        return self._func
+
+    def __call__(self, store: Storelike, *params: Any) -> Any:
+        """
+        Calls this function with the given parameters.
+
+        Parameters and results are handled the same way as `Func.__call__`.
+        """
+        nparams = len(self._param_kinds)
+        if len(params) != nparams:
+            raise WasmtimeError("wrong number of parameters provided: given %s, expected %s" %
+                                (len(params), nparams))
+
+        rooted = []
+        try:
+            for i, kind in enumerate(self._param_kinds):
+                val = params[i]
+                if kind is None or isinstance(val, Val):
+                    # A host function may call this function again and reuse
+                    # `self._params`, so unroot the local copy instead.
+                    raw = Val._convert_to_raw(store, self._param_tys[i], val)
+                    rooted.append(raw)
+                    self._params[i] = raw
+                    continue
+                slot = self._param_slots[i]
+                if kind == ffi.WASMTIME_I32.value:
+                    if not isinstance(val, int):
+                        raise TypeError("expected an integer")
+                    slot.i32 = val
+                elif kind == ffi.WASMTIME_I64.value:
+                    if not isinstance(val, int):
+                        raise TypeError("expected an integer")
+                    slot.i64 = val
+                elif kind == ffi.WASMTIME_F32.value:
+                    if not isinstance(val, float):
+                        raise TypeError("expected a float")
+                    slot.f32 = val
+                else:
+                    if not isinstance(val, float):
+                        raise TypeError("expected a float")
+                    slot.f64 = val
+
+            with enter_wasm(store) as trap:
+                error = ffi.wasmtime_func_call(
+                    store._context(),
+                    byref(self._func._func),
+                    self._params,
+                    nparams,
+                    self._results,
+                    len(self._result_kinds),
+                    trap)
+                if error:
+                    raise WasmtimeError._from_ptr(error)
+        finally:
+            for raw in rooted:
+                ffi.wasmtime_val_unroot(byref(raw))
+
+        results = []
+        for i, kind in enumerate(self._result_kinds):
+            if kind is None:
+                results.append(Val._from_raw(store, self._results[i]).value)
+                continue
+            slot = self._result_slots[i]
+            if kind == ffi.WASMTIME_I32.value:
+                results.append(slot.i32)
+            elif kind == ffi.WASMTIME_I64.value:
+                results.append(slot.i64)
+            elif kind == ffi.WASMTIME_F32.value:
+                results.append(slot.f32)
+            else:
+                results.append(slot.f64)
+        if len(results) == 0:
+            return None
+        elif len(results) == 1:
+            return results[0]
+        else:
+            return results
+
+    def call_unchecked(self, store: Storelike, *params: Any) -> Any:
+        """
+        Calls this function with `wasmtime_func_call_unchecked`.
+
+        This is only supported for functions whose parameters and results are
+        all `i32`, `i64`, `f32`, or `f64`, otherwise a `WasmtimeError` is
+        raised. Parameters must be native Python `int` or `float` values which
+        are stored directly into a reused buffer of raw values, and results
+        are read back out of the same buffer without creating `Val` objects.
+
+        The `store` provided must be the same store that this function was
+        typed with, otherwise a `WasmtimeError` is raised, since unlike
+        `__call__` this isn't checked by Wasmtime.
+
+        Results are returned in the same shape as `Func.__call__`.
+        """
+        raw = self._raw
+        if raw is None:
+            raise WasmtimeError("unchecked calls require numeric parameters and results")
+        fields = self._raw_param_fields
+        if len(params) != len(fields):
+            raise WasmtimeError("wrong number of parameters provided: given %s, expected %s" %
+                                (len(params), len(fields)))
+        context = self._unchecked_context(store)
+        slots = self._raw_slots
+        for i, field in enumerate(fields):
+            setattr(slots[i], field, params[i])
+
+        with enter_wasm(store) as trap:
+            error = ffi.wasmtime_func_call_unchecked(
+                context,
+                byref(self._func._func),
+                raw,
+                len(raw),
+                trap)
+            if error:
+                raise WasmtimeError._from_ptr(error)
+
+        fields = self._raw_result_fields
+        if len(fields) == 0:
+            return None
+        elif len(fields) == 1:
+            return getattr(slots[0], fields[0])
+        else:
+            return [getattr(slots[i], field) for i, field in enumerate(fields)]
+
+    def call_batch(self, store: Storelike, *columns: Any, rows: Optional[int] = None) -> Any:
+        """
+        Calls this function once per row of the `columns` provided.
+
+        There must be one column per parameter, and each column can either be
+        a one-dimensional object supporting the buffer protocol (such as an
+        `array.array`, a `memoryview`, or a NumPy array) or a sequence. All
+        columns must have the same length, which is the number of rows.
+        Functions without parameters have no columns to count, so `rows` must
+        be given instead, in which case a `ValueError` is raised if it's
+        missing. If given alongside columns it must match their length.
+
+        Like `call_unchecked` this is only supported for functions whose
+        parameters and results are all numeric. Rows are copied in chunks from
+        the columns into a buffer of raw values, each row is called through
+        `wasmtime_func_call_unchecked` on its slice of that buffer, and
+        results are copied back out of it, so no Python object is created per
+        value. Columns whose format doesn't match the parameter's type, and
+        sequences, are converted to an `array.array` first.
+
+        Returns `None` if this function has no results, an `array.array` of
+        results if it has one, or a list of `array.array`s otherwise. Arrays
+        use the typecodes `'i'`, `'q'`, `'f'`, and `'d'` for `i32`, `i64`,
+        `f32`, and `f64` results respectively.
+
+        If a row traps then the trap is raised and the results of previous
+        rows are discarded.
+        """
+        raw = self._raw
+        if raw is None:
+            raise WasmtimeError("batch calls require numeric parameters and results")
+        context = self._unchecked_context(store)
+        param_codes = self._raw_param_codes
+        if len(columns) != len(param_codes):
+            raise WasmtimeError("wrong number of columns provided: given %s, expected %s" %
+                                (len(columns), len(param_codes)))
+        views = [_column_view(column, code) for column, code in zip(columns, param_codes)]
+        if rows is None:
+            if not views:
+                raise ValueError("`rows` is required to batch calls to a function without parameters")
+            rows = len(views[0])
+        elif rows < 0:
+            raise ValueError("rows must be non-negative")
+        for view in views:
+            if len(view) != rows:
+                raise WasmtimeError("all columns must have the same length")
+
+        result_codes = self._raw_result_codes
+        results = [array.array(code) for code in result_codes]
+        if rows > 0:
+            nraw = len(raw)
+            chunk = min(rows, _BATCH_ROWS)
+            # A function without parameters or results still needs a slot to
+            # point at, which every row then shares.
+            buf = (ffi.wasmtime_val_raw_t * max(chunk * nraw, 1))()
+            first = buf[0]
+            stride = nraw * _RAW_SIZE
+            # Views of `buf` for each format, where the values of slot `i` of
+            # each row are at `[i * _RAW_SIZE // size::stride // size]`.
+            slots = memoryview(buf).cast('B')
+            typed: Dict[str, "memoryview[Any]"] = {code: slots.cast(code) for code in set(param_codes + result_codes)}
+            func = byref(self._func._func)
+            trap = POINTER(ffi.wasm_trap_t)()
+            trap_ptr = byref(trap)
+            for start in range(0, rows, chunk):
+                n = min(chunk, rows - start)
+                for i, (view, code) in enumerate(zip(views, param_codes)):
+                    size = typed[code].itemsize
+                    offset = i * _RAW_SIZE // size
+                    typed[code][offset:offset + n * stride // size:stride // size] = view[start:start + n]
+                for row in range(n):
+                    error = ffi.wasmtime_func_call_unchecked(context, func, byref(first, row * stride), nraw, trap_ptr)
+                    if error or trap:
+                        check_call(error, trap)
+                for i, (out, code) in enumerate(zip(results, result_codes)):
+                    size = typed[code].itemsize
+                    offset = i * _RAW_SIZE // size
+                    out.frombytes(typed[code][offset:offset + n * stride // size:stride // size].tobytes())
+
+        if len(results) == 0:
+            return None
+        if len(results) == 1:
+            return results[0]
+        return results
+
+    def _unchecked_context(self, store: Storelike) -> "ctypes._Pointer[ffi.wasmtime_context_t]":
+        """
+        Returns the context of `store`, raising an error if it isn't the store
+        this function was typed with.
+        """
+        context = store._context()
+        if context is not self._context and ctypes.addressof(context.contents) != self._context_address:
+            raise WasmtimeError("function used with the wrong store")
+        return context
+
+
+# Number of rows which `TypedFunc.call_batch` copies into its buffer at once.
+_BATCH_ROWS = 1024
+
+# Format characters which may be reinterpreted as each raw format, since wasm
+# integers don't have a sign of their own.
+_COLUMN_FORMATS = {
+    'i': 'iI' + ('lL' if struct.calcsize('l') == 4 else ''),
+    'q': 'qQ' + ('lL' if struct.calcsize('l') == 8 else ''),
+    'f': 'f',
+    'd': 'd',
+}
+
+
+def _column_view(column: Any, code: "_RawFormat") -> "memoryview[Any]":
+    """
+    Returns a one-dimensional view of `column` with the format `code`,
+    copying it into an `array.array` if it isn't already laid out that way.
+    """
+    try:
+        view = memoryview(column)
+    except TypeError:
+        return memoryview(array.array(code, column))
+    if view.ndim != 1:
+        raise WasmtimeError("expected a one-dimensional column")
+    fmt = view.format.lstrip('@')
+    if fmt == code:
+        return view
+    if fmt in _COLUMN_FORMATS[code] and view.c_contiguous:
+        return view.cast('B').cast(code)
+    return memoryview(array.array(code, view))
+
+
 class Caller:
     __ptr: "Optional[ctypes._Pointer[ffi.wasmtime_caller_t]]"
     __context: "Optional[ctypes._Pointer[ffi.wasmtime_context_t]]"
@@ -197,25 +673,158 @@ def trampoline(idx, caller, params, nparams, results, nresults):  # type: ignore
         for i in range(0, nparams):
             pyparams.append(Val._from_raw(caller, params[i], owned=False).value)
         pyresults = func(*pyparams)
+        store_results(caller, result_tys, pyresults, results, nresults)
+        return 0
+    except BaseException as e:
+        STATE.last_exception = e
+        trap = Trap("python exception")._consume()
+        return cast(trap, c_void_p).value
+    finally:
+        caller._invalidate()
+
+
+def store_results(store: Storelike, result_tys: List[ValType], pyresults: Any,
+                  results: "ctypes._Pointer[ffi.wasmtime_val_t]", nresults: int) -> None:
+    if nresults == 0:
+        if pyresults is not None:
+            raise WasmtimeError(
+                "callback produced results when it shouldn't")
+    elif nresults == 1:
+        results[0] = Val._convert_to_raw(store, result_tys[0], pyresults)
+    else:
+        if len(pyresults) != nresults:
+            raise WasmtimeError("callback produced wrong number of results")
+        for i, result in enumerate(pyresults):
+            results[i] = Val._convert_to_raw(store, result_tys[i], result)
+
+
+CONTINUATIONS: "Slab[Optional[Tuple]]"
+
+
+@ffi.wasmtime_func_async_callback_t
+def async_trampoline(idx, caller, params, nparams, results, nresults, trap_ret, continuation):  # type: ignore
+    caller = Caller(caller)
+    try:
+        func, result_tys = FUNCTIONS.get(idx or 0)
+        pyparams = []
+        for i in range(0, nparams):
+            pyparams.append(Val._from_raw(caller, params[i], owned=False).value)
+        task = asyncio.ensure_future(func(*pyparams))
+        STATE.pending_task = task
+        # The caller's context stays alive until the continuation completes,
+        # so use it to convert results once the task finishes.
+        store = StoreContext(caller._context())
+        state: Optional[Tuple] = (task, store, result_tys, results, nresults, trap_ret)
+    except BaseException as e:
+        STATE.last_exception = e
+        trap_ret[0] = Trap("python exception")._consume()
+        state = None
+    finally:
+        caller._invalidate()
+    continuation.contents.callback = async_continuation
+    continuation.contents.env = CONTINUATIONS.allocate(state)
+    continuation.contents.finalizer = async_continuation_finalize
+
+
+@ffi.wasmtime_func_async_continuation_callback_t
+def async_continuation(idx):  # type: ignore
+    state = CONTINUATIONS.get(idx or 0)
+    if state is None:
+        return True
+    task, store, result_tys, results, nresults, trap_ret = state
+    if not task.done():
+        return False
+    try:
+        if task.cancelled():
+            raise asyncio.CancelledError()
+        store_results(store, result_tys, task.result(), results, nresults)
+    except BaseException as e:
+        STATE.last_exception = e
+        trap_ret[0] = Trap("python exception")._consume()
+    finally:
+        store._invalidate()
+    return True
+
+
+@CFUNCTYPE(None, c_void_p)
+def async_continuation_finalize(idx):  # type: ignore
+    CONTINUATIONS.deallocate(idx or 0)
+
+
+# Format character for each numeric `wasm_valkind_t` when decoding or encoding
+# a slot in an array of `wasmtime_val_raw_t`, which are always little-endian.
+_RawFormat = Literal['i', 'q', 'f', 'd']
+_RAW_FORMATS: Dict[int, _RawFormat] = {
+    ffi.WASM_I32.value: 'i',
+    ffi.WASM_I64.value: 'q',
+    ffi.WASM_F32.value: 'f',
+    ffi.WASM_F64.value: 'd',
+}
+_RAW_SIZE = ctypes.sizeof(ffi.wasmtime_val_raw_t)
+
+
+def _raw_format(ty: ValType) -> _RawFormat:
+    """
+    Returns the format character of `ty` in `_RAW_FORMATS`, raising an error
+    if it isn't numeric.
+    """
+    code = _RAW_FORMATS.get(ty._kind)
+    if code is None:
+        raise WasmtimeError("unchecked host functions only support numeric types, found %s" % ty)
+    return code
+
+
+def _raw_struct(tys: List[ValType]) -> struct.Struct:
+    fmt = '<'
+    for ty in tys:
+        code = _raw_format(ty)
+        fmt += code + '%dx' % (_RAW_SIZE - struct.calcsize('<' + code))
+    return struct.Struct(fmt)
+
+
+def unchecked_plan(ty: FuncType, func: Callable, access_caller: bool) -> Tuple:
+    """
+    Computes how `unchecked_trampoline` decodes arguments for, and encodes
+    results of, a host function with type `ty`.
+    """
+    params = _raw_struct(ty.params)
+    results = _raw_struct(ty.results)
+    buf_ty = ctypes.c_ubyte * max(params.size, results.size)
+    return (func, params, results, len(ty.results), buf_ty, access_caller)
+
+
+@ffi.wasmtime_func_unchecked_callback_t
+def unchecked_trampoline(idx, caller, args_and_results, nargs_and_results):  # type: ignore
+    pycaller = None
+    try:
+        func, params, results, nresults, buf_ty, access_caller = FUNCTIONS.get(idx or 0)
+        if nargs_and_results:
+            buf = buf_ty.from_address(ctypes.addressof(args_and_results.contents))
+        else:
+            buf = b''
+        if access_caller:
+            pycaller = Caller(caller)
+            pyresults = func(pycaller, *params.unpack_from(buf))
+        else:
+            pyresults = func(*params.unpack_from(buf))
         if nresults == 0:
             if pyresults is not None:
                 raise WasmtimeError(
                     "callback produced results when it shouldn't")
         elif nresults == 1:
-            results[0] = Val._convert_to_raw(caller, result_tys[0], pyresults)
+            results.pack_into(buf, 0, pyresults)
         else:
             if len(pyresults) != nresults:
                 raise WasmtimeError("callback produced wrong number of results")
-            for i, result in enumerate(pyresults):
-                results[i] = Val._convert_to_raw(caller, result_tys[i], result)
+            results.pack_into(buf, 0, *pyresults)
         return 0
     except BaseException as e:
-        global LAST_EXCEPTION
-        LAST_EXCEPTION = e
+        STATE.last_exception = e
         trap = Trap("python exception")._consume()
         return cast(trap, c_void_p).value
     finally:
-        caller._invalidate()
+        if pycaller is not None:
+            pycaller._invalidate()
 
 
 @CFUNCTYPE(None, c_void_p)
@@ -225,6 +834,7 @@ def finalize(idx):  # type: ignore
 
 
 FUNCTIONS = Slab()
+CONTINUATIONS = Slab()
 
 
 @contextmanager
@@ -232,19 +842,76 @@ def enter_wasm(store: Storelike):  # type: ignore
     try:
         trap = POINTER(ffi.wasm_trap_t)()
         yield byref(trap)
-        if trap:
-            trap_obj = Trap._from_ptr(trap)
-            maybe_raise_last_exn()
-            raise trap_obj
+        check_call(None, trap)
     except WasmtimeError:
         maybe_raise_last_exn()
         raise
 
 
+def check_call(error: "Optional[ctypes._Pointer[ffi.wasmtime_error_t]]",
+               trap: "ctypes._Pointer[ffi.wasm_trap_t]") -> None:
+    """
+    Raises the error or trap produced by a call into wasm, if any.
+
+    An exception raised by a host function during the call takes precedence
+    over the trap it was turned into.
+    """
+    if error:
+        exn = WasmtimeError._from_ptr(error)
+        maybe_raise_last_exn()
+        raise exn
+    if trap:
+        trap_obj = Trap._from_ptr(trap)
+        maybe_raise_last_exn()
+        raise trap_obj
+
+
+async def await_wasm(start: Callable[[Any, Any], "ctypes._Pointer[ffi.wasmtime_call_future_t]"]) -> None:
+    """
+    Drives a `wasmtime_call_future_t` to completion on the running `asyncio`
+    event loop.
+
+    The `start` callback is given out-pointers for a trap and an error and
+    returns the future to poll. The future is polled once per iteration of the
+    event loop until it completes, and any trap or error it produced is then
+    raised.
+    """
+    trap = POINTER(ffi.wasm_trap_t)()
+    error = POINTER(ffi.wasmtime_error_t)()
+    future = start(byref(trap), byref(error))
+    if future:
+        waiting_on = None
+        try:
+            STATE.pending_task = None
+            while not ffi.wasmtime_call_future_poll(future):
+                # If this poll started an async host function then there's no
+                # need to poll again until it's finished.
+                task = take_pending_task()
+                if task is not None:
+                    waiting_on = task
+                if waiting_on is not None and not waiting_on.done():
+                    await asyncio.wait([waiting_on])
+                else:
+                    await asyncio.sleep(0)
+        finally:
+            STATE.pending_task = None
+            ffi.wasmtime_call_future_delete(future)
+    check_call(error, trap)
+
+
+def take_pending_task() -> "Optional[asyncio.Future]":
+    """
+    Returns, and clears, the task started by `async_trampoline` during the
+    last poll of a call future on this thread.
+    """
+    task = STATE.pending_task
+    STATE.pending_task = None
+    return task
+
+
 def maybe_raise_last_exn() -> None:
-    global LAST_EXCEPTION
-    if LAST_EXCEPTION is None:
+    exn = STATE.last_exception
+    if exn is None:
         return
-    exn = LAST_EXCEPTION
-    LAST_EXCEPTION = None
+    STATE.last_exception = None
     raise exn
@@ -1,18 +1,20 @@
 import ctypes
 
 from . import _ffi as ffi
-from wasmtime import GlobalType, Val, WasmtimeError
-from typing import Any
+from wasmtime import GlobalType, Val, ValType, WasmtimeError
+from typing import Any, Optional
 from ._store import Storelike
 
 
 class Global:
     _global: ffi.wasmtime_global_t
+    _content: Optional[ValType]
 
     def __init__(self, store: Storelike, ty: GlobalType, val: Any):
         if not isinstance(ty, GlobalType):
             raise TypeError("expected a GlobalType")
-        val = Val._convert_to_raw(store, ty.content, val)
+        content = ty.content
+        val = Val._convert_to_raw(store, content, val)
         global_ = ffi.wasmtime_global_t()
         error = ffi.wasmtime_global_new(
             store._context(),
@@ -23,11 +25,13 @@ class Global:
         if error:
             raise WasmtimeError._from_ptr(error)
         self._global = global_
+        self._content = content
 
     @classmethod
     def _from_raw(cls, global_: ffi.wasmtime_global_t) -> "Global":
         ty: "Global" = cls.__new__(cls)
         ty._global = global_
+        ty._content = None
         return ty
 
     def type(self, store: Storelike) -> GlobalType:
@@ -38,6 +42,13 @@ class Global:
         ptr = ffi.wasmtime_global_type(store._context(), ctypes.byref(self._global))
         return GlobalType._from_ptr(ptr, None)
 
+    def _content_type(self, store: Storelike) -> ValType:
+        # The type of a global never changes, so only look it up once.
+        content = self._content
+        if content is None:
+            content = self._content = self.type(store).content
+        return content
+
     def value(self, store: Storelike) -> Any:
         """
         Gets the current value of this global
@@ -56,7 +67,7 @@ class Global:
         """
         Sets the value of this global to a new value
         """
-        val = Val._convert_to_raw(store, self.type(store).content, val)
+        val = Val._convert_to_raw(store, self._content_type(store), val)
         error = ffi.wasmtime_global_set(store._context(), ctypes.byref(self._global), ctypes.byref(val))
         ffi.wasmtime_val_unroot(ctypes.byref(val))
         if error:
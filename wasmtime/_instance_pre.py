@@ -5,7 +5,7 @@ from wasmtime import WasmtimeError
 from ._store import Storelike
 from ._module import Module
 from ._instance import Instance
-from ._func import enter_wasm
+from ._func import enter_wasm, await_wasm
 
 
 class InstancePre(Managed["ctypes._Pointer[ffi.wasmtime_instance_pre_t]"]):
@@ -37,6 +37,19 @@ class InstancePre(Managed["ctypes._Pointer[ffi.wasmtime_instance_pre_t]"]):
                 raise WasmtimeError._from_ptr(error)
         return Instance._from_raw(instance)
 
+    async def instantiate_async(self, store: Storelike) -> Instance:
+        """
+        Instantiates the pre-linked module in the given store asynchronously.
+
+        This is the same as `instantiate` except that instantiation is driven
+        by the running `asyncio` event loop. See `Func.call_async` for more
+        information.
+        """
+        instance = ffi.wasmtime_instance_t()
+        await await_wasm(lambda trap, error: ffi.wasmtime_instance_pre_instantiate_async(
+            self.ptr(), store._context(), ctypes.byref(instance), trap, error))
+        return Instance._from_raw(instance)
+
     @property
     def module(self) -> Module:
         """
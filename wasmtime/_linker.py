@@ -7,8 +7,8 @@ from ._extern import get_extern_ptr, wrap_extern
 from ._config import setter_property
 from ._exportable import AsExtern
 from ._store import Storelike
-from ._func import enter_wasm, trampoline, FUNCTIONS, finalize
-from typing import Callable
+from ._func import enter_wasm, await_wasm, trampoline, async_trampoline, unchecked_trampoline, unchecked_plan, FUNCTIONS, finalize
+from typing import Awaitable, Callable
 from ._instance_pre import InstancePre
 
 
@@ -61,7 +61,8 @@ class Linker(Managed["ctypes._Pointer[ffi.wasmtime_linker_t]"]):
         if error:
             raise WasmtimeError._from_ptr(error)
 
-    def define_func(self, module: str, name: str, ty: FuncType, func: Callable[..., Any], access_caller: bool = False) -> None:
+    def define_func(self, module: str, name: str, ty: FuncType, func: Callable[..., Any], access_caller: bool = False,
+                    unchecked: bool = False) -> None:
         """
         Defines a new function, by name, in this linker.
 
@@ -69,6 +70,54 @@ class Linker(Managed["ctypes._Pointer[ffi.wasmtime_linker_t]"]):
         function without creating a `Func` itself. This enables
         `Store`-independent functions to be inserted into this linker, meaning
         the linker can be used to instantiate modules in multiple stores.
+
+        The `unchecked` argument has the same meaning as it does for `Func`.
+        """
+        module_bytes = module.encode('utf-8')
+        module_buf = ctypes.create_string_buffer(module_bytes)
+        name_bytes = name.encode('utf-8')
+        name_buf = ctypes.create_string_buffer(name_bytes)
+        if not isinstance(ty, FuncType):
+            raise TypeError("expected a FuncType")
+        if unchecked:
+            idx = FUNCTIONS.allocate(unchecked_plan(ty, func, access_caller))
+            error = ffi.wasmtime_linker_define_func_unchecked(
+                self.ptr(),
+                module_buf,
+                len(module_bytes),
+                name_buf,
+                len(name_bytes),
+                ty.ptr(),
+                unchecked_trampoline,
+                idx,
+                finalize)
+        else:
+            idx = FUNCTIONS.allocate((func, ty.results, access_caller))
+            error = ffi.wasmtime_linker_define_func(
+                self.ptr(),
+                module_buf,
+                len(module_bytes),
+                name_buf,
+                len(name_bytes),
+                ty.ptr(),
+                trampoline,
+                idx,
+                finalize)
+        if error:
+            raise WasmtimeError._from_ptr(error)
+
+    def define_async_func(self, module: str, name: str, ty: FuncType,
+                          func: Callable[..., Awaitable[Any]]) -> None:
+        """
+        Defines a new asynchronous function, by name, in this linker.
+
+        This is similar to `define_func` except that `func` is a coroutine
+        function. When wasm calls this function `func` is started as an
+        `asyncio` task and the guest is suspended on its async stack until the
+        task completes, during which time the event loop can run other tasks.
+
+        Async functions can only be called from wasm running through
+        `Func.call_async` or the other `*_async` methods.
         """
         module_bytes = module.encode('utf-8')
         module_buf = ctypes.create_string_buffer(module_bytes)
@@ -76,15 +125,15 @@ class Linker(Managed["ctypes._Pointer[ffi.wasmtime_linker_t]"]):
         name_buf = ctypes.create_string_buffer(name_bytes)
         if not isinstance(ty, FuncType):
             raise TypeError("expected a FuncType")
-        idx = FUNCTIONS.allocate((func, ty.results, access_caller))
-        error = ffi.wasmtime_linker_define_func(
+        idx = FUNCTIONS.allocate((func, ty.results))
+        error = ffi.wasmtime_linker_define_async_func(
             self.ptr(),
             module_buf,
             len(module_bytes),
             name_buf,
             len(name_bytes),
             ty.ptr(),
-            trampoline,
+            async_trampoline,
             idx,
             finalize)
         if error:
@@ -169,6 +218,20 @@ class Linker(Managed["ctypes._Pointer[ffi.wasmtime_linker_t]"]):
                 raise WasmtimeError._from_ptr(error)
         return Instance._from_raw(instance)
 
+    async def instantiate_async(self, store: Storelike, module: Module) -> Instance:
+        """
+        Instantiates a module asynchronously using this linker's defined set
+        of names.
+
+        This is the same as `instantiate` except that instantiation, including
+        running the module's start function, is driven by the running
+        `asyncio` event loop. See `Func.call_async` for more information.
+        """
+        instance = ffi.wasmtime_instance_t()
+        await await_wasm(lambda trap, error: ffi.wasmtime_linker_instantiate_async(
+            self.ptr(), store._context(), module.ptr(), ctypes.byref(instance), trap, error))
+        return Instance._from_raw(instance)
+
     def get_default(self, store: Storelike, name: str) -> Func:
         """
         Gets the default export for the named module in this linker.
@@ -1,8 +1,12 @@
 from . import _ffi as ffi
 import ctypes
+import struct
+import sys
 import typing
+from struct import Struct
 from wasmtime import MemoryType, WasmtimeError
 from ._store import Storelike
+from ._globals import Global
 
 
 class Memory:
@@ -62,6 +66,9 @@ class Memory:
         """
         return ffi.wasmtime_memory_data(store._context(), ctypes.byref(self._memory))
 
+    def _data_address(self, store: Storelike) -> int:
+        return ctypes.cast(self.data_ptr(store), ctypes.c_void_p).value or 0
+
     def get_buffer_ptr(self, store: Storelike,
                        size: typing.Optional[int] = None,
                        offset: int = 0) -> ctypes.Array:
@@ -78,6 +85,18 @@ class Memory:
         ptr_type = ctypes.c_ubyte * size
         return ptr_type.from_address(ctypes.addressof(self.data_ptr(store).contents) + offset)
 
+    def view(self, store: Storelike) -> "MemoryView":
+        """
+        Returns a zero-copy `MemoryView` of the current contents of this
+        memory.
+
+        The view reads and writes guest memory in place. If the memory is
+        grown or moved after the view is created then accessing the view
+        raises a `WasmtimeError` rather than touching memory which may have
+        been freed.
+        """
+        return MemoryView(self, store)
+
     def read(
             self,
             store: Storelike,
@@ -103,12 +122,12 @@ class Memory:
     def write(
             self,
             store: Storelike,
-            value: typing.Union[bytearray, bytes],
+            value: typing.Union[bytearray, bytes, memoryview, typing.Sequence[int]],
             start: typing.Optional[int] = None) -> int:
         """
         write a bytearray value into a possibly large slice of memory
         negative start is allowed in a way similat to list slice mylist[-10:]
-        if value is not bytearray it will be used to construct an intermediate bytearray (copyied twice)
+        if value is not bytes or bytearray it is first converted to bytes
         return number of bytes written
         raises IndexError when trying to write outside the memory range
         this happens when start offset is >= size or when end side of value is >= size
@@ -118,9 +137,8 @@ class Memory:
         start = key.indices(size)[0]
         if start >= size:
             raise IndexError("index out of range")
-        # value must be bytearray ex. cast bytes() to bytearray
-        if not isinstance(value, bytearray):
-            value = bytearray(value)
+        if not isinstance(value, (bytes, bytearray)):
+            value = bytes(value)
         val_size = len(value)
         if val_size == 0:
             return val_size
@@ -128,12 +146,254 @@ class Memory:
         stop = start + val_size
         if stop > size:
             raise IndexError("index out of range")
-        ptr_type = ctypes.c_ubyte * val_size
-        src_ptr = ptr_type.from_buffer(value)
-        dst_ptr = self.get_buffer_ptr(store, val_size, start)
-        ctypes.memmove(dst_ptr, src_ptr, val_size)
+        _copy_from(self._data_address(store) + start, value, val_size)
         return val_size
 
+    def read_into(self, store: Storelike, dest: typing.Any, offset: int = 0) -> int:
+        """
+        Fills `dest` with the contents of this memory starting at `offset`.
+
+        `dest` may be any writable, contiguous object supporting the buffer
+        protocol, such as a `bytearray`, `memoryview`, `array.array`, `mmap`
+        or NumPy array. The bytes are copied directly into it without any
+        intermediate buffer.
+
+        Returns the number of bytes copied. Raises an `IndexError` if the
+        range to read is out of bounds of this memory.
+        """
+        return _read_into(dest, lambda size: self._address_of(store, offset, size))
+
+    def write_from(self, store: Storelike, src: typing.Any, offset: int = 0) -> int:
+        """
+        Writes the contents of `src` into this memory starting at `offset`.
+
+        `src` may be any contiguous object supporting the buffer protocol,
+        such as `bytes`, a `bytearray`, `memoryview`, `array.array`, `mmap` or
+        NumPy array. The bytes are copied directly from it without any
+        intermediate buffer.
+
+        Returns the number of bytes copied. Raises an `IndexError` if the
+        range to write is out of bounds of this memory.
+        """
+        return _write_from(src, lambda size: self._address_of(store, offset, size))
+
+    def readv(self,
+              store: Storelike,
+              iovecs: typing.Union[int, typing.Sequence[typing.Tuple[int, int]]],
+              count: typing.Optional[int] = None) -> bytearray:
+        """
+        Gathers the segments of this memory described by `iovecs` into a
+        single `bytearray`, in order.
+
+        `iovecs` is either a sequence of `(offset, length)` pairs, or the
+        offset in this memory of a table of `count` WASI-style iovecs, each a
+        pair of little-endian 32-bit offset and length.
+
+        All segments are bounds-checked before any data is copied, raising an
+        `IndexError` if any is out of bounds.
+        """
+        guest, segments = self._iovecs(store, iovecs, count)
+        ret = bytearray(sum(length for _, length in segments))
+        pos = 0
+        for offset, length in segments:
+            ret[pos:pos + length] = guest[offset:offset + length]
+            pos += length
+        return ret
+
+    def writev(self,
+               store: Storelike,
+               iovecs: typing.Union[int, typing.Sequence[typing.Tuple[int, int]]],
+               buffers: typing.Any,
+               count: typing.Optional[int] = None) -> int:
+        """
+        Scatters `buffers` into the segments of this memory described by
+        `iovecs`, which are interpreted the same way as for `readv`.
+
+        `buffers` is either a single object supporting the buffer protocol,
+        which fills the segments in order until it's exhausted, or a list or
+        tuple with one buffer per segment, each of which must fit within its
+        segment.
+
+        Everything is validated before any data is copied, raising an
+        `IndexError` if a segment is out of bounds or a buffer doesn't fit.
+        Returns the number of bytes written.
+        """
+        guest, segments = self._iovecs(store, iovecs, count)
+        copies = []
+        if isinstance(buffers, (list, tuple)):
+            if len(buffers) != len(segments):
+                raise ValueError("expected %d buffers, got %d" % (len(segments), len(buffers)))
+            for (offset, length), buf in zip(segments, buffers):
+                view = memoryview(buf).cast('B')
+                if len(view) > length:
+                    raise IndexError("buffer does not fit in iovec")
+                copies.append((offset, view))
+        else:
+            src = memoryview(buffers).cast('B')
+            pos = 0
+            for offset, length in segments:
+                length = min(length, len(src) - pos)
+                copies.append((offset, src[pos:pos + length]))
+                pos += length
+        written = 0
+        for offset, view in copies:
+            guest[offset:offset + len(view)] = view
+            written += len(view)
+        return written
+
+    def _iovecs(self,
+                store: Storelike,
+                iovecs: typing.Union[int, typing.Sequence[typing.Tuple[int, int]]],
+                count: typing.Optional[int]) -> typing.Tuple[memoryview, typing.List[typing.Tuple[int, int]]]:
+        """
+        Returns a view of this whole memory along with the `(offset, length)`
+        segments described by `iovecs`, all of which are checked to be in
+        bounds.
+        """
+        size = self.data_len(store)
+        guest = memoryview((ctypes.c_ubyte * size).from_address(self._data_address(store))).cast('B')
+        if isinstance(iovecs, int):
+            if count is None:
+                raise TypeError("expected a count for an iovec table in memory")
+            table_size = count * _IOVEC.size
+            if iovecs < 0 or count < 0 or iovecs + table_size > size:
+                raise IndexError("iovec table out of range")
+            segments = list(_IOVEC.iter_unpack(guest[iovecs:iovecs + table_size]))
+        else:
+            segments = [(offset, length) for offset, length in iovecs]
+        for offset, length in segments:
+            if offset < 0 or length < 0 or offset + length > size:
+                raise IndexError("iovec out of range")
+        return guest, segments
+
+    def _address_of(self, store: Storelike, offset: int, size: int) -> int:
+        """
+        Returns the address of the `size` bytes at `offset` in this memory,
+        raising an `IndexError` if they're out of bounds.
+        """
+        if offset < 0 or offset + size > self.data_len(store):
+            raise IndexError("index out of range")
+        return self._data_address(store) + offset
+
+    @typing.overload
+    def array(self, store: Storelike, offset: int, dtype: "_FloatTypecode", count: int) -> "memoryview[float]":
+        ...
+
+    @typing.overload
+    def array(self, store: Storelike, offset: int, dtype: "_IntTypecode", count: int) -> "memoryview[int]":
+        ...
+
+    def array(self,
+              store: Storelike,
+              offset: int,
+              dtype: typing.Union["_IntTypecode", "_FloatTypecode"],
+              count: int) -> "memoryview[typing.Any]":
+        """
+        Returns a zero-copy `memoryview` of `count` consecutive values of type
+        `dtype` in this memory starting at `offset`.
+
+        `dtype` is one of the `array` module typecodes `'b'`, `'B'`, `'h'`,
+        `'H'`, `'i'`, `'I'`, `'q'`, `'Q'`, `'f'` or `'d'`, whose sizes match
+        the wasm types on every supported platform. `'l'` and `'L'` aren't
+        accepted since their size varies between platforms. The returned view can be indexed and assigned to
+        directly, converted with `tolist()`, or wrapped without copying by
+        NumPy with `numpy.asarray(view)`. Like `get_buffer_ptr`, the view is
+        only valid until this memory is next grown.
+
+        Raises an `IndexError` if the values are out of bounds of this memory.
+        """
+        if dtype not in _ARRAY_TYPECODES:
+            raise TypeError("unsupported array typecode %r" % (dtype,))
+        itemsize = _ARRAY_TYPECODES[dtype]
+        if itemsize > 1 and sys.byteorder != 'little':
+            raise WasmtimeError("typed views of memory require a little-endian host")
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        size = itemsize * count
+        address = self._address_of(store, offset, size)
+        return memoryview((ctypes.c_ubyte * size).from_address(address)).cast('B').cast(dtype)
+
+    def struct(self,
+               store: Storelike,
+               offset: int,
+               fmt: typing.Union[str, Struct],
+               count: typing.Optional[int] = None) -> typing.Any:
+        """
+        Unpacks values in the `struct` module format `fmt` from this memory
+        starting at `offset`.
+
+        If `count` is `None` a single tuple is returned, otherwise a list of
+        `count` tuples unpacked from consecutive records. A format string
+        without a byte order prefix is interpreted as little-endian and
+        unaligned, matching WebAssembly's memory layout.
+
+        Raises an `IndexError` if the records are out of bounds of this memory.
+        """
+        if isinstance(fmt, str):
+            if fmt[:1] not in ('@', '=', '<', '>', '!'):
+                fmt = '<' + fmt
+            fmt = Struct(fmt)
+        records = 1 if count is None else count
+        if records < 0:
+            raise ValueError("count must be non-negative")
+        size = fmt.size * records
+        address = self._address_of(store, offset, size)
+        view = memoryview((ctypes.c_ubyte * size).from_address(address)).cast('B')
+        if count is None:
+            return fmt.unpack(view)
+        if size == 0:
+            return []
+        return list(fmt.iter_unpack(view))
+
+    def snapshot(self, store: Storelike, globals: typing.Iterable[Global] = ()) -> "MemorySnapshot":
+        """
+        Captures the current contents of this memory, along with the values
+        of any mutable `globals`, so they can later be reset with `restore`.
+
+        This can be used to reuse one instance for many independent requests
+        instead of creating a new instance for each.
+        """
+        data = bytes(self.get_buffer_ptr(store))
+        values = []
+        for g in globals:
+            if g.type(store).mutable:
+                values.append((g, g.value(store)))
+        return MemorySnapshot(data, values)
+
+    def restore(self, store: Storelike, snapshot: "MemorySnapshot") -> int:
+        """
+        Resets this memory and the globals captured in `snapshot` to their
+        values at the time `snapshot` was taken.
+
+        Only pages whose contents differ from the snapshot are rewritten.
+        Memory can't shrink, so if it has grown since the snapshot was taken
+        then the extra space is zeroed instead.
+
+        Returns the number of pages that were rewritten.
+        """
+        size = self.data_len(store)
+        if size < len(snapshot._data):
+            raise WasmtimeError("memory is smaller than the snapshot being restored")
+        guest = memoryview(self.get_buffer_ptr(store, size)).cast('B')
+        saved = memoryview(snapshot._data)
+        rewritten = 0
+        if guest[:len(saved)] != saved:
+            for start in range(0, len(saved), _SNAPSHOT_PAGE_SIZE):
+                end = start + _SNAPSHOT_PAGE_SIZE
+                if guest[start:end] != saved[start:end]:
+                    guest[start:end] = saved[start:end]
+                    rewritten += 1
+        if size > len(saved):
+            zeroes = bytes(_SNAPSHOT_PAGE_SIZE)
+            for start in range(len(saved), size, _SNAPSHOT_PAGE_SIZE):
+                end = min(start + _SNAPSHOT_PAGE_SIZE, size)
+                if guest[start:end] != zeroes[:end - start]:
+                    guest[start:end] = zeroes[:end - start]
+                    rewritten += 1
+        for g, value in snapshot._globals:
+            g.set_value(store, value)
+        return rewritten
+
     def data_len(self, store: Storelike) -> int:
         """
         Returns the raw byte length of this memory.
@@ -161,3 +421,168 @@ class Memory:
     def _as_extern(self) -> ffi.wasmtime_extern_t:
         union = ffi.wasmtime_extern_union(memory=self._memory)
         return ffi.wasmtime_extern_t(ffi.WASMTIME_EXTERN_MEMORY, union)
+
+
+class MemorySnapshot:
+    """
+    The saved contents of a `Memory` and some of its instance's globals,
+    created with `Memory.snapshot` and applied with `Memory.restore`.
+    """
+
+    _data: bytes
+    _globals: typing.List[typing.Tuple[Global, typing.Any]]
+
+    def __init__(self, data: bytes, globals: typing.List[typing.Tuple[Global, typing.Any]]):
+        self._data = data
+        self._globals = globals
+
+    def __len__(self) -> int:
+        """
+        Returns the number of bytes of memory captured in this snapshot.
+        """
+        return len(self._data)
+
+
+# Granularity at which `Memory.restore` compares and rewrites memory.
+_SNAPSHOT_PAGE_SIZE = 65536
+
+# Sizes of the `array` module typecodes that can be used with `Memory.array`.
+_IntTypecode = typing.Literal['b', 'B', 'h', 'H', 'i', 'I', 'q', 'Q']
+_FloatTypecode = typing.Literal['f', 'd']
+_ARRAY_TYPECODES = {code: struct.calcsize(code) for code in 'bBhHiIqQfd'}
+
+# Layout of a WASI `iovec`/`ciovec` in 32-bit guest memory.
+_IOVEC = struct.Struct('<II')
+
+
+def _copy_from(address: int, src: typing.Any, size: int) -> None:
+    """
+    Copies `size` bytes from the buffer `src` to `address`.
+    """
+    if size == 0:
+        return
+    if isinstance(src, bytes):
+        ctypes.memmove(address, src, size)
+        return
+    try:
+        ptr = ctypes.c_char.from_buffer(src)
+    except TypeError:
+        # Read-only buffers other than `bytes` can't be turned into a ctypes
+        # object without a copy, so let `memoryview` do the copy instead.
+        with memoryview(src) as view:
+            memoryview((ctypes.c_ubyte * size).from_address(address)).cast('B')[:] = view.cast('B')
+        return
+    ctypes.memmove(address, ctypes.addressof(ptr), size)
+
+
+def _read_into(dest: typing.Any, address_of: typing.Callable[[int], int]) -> int:
+    """
+    Fills the writable, contiguous buffer `dest` from the memory address
+    returned by `address_of` for its size, returning the number of bytes
+    copied.
+    """
+    with memoryview(dest) as view:
+        if view.readonly:
+            raise TypeError("expected a writable buffer")
+        if not view.contiguous:
+            raise TypeError("expected a contiguous buffer")
+        size = view.nbytes
+    address = address_of(size)
+    if size > 0:
+        ctypes.memmove(ctypes.addressof(ctypes.c_char.from_buffer(dest)), address, size)
+    return size
+
+
+def _write_from(src: typing.Any, address_of: typing.Callable[[int], int]) -> int:
+    """
+    Copies the contiguous buffer `src` to the memory address returned by
+    `address_of` for its size, returning the number of bytes copied.
+    """
+    with memoryview(src) as view:
+        if not view.contiguous:
+            raise TypeError("expected a contiguous buffer")
+        size = view.nbytes
+    _copy_from(address_of(size), src, size)
+    return size
+
+
+class MemoryView:
+    """
+    A zero-copy view of the contents of a `Memory`, created with
+    `Memory.view`.
+
+    Indexing and slicing behave like a `memoryview` of unsigned bytes and
+    operate directly on guest memory. Each access first checks that the
+    memory's base pointer and length are unchanged since the view was
+    created, raising a `WasmtimeError` otherwise. Slices returned from a view
+    are plain `memoryview` objects and are only valid until the memory is
+    next grown.
+
+    On Python 3.12 and later a `MemoryView` also implements the buffer
+    protocol, so it can be passed to anything accepting a bytes-like object.
+    """
+
+    _memory: Memory
+    _store: Storelike
+    _base: int
+    _view: typing.Optional[memoryview]
+
+    def __init__(self, memory: Memory, store: Storelike):
+        self._memory = memory
+        self._store = store
+        self._base = memory._data_address(store)
+        self._view = memoryview(memory.get_buffer_ptr(store)).cast('B')
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns whether this view still covers the whole of its memory, meaning
+        that it hasn't been released and the memory hasn't grown or moved.
+        """
+        if self._view is None:
+            return False
+        try:
+            base = self._memory._data_address(self._store)
+            size = self._memory.data_len(self._store)
+        except WasmtimeError:
+            return False
+        return base == self._base and size == len(self._view)
+
+    def _check(self) -> memoryview:
+        if self._view is None:
+            raise ValueError('operation forbidden on released memory view')
+        if not self.valid:
+            raise WasmtimeError('memory has grown or moved since this view was created')
+        return self._view
+
+    def __len__(self) -> int:
+        return len(self._check())
+
+    def __getitem__(self, key: typing.Union[int, slice]) -> typing.Any:
+        return self._check()[key]
+
+    def __setitem__(self, key: typing.Union[int, slice], value: typing.Any) -> None:
+        self._check()[key] = value
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._check()
+
+    def tobytes(self) -> bytes:
+        """
+        Returns a copy of the contents of this view as `bytes`.
+        """
+        return self._check().tobytes()
+
+    def release(self) -> None:
+        """
+        Releases this view. Further accesses raise a `ValueError`.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+    def __enter__(self) -> "MemoryView":
+        return self
+
+    def __exit__(self, *exc: typing.Any) -> None:
+        self.release()
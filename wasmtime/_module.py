@@ -2,9 +2,36 @@ from . import _ffi as ffi
 from ._wat2wasm import _to_wasm
 import ctypes
 from wasmtime import Engine, wat2wasm, ImportType, ExportType, WasmtimeError, Managed
+import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from os import PathLike
 
+if typing.TYPE_CHECKING:
+    from ._module_cache import ModuleCache
+
+T = typing.TypeVar('T')
+S = typing.TypeVar('S')
+
+# A module or component to compile with `compile_many`: either its binary or
+# text contents, or the path to a file containing it.
+CompileSource = typing.Union[str, bytes, bytearray, PathLike]
+
+
+@dataclass
+class CompileResult(typing.Generic[T]):
+    """
+    The outcome of compiling one source with `Module.compile_many` or
+    `Component.compile_many`.
+
+    Exactly one of `value` and `error` is not `None`: `error` is the
+    exception, typically a `WasmtimeError`, raised while reading or compiling
+    the source.
+    """
+    value: typing.Optional[T]
+    error: typing.Optional[Exception]
+
 
 class Module(Managed["ctypes._Pointer[ffi.wasmtime_module_t]"]):
 
@@ -19,6 +46,30 @@ class Module(Managed["ctypes._Pointer[ffi.wasmtime_module_t]"]):
             contents = f.read()
         return cls(engine, contents)
 
+    @classmethod
+    def compile_many(cls,
+                     engine: Engine,
+                     sources: typing.Iterable[CompileSource],
+                     max_workers: typing.Optional[int] = None,
+                     cache: typing.Optional["ModuleCache"] = None) -> typing.List[CompileResult["Module"]]:
+        """
+        Compiles many modules in parallel on a pool of `max_workers` threads,
+        defaulting to one per CPU.
+
+        Each source is either the binary or text format of a module, or a
+        `PathLike` naming a file to read it from. If `cache` is given then
+        modules are loaded from, and added to, that `ModuleCache`.
+
+        Returns one `CompileResult` per source, in order. An error reading or
+        compiling one source is recorded in its result rather than aborting
+        the others.
+        """
+        def load(wasm: typing.Union[str, bytes]) -> "Module":
+            if cache is not None:
+                return cache.load(engine, wasm)
+            return cls(engine, wasm)
+        return _compile_many(load, sources, max_workers)
+
     def __init__(self, engine: Engine, wasm: typing.Union[str, bytes]):
         if not isinstance(engine, Engine):
             raise TypeError("expected an Engine")
@@ -46,7 +97,7 @@ class Module(Managed["ctypes._Pointer[ffi.wasmtime_module_t]"]):
         return ty
 
     @classmethod
-    def deserialize(cls, engine: Engine, encoded: typing.Union[bytes, bytearray]) -> 'Module':
+    def deserialize(cls, engine: Engine, encoded: typing.Any) -> 'Module':
         """
         Deserializes bytes previously created by `Module.serialize`.
 
@@ -54,20 +105,15 @@ class Module(Managed["ctypes._Pointer[ffi.wasmtime_module_t]"]):
         by a serialized module. This will only succeed if the bytes were
         previously created by the same version of `wasmtime` as well as the
         same configuration within `Engine`.
-        """
 
-        if not isinstance(encoded, (bytes, bytearray)):
-            raise TypeError("expected bytes")
+        `encoded` may be any object supporting the buffer protocol, such as
+        `bytes`, a `memoryview` or an `mmap.mmap`, and its contents are passed
+        to wasmtime without being copied.
+        """
 
         ptr = ctypes.POINTER(ffi.wasmtime_module_t)()
-
-        # TODO: can the copy be avoided here? I can't for the life of me
-        # figure this out.
-        error = ffi.wasmtime_module_deserialize(
-            engine.ptr(),
-            (ctypes.c_uint8 * len(encoded)).from_buffer_copy(encoded),
-            len(encoded),
-            ctypes.byref(ptr))
+        with ffi.borrow_buffer(encoded) as (buf, size):
+            error = ffi.wasmtime_module_deserialize(engine.ptr(), buf, size, ctypes.byref(ptr))
         if error:
             raise WasmtimeError._from_ptr(error)
         return cls._from_ptr(ptr)
@@ -154,6 +200,28 @@ class Module(Managed["ctypes._Pointer[ffi.wasmtime_module_t]"]):
         return ret
 
 
+def _compile_many(load: typing.Callable[[typing.Union[str, bytes]], S],
+                  sources: typing.Iterable[CompileSource],
+                  max_workers: typing.Optional[int]) -> typing.List[CompileResult[S]]:
+    """
+    Runs `load` over the contents of each of `sources` on a thread pool.
+
+    Compilation happens within the C API, which doesn't hold the GIL, so
+    sources compile truly in parallel.
+    """
+    def run(source: CompileSource) -> CompileResult[S]:
+        try:
+            if isinstance(source, PathLike):
+                with open(source, "rb") as f:
+                    source = f.read()
+            return CompileResult(load(bytes(source) if isinstance(source, bytearray) else source), None)
+        except Exception as e:
+            return CompileResult(None, e)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1, thread_name_prefix='wasmtime-compile') as executor:
+        return list(executor.map(run, sources))
+
+
 class ImportTypeList:
     def __init__(self) -> None:
         self.vec = ffi.wasm_importtype_vec_t(0, None)
@@ -0,0 +1,218 @@
+import hashlib
+import os
+import tempfile
+import threading
+import typing
+import weakref
+from os import PathLike
+
+from wasmtime import Engine, Module, WasmtimeError
+from ._wat2wasm import _to_wasm
+
+if typing.TYPE_CHECKING:
+    from .component import Component
+
+T = typing.TypeVar('T', Module, "Component")
+
+# Extension of the artifacts written by `ModuleCache`.
+_SUFFIX = '.cwasm'
+
+# Fingerprints of engines computed by `_engine_fingerprint`.
+_FINGERPRINTS: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+_FINGERPRINTS_LOCK = threading.Lock()
+
+
+class ModuleCache:
+    """
+    An on-disk cache of compiled modules and components.
+
+    Artifacts are keyed by the SHA-256 of the wasm binary along with a
+    fingerprint of the `Engine` compiling it, which covers the version of
+    wasmtime, the compilation target and the settings of the engine's
+    `Config`. Changing any of these therefore results in a cache miss rather
+    than a failure to load a stale artifact.
+
+    Cached artifacts are loaded with `Module.deserialize_file`, which maps
+    them into memory instead of reading them. Note that deserialization trusts
+    its input, so the cache directory must not be writable by untrusted
+    parties.
+    """
+
+    _directory: str
+    _max_size: typing.Optional[int]
+
+    def __init__(self, directory: typing.Union[str, PathLike], max_size: typing.Optional[int] = None):
+        """
+        Creates a cache which stores artifacts in `directory`, creating it if
+        it doesn't exist.
+
+        If `max_size` is given then, whenever an artifact is added, the least
+        recently used artifacts are removed until the cache holds at most
+        `max_size` bytes.
+        """
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size must be non-negative")
+        self._directory = os.fspath(directory)
+        self._max_size = max_size
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """
+        Returns the directory in which artifacts are stored.
+        """
+        return self._directory
+
+    def load(self, engine: Engine, wasm: typing.Union[str, bytes]) -> Module:
+        """
+        Returns the `Module` for `wasm`, which may also be the text format,
+        deserializing it from the cache or compiling and caching it.
+        """
+        return self._load(engine, _to_wasm(wasm), Module)
+
+    def load_file(self, engine: Engine, path: typing.Union[str, bytes, PathLike]) -> Module:
+        """
+        Same as `load`, but reads the module from the file at `path`.
+        """
+        with open(path, "rb") as f:
+            return self.load(engine, f.read())
+
+    def load_component(self, engine: Engine, wasm: typing.Union[str, bytes]) -> "Component":
+        """
+        Same as `load`, but for a `wasmtime.component.Component`.
+        """
+        from .component import Component
+        return self._load(engine, _to_wasm(wasm), Component)
+
+    def load_component_file(self, engine: Engine, path: typing.Union[str, bytes, PathLike]) -> "Component":
+        """
+        Same as `load_component`, but reads the component from the file at
+        `path`.
+        """
+        with open(path, "rb") as f:
+            return self.load_component(engine, f.read())
+
+    def path(self, engine: Engine, wasm: typing.Union[str, bytes], component: bool = False) -> str:
+        """
+        Returns the path at which the artifact for `wasm` compiled by `engine`
+        is, or would be, stored.
+        """
+        return self._path(engine, _to_wasm(wasm), 'component' if component else 'module')
+
+    def size(self) -> int:
+        """
+        Returns the total size, in bytes, of all artifacts in this cache.
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, max_size: typing.Optional[int] = None) -> int:
+        """
+        Removes the least recently used artifacts until this cache holds at
+        most `max_size` bytes, defaulting to the size given when creating the
+        cache. Returns the number of artifacts removed.
+        """
+        if max_size is None:
+            max_size = self._max_size
+        if max_size is None:
+            return 0
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in entries:
+            if total <= max_size:
+                break
+            _remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all artifacts from this cache.
+        """
+        for _, path, _ in self._entries():
+            _remove(path)
+
+    def _load(self, engine: Engine, wasm: bytes, cls: typing.Type[T]) -> T:
+        path = self._path(engine, wasm, 'module' if cls is Module else 'component')
+        if os.path.exists(path):
+            try:
+                ret = cls.deserialize_file(engine, path)
+            except WasmtimeError:
+                # A corrupt or truncated artifact; recompile it below.
+                _remove(path)
+            else:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return ret
+        ret = cls(engine, wasm)
+        self._store(path, ret.serialize())
+        return ret
+
+    def _path(self, engine: Engine, wasm: bytes, kind: str) -> str:
+        h = hashlib.sha256()
+        h.update(kind.encode('utf-8'))
+        h.update(b'\0')
+        h.update(_engine_fingerprint(engine).encode('utf-8'))
+        h.update(b'\0')
+        h.update(hashlib.sha256(wasm).digest())
+        return os.path.join(self._directory, h.hexdigest() + _SUFFIX)
+
+    def _store(self, path: str, data: bytearray) -> None:
+        _write_atomic(path, data)
+        if self._max_size is not None:
+            self.evict()
+
+    def _entries(self) -> typing.List[typing.Tuple[float, str, int]]:
+        ret = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            ret.append((stat.st_mtime, entry.path, stat.st_size))
+        return ret
+
+
+def _engine_fingerprint(engine: Engine) -> str:
+    """
+    Returns a string identifying everything about `engine` which affects the
+    compatibility of its compiled artifacts.
+
+    The C API doesn't expose this directly, but every serialized artifact
+    embeds the wasmtime version, target and compiler settings it was created
+    with, so the hash of a serialized empty module serves the same purpose.
+    """
+    with _FINGERPRINTS_LOCK:
+        fingerprint = _FINGERPRINTS.get(engine)
+        if fingerprint is None:
+            artifact = Module(engine, b'\0asm\1\0\0\0').serialize()
+            fingerprint = hashlib.sha256(artifact).hexdigest()
+            _FINGERPRINTS[engine] = fingerprint
+        return fingerprint
+
+
+def _write_atomic(path: str, data: typing.Union[bytes, bytearray]) -> None:
+    """
+    Writes `data` to `path` such that concurrent readers only ever see either
+    the previous file or the complete new one.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        _remove(tmp)
+        raise
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,140 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from wasmtime import Engine, Module, Store, Instance, Linker, MemoryType, Func, TypedFunc, WasmtimeError
+from ._exportable import AsExtern
+from ._sharedmemory import SharedMemory
+
+
+@dataclass
+class ChunkResult:
+    """
+    The outcome of running one range of indices with `SharedMemoryPool.map`.
+
+    Exactly one of `value` and `error` is meaningful: `error` is the exception,
+    typically a `Trap`, raised while processing the range, or `None` if it
+    completed and returned `value`.
+    """
+    start: int
+    stop: int
+    value: Any
+    error: Optional[Exception]
+
+
+class SharedMemoryPool:
+    """
+    A pool of worker threads which each run their own instance of a module,
+    all sharing one `SharedMemory`.
+
+    This allows a computation over a dataset held in shared memory to be
+    spread across many cores without copying the data. Each worker thread
+    lazily creates its own `Store` and instance the first time it's given
+    work.
+    """
+
+    _engine: Engine
+    _module: Module
+    _memory: SharedMemory
+    _linker: Optional[Linker]
+    _workers: int
+    _local: threading.local
+    _executor: ThreadPoolExecutor
+
+    def __init__(self,
+                 engine: Engine,
+                 module: Module,
+                 memory: SharedMemory,
+                 workers: Optional[int] = None,
+                 linker: Optional[Linker] = None):
+        """
+        Creates a pool of `workers` threads, defaulting to one per CPU.
+
+        Without a `linker` the only import `module` may have is a memory,
+        which is satisfied with `memory`. Otherwise each worker instantiates
+        `module` with `linker`, in which `memory` and any other imports must
+        already be defined.
+        """
+        if linker is None:
+            for item in module.imports:
+                if not isinstance(item.type, MemoryType):
+                    raise WasmtimeError("a Linker is required to satisfy non-memory import `%s`" % item.name)
+        self._engine = engine
+        self._module = module
+        self._memory = memory
+        self._linker = linker
+        self._workers = workers or os.cpu_count() or 1
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='wasmtime-pool')
+
+    @property
+    def workers(self) -> int:
+        """
+        Returns the number of worker threads in this pool.
+        """
+        return self._workers
+
+    def map(self, name: str, count: int, chunk_size: Optional[int] = None) -> List[ChunkResult]:
+        """
+        Calls the export `name` with `(start, stop)` for consecutive ranges
+        covering the indices `0` through `count`, spread across the workers.
+
+        Ranges are `chunk_size` long, defaulting to an equal share per worker.
+        Returns one `ChunkResult` per range, in order. A trap or other error in
+        one range is recorded in its result rather than aborting the others.
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        if chunk_size is None:
+            chunk_size = max(1, -(-count // self._workers))
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        futures = [
+            self._executor.submit(self._run, name, start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)
+        ]
+        return [future.result() for future in futures]
+
+    def _run(self, name: str, start: int, stop: int) -> ChunkResult:
+        try:
+            store, func = self._func(name)
+            return ChunkResult(start, stop, func(store, start, stop), None)
+        except Exception as e:
+            return ChunkResult(start, stop, None, e)
+
+    def _func(self, name: str) -> Tuple[Store, TypedFunc]:
+        local = self._local
+        funcs: Optional[Dict[str, TypedFunc]] = getattr(local, 'funcs', None)
+        if funcs is None:
+            store = Store(self._engine)
+            if self._linker is None:
+                imports: List[AsExtern] = [self._memory for _ in self._module.imports]
+                instance = Instance(store, self._module, imports)
+            else:
+                instance = self._linker.instantiate(store, self._module)
+            funcs = {}
+            local.store = store
+            local.instance = instance
+            local.funcs = funcs
+        store = local.store
+        func = funcs.get(name)
+        if func is None:
+            export = local.instance.exports(store)[name]
+            if not isinstance(export, Func):
+                raise WasmtimeError("export `%s` is not a function" % name)
+            func = funcs[name] = export.typed(store)
+        return store, func
+
+    def close(self) -> None:
+        """
+        Waits for outstanding work and shuts down the worker threads.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "SharedMemoryPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,11 +1,12 @@
 from . import _ffi as ffi
 import ctypes
-from typing import Optional, Any
-from wasmtime import MemoryType, WasmtimeError, Engine, Managed
+import threading
+from typing import Optional, Any, Dict, Union
+from wasmtime import MemoryType, WasmtimeError, Engine, Managed, Module, Store, Instance, Func, TypedFunc
+from ._memory import _copy_from, _read_into, _write_from
 from ._store import Storelike
 
 
-
 class SharedMemory(Managed["ctypes._Pointer[ffi.wasmtime_sharedmemory_t]"]):
     def __init__(self, engine: Engine, ty: MemoryType):
         """
@@ -56,7 +57,7 @@ class SharedMemory(Managed["ctypes._Pointer[ffi.wasmtime_sharedmemory_t]"]):
         Returns the size, in WebAssembly pages, of this shared memory.
         """
 
-        return ffi.wasmtime_sharedmemory_size(ctypes.byref(self.ptr()))
+        return ffi.wasmtime_sharedmemory_size(self.ptr())
 
     def data_ptr(self) -> "ctypes._Pointer[ctypes.c_ubyte]":
         """
@@ -74,6 +75,210 @@ class SharedMemory(Managed["ctypes._Pointer[ffi.wasmtime_sharedmemory_t]"]):
 
         return ffi.wasmtime_sharedmemory_data_size(self.ptr())
 
+    def get_buffer_ptr(self, size: Optional[int] = None, offset: int = 0) -> ctypes.Array:
+        """
+        Returns a ctypes array over the contents of this shared memory, in the
+        same way as `Memory.get_buffer_ptr`.
+        """
+        if size is None:
+            size = self.data_len()
+        ptr_type = ctypes.c_ubyte * size
+        return ptr_type.from_address(self._data_address() + offset)
+
+    def view(self) -> memoryview:
+        """
+        Returns a zero-copy `memoryview` of the current contents of this
+        shared memory.
+
+        Shared memories never move when they grow, so the view remains valid
+        for as long as this memory is alive, but it doesn't cover any space
+        added by later calls to `grow`. Accesses through the view are not
+        atomic; use `SharedMemoryAtomics` to synchronize with other threads.
+        """
+        return memoryview(self.get_buffer_ptr()).cast('B')
+
+    def read(self, start: Optional[int] = 0, stop: Optional[int] = None) -> bytearray:
+        """
+        Reads this memory from `start` up to `stop`, with the same slicing
+        behavior as `Memory.read`, and returns a copy as a `bytearray`.
+        """
+        start, stop, _ = slice(start, stop).indices(self.data_len())
+        if stop <= start:
+            return bytearray(0)
+        return bytearray(self.get_buffer_ptr(stop - start, start))
+
+    def write(self, value: Union[bytearray, bytes], start: Optional[int] = None) -> int:
+        """
+        Writes `value` into this memory at `start`, with the same behavior as
+        `Memory.write`, and returns the number of bytes written.
+        """
+        size = self.data_len()
+        start = slice(start, None).indices(size)[0]
+        if start >= size or start + len(value) > size:
+            raise IndexError("index out of range")
+        _copy_from(self._data_address() + start, value, len(value))
+        return len(value)
+
+    def read_into(self, dest: Any, offset: int = 0) -> int:
+        """
+        Fills the writable buffer `dest` with the contents of this memory
+        starting at `offset`, as with `Memory.read_into`.
+        """
+        return _read_into(dest, lambda size: self._address_of(offset, size))
+
+    def write_from(self, src: Any, offset: int = 0) -> int:
+        """
+        Writes the contents of the buffer `src` into this memory starting at
+        `offset`, as with `Memory.write_from`.
+        """
+        return _write_from(src, lambda size: self._address_of(offset, size))
+
+    def _data_address(self) -> int:
+        return ctypes.cast(self.data_ptr(), ctypes.c_void_p).value or 0
+
+    def _address_of(self, offset: int, size: int) -> int:
+        if offset < 0 or offset + size > self.data_len():
+            raise IndexError("index out of range")
+        return self._data_address() + offset
+
     def _as_extern(self) -> ffi.wasmtime_extern_t:
-        union = ffi.wasmtime_extern_union(sharedmemory=ctypes.pointer(self.ptr()))
+        union = ffi.wasmtime_extern_union(sharedmemory=self.ptr())
         return ffi.wasmtime_extern_t(ffi.WASMTIME_EXTERN_SHAREDMEMORY, union)
+
+
+class SharedMemoryAtomics:
+    """
+    Host-side atomic operations on a `SharedMemory` which interoperate with
+    the atomic instructions, `memory.atomic.wait` and `memory.atomic.notify`
+    used by multi-threaded wasm guests.
+
+    Each operation is performed by a small wasm module which imports the
+    shared memory, so it uses exactly the same atomic instructions as the
+    guests. Every host thread lazily gets its own `Store` and instance of this
+    module, so an instance of this class can be shared between threads. The
+    engine must have both `Config.wasm_threads` and `Config.shared_memory`
+    enabled.
+
+    Offsets must be naturally aligned for the width of the access, otherwise
+    a `Trap` is raised. 32-bit values are returned as signed integers, as in
+    wasm.
+    """
+
+    _engine: Engine
+    _memory: SharedMemory
+    _module: Module
+    _local: threading.local
+
+    def __init__(self, engine: Engine, memory: SharedMemory):
+        ty = memory.type()
+        limits = ty.limits
+        index = 'i64' if ty.is_64 else 'i32'
+        self._engine = engine
+        self._memory = memory
+        self._module = Module(engine, _ATOMICS_WAT.format(index=index, max=limits.max))
+        self._local = threading.local()
+
+    def _exports(self) -> Dict[str, TypedFunc]:
+        exports: Optional[Dict[str, TypedFunc]] = getattr(self._local, 'exports', None)
+        if exports is None:
+            store = Store(self._engine)
+            instance = Instance(store, self._module, [self._memory])
+            exports = {}
+            for name, item in instance.exports(store).items():
+                assert(isinstance(item, Func))
+                exports[name] = item.typed(store)
+            self._local.store = store
+            self._local.exports = exports
+        return exports
+
+    def _call(self, name: str, *args: Any) -> int:
+        ret: int = self._exports()[name](self._local.store, *args)
+        return ret
+
+    def load(self, offset: int, width: int = 32) -> int:
+        """
+        Atomically loads the `width`-bit integer at `offset`.
+        """
+        return self._call('load%d' % _check_width(width), offset)
+
+    def store(self, offset: int, value: int, width: int = 32) -> None:
+        """
+        Atomically stores `value` as a `width`-bit integer at `offset`.
+        """
+        self._call('store%d' % _check_width(width), offset, value)
+
+    def add(self, offset: int, value: int, width: int = 32) -> int:
+        """
+        Atomically adds `value` to the `width`-bit integer at `offset`,
+        returning its previous value.
+        """
+        return self._call('add%d' % _check_width(width), offset, value)
+
+    def compare_exchange(self, offset: int, expected: int, replacement: int, width: int = 32) -> int:
+        """
+        Atomically replaces the `width`-bit integer at `offset` with
+        `replacement` if it's currently equal to `expected`.
+
+        Returns the previous value, which equals `expected` if the exchange
+        happened.
+        """
+        return self._call('cmpxchg%d' % _check_width(width), offset, expected, replacement)
+
+    def wait(self, offset: int, expected: int, timeout: Optional[float] = None, width: int = 32) -> str:
+        """
+        Blocks the calling thread until it's woken by a `notify` on `offset`,
+        either from the host or from a guest's `memory.atomic.notify`.
+
+        If the `width`-bit integer at `offset` isn't equal to `expected` then
+        this returns `"not-equal"` immediately. Otherwise it returns `"ok"`
+        once woken, or `"timed-out"` if `timeout`, in seconds, elapses first.
+        """
+        nanos = -1 if timeout is None else int(timeout * 1e9)
+        ret = self._call('wait%d' % _check_width(width), offset, expected, nanos)
+        return _WAIT_RESULTS[ret]
+
+    def notify(self, offset: int, count: Optional[int] = None) -> int:
+        """
+        Wakes up to `count` threads, or all of them if `count` is `None`,
+        which are waiting on `offset`. Returns the number of threads woken.
+        """
+        if count is None:
+            count = 0xffffffff
+        return self._call('notify', offset, ctypes.c_int32(count).value)
+
+
+def _check_width(width: int) -> int:
+    if width not in (32, 64):
+        raise WasmtimeError("atomic accesses must be 32 or 64 bits wide")
+    return width
+
+
+_WAIT_RESULTS = ['ok', 'not-equal', 'timed-out']
+
+_ATOMICS_WAT = """
+    (module
+        (import "" "memory" (memory {index} 0 {max} shared))
+        (func (export "load32") (param {index}) (result i32)
+            (i32.atomic.load (local.get 0)))
+        (func (export "load64") (param {index}) (result i64)
+            (i64.atomic.load (local.get 0)))
+        (func (export "store32") (param {index} i32)
+            (i32.atomic.store (local.get 0) (local.get 1)))
+        (func (export "store64") (param {index} i64)
+            (i64.atomic.store (local.get 0) (local.get 1)))
+        (func (export "add32") (param {index} i32) (result i32)
+            (i32.atomic.rmw.add (local.get 0) (local.get 1)))
+        (func (export "add64") (param {index} i64) (result i64)
+            (i64.atomic.rmw.add (local.get 0) (local.get 1)))
+        (func (export "cmpxchg32") (param {index} i32 i32) (result i32)
+            (i32.atomic.rmw.cmpxchg (local.get 0) (local.get 1) (local.get 2)))
+        (func (export "cmpxchg64") (param {index} i64 i64) (result i64)
+            (i64.atomic.rmw.cmpxchg (local.get 0) (local.get 1) (local.get 2)))
+        (func (export "wait32") (param {index} i32 i64) (result i32)
+            (memory.atomic.wait32 (local.get 0) (local.get 1) (local.get 2)))
+        (func (export "wait64") (param {index} i64 i64) (result i32)
+            (memory.atomic.wait64 (local.get 0) (local.get 1) (local.get 2)))
+        (func (export "notify") (param {index} i32) (result i32)
+            (memory.atomic.notify (local.get 0) (local.get 1)))
+    )
+"""
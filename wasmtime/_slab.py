@@ -1,3 +1,4 @@
+import threading
 from typing import Generic, List, Union, cast, TypeVar
 
 
@@ -6,27 +7,36 @@ T = TypeVar('T')
 
 class Slab(Generic[T]):
     list: List[Union[int, T]]
-    next: int
+    free: List[int]
+    lock: threading.RLock
 
     def __init__(self) -> None:
         self.list = []
-        self.next = 0
+        self.free = []
+        # Slabs are shared by all stores, which may be used on different
+        # threads, so allocation is guarded by a lock. This is reentrant
+        # since finalizers which deallocate can run from a garbage collection
+        # triggered while the lock is held, which is only safe because every
+        # update to `list` and `free` below is a single operation that such a
+        # `deallocate` can't observe half-done.
+        self.lock = threading.RLock()
 
     def allocate(self, val: T) -> int:
-        idx = self.next
-
-        if len(self.list) == idx:
-            self.list.append(0)
-            self.next += 1
-        else:
-            self.next = cast(int, self.list[idx])
-
-        self.list[idx] = val
-        return idx
+        with self.lock:
+            # A reentrant `deallocate` may push onto `free` at any point here,
+            # but only this method removes from it or grows `list`.
+            if self.free:
+                idx = self.free.pop()
+                self.list[idx] = val
+            else:
+                idx = len(self.list)
+                self.list.append(val)
+            return idx
 
     def get(self, idx: int) -> T:
         return cast(T, self.list[idx])
 
     def deallocate(self, idx: int) -> None:
-        self.list[idx] = self.next
-        self.next = idx
+        with self.lock:
+            self.list[idx] = 0
+            self.free.append(idx)
@@ -1,9 +1,13 @@
 from . import _ffi as ffi
-from ctypes import byref, c_uint64, cast, c_void_p, CFUNCTYPE
+from ctypes import byref, c_uint64, c_size_t, cast, c_void_p, CFUNCTYPE, POINTER
 import ctypes
 from wasmtime import Engine, WasmtimeError, Managed
 from . import _value as value
+from ._slab import Slab
+import contextlib
+import math
 import typing
+import weakref
 
 if typing.TYPE_CHECKING:
     from ._wasi import WasiConfig
@@ -26,6 +30,13 @@ class Store(Managed["ctypes._Pointer[ffi.wasmtime_store_t]"]):
         self._set_ptr(ffi.wasmtime_store_new(engine.ptr(), data_id, finalize))
         self.__context = ffi.wasmtime_store_context(self.ptr())
         self.engine = engine
+        # The epoch at which this store's deadline expires, since the C API
+        # can't read it back, or `None` if it's wasmtime's default or has
+        # since been moved by wasmtime itself.
+        self._epoch_deadline: typing.Optional[int] = None
+        # The epoch at which the innermost `deadline` expires, past which an
+        # epoch deadline callback may not extend the deadline.
+        self._deadline_limit: typing.Optional[int] = None
 
     def _delete(self, ptr: "ctypes._Pointer[ffi.wasmtime_store_t]") -> None:
         ffi.wasmtime_store_delete(ptr)
@@ -112,6 +123,102 @@ class Store(Managed["ctypes._Pointer[ffi.wasmtime_store_t]"]):
         epoch, after which WebAssembly code will trap.
         """
         ffi.wasmtime_context_set_epoch_deadline(self._context(), ticks_after_current)
+        self._epoch_deadline = self.engine._epoch + ticks_after_current
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> typing.Iterator[None]:
+        """
+        Context manager which makes wasm executing in this store trap once
+        `seconds` have elapsed on the wall clock.
+
+        This requires `Config.epoch_interruption` and a timer started with
+        `Engine.start_epoch_timer`, and the deadline is rounded up to a whole
+        number of the timer's ticks.
+
+        If this store's deadline was last set by `set_epoch_deadline` or by an
+        enclosing `deadline` then the earlier of the two applies, and that
+        deadline is restored on exit. Otherwise, including after
+        `epoch_deadline_async_yield_and_update` lets wasmtime move the
+        deadline, this deadline applies alone and the store is left with a
+        deadline of zero ticks on exit, which is also the default of a new
+        store.
+        """
+        engine = self.engine
+        interval = engine.epoch_timer_interval
+        if interval is None:
+            raise WasmtimeError("deadlines require an epoch timer, see `Engine.start_epoch_timer`")
+        previous = self._epoch_deadline
+        previous_limit = self._deadline_limit
+        limit = engine._epoch + max(1, math.ceil(seconds / interval))
+        if previous_limit is not None:
+            limit = min(limit, previous_limit)
+        deadline = limit if previous is None else min(limit, previous)
+        self.set_epoch_deadline(max(deadline - engine._epoch, 0))
+        self._deadline_limit = limit
+        try:
+            yield
+        finally:
+            self._deadline_limit = previous_limit
+            if previous is not None:
+                self.set_epoch_deadline(max(previous - engine._epoch, 0))
+            else:
+                self.set_epoch_deadline(0)
+                self._epoch_deadline = None
+
+    def fuel_async_yield_interval(self, interval: int) -> None:
+        """
+        Configures asynchronous calls, such as `Func.call_async`, to yield
+        back to the event loop every time `interval` units of fuel have been
+        consumed.
+
+        This is only relevant when `Config.consume_fuel` is configured. A value
+        of 0 disables yielding.
+
+        Raises a `WasmtimeError` if this store's configuration is not configured
+        to consume fuel.
+        """
+        err = ffi.wasmtime_context_fuel_async_yield_interval(self._context(), interval)
+        if err:
+            raise WasmtimeError._from_ptr(err)
+
+    def epoch_deadline_async_yield_and_update(self, delta: int) -> None:
+        """
+        Configures asynchronous calls, such as `Func.call_async`, to yield
+        back to the event loop when the epoch deadline is reached instead of
+        trapping. After yielding the deadline is extended by `delta` ticks.
+
+        This is only relevant when `Config.epoch_interruption` is configured.
+        """
+        # Despite its binding this returns nothing, so its result is garbage.
+        ffi.wasmtime_context_epoch_deadline_async_yield_and_update(self._context(), delta)
+        # Wasmtime now extends the deadline itself, so it's no longer known.
+        self._epoch_deadline = None
+
+    def set_epoch_deadline_callback(self, callback: typing.Callable[["StoreContext"], typing.Union[int, "UpdateDeadline"]]) -> None:
+        """
+        Configures `callback` to be invoked whenever wasm in this store reaches
+        its epoch deadline, instead of trapping.
+
+        The callback is given a `StoreContext` for this store, valid only for
+        the duration of the callback. It returns how to proceed: an `int`, or
+        `UpdateDeadline.continue_`, to keep executing with the deadline
+        extended by that many ticks, or `UpdateDeadline.yield_` to also yield
+        back to the event loop during asynchronous calls such as
+        `Func.call_async`. Raising an exception traps, and the exception is
+        re-raised from the original call into wasm.
+
+        Within `Store.deadline`, including calls made with a `timeout`, the
+        deadline is never extended past that of the `deadline` block, and wasm
+        traps once it's reached without invoking the callback.
+
+        This is only relevant when `Config.epoch_interruption` is configured.
+        """
+        idx = EPOCH_CALLBACKS.allocate((callback, weakref.ref(self)))
+        ffi.wasmtime_store_epoch_deadline_callback(
+            self.ptr(),
+            _epoch_deadline_callback,
+            idx,
+            _epoch_deadline_callback_finalize)
 
     def set_limits(self,
                    memory_size: int = -1,
@@ -147,6 +254,78 @@ class Store(Managed["ctypes._Pointer[ffi.wasmtime_store_t]"]):
         ffi.wasmtime_store_limiter(self.ptr(), memory_size, table_elements, instances, tables, memories)
 
 
+class UpdateDeadline:
+    """
+    What to do after an epoch deadline callback, registered with
+    `Store.set_epoch_deadline_callback`, returns.
+    """
+
+    delta: int
+    kind: int
+
+    def __init__(self, delta: int, kind: int):
+        self.delta = delta
+        self.kind = kind
+
+    @classmethod
+    def continue_(cls, delta: int) -> "UpdateDeadline":
+        """
+        Continue executing wasm with the deadline extended by `delta` ticks.
+        """
+        return UpdateDeadline(delta, _UPDATE_DEADLINE_CONTINUE)
+
+    @classmethod
+    def yield_(cls, delta: int) -> "UpdateDeadline":
+        """
+        Yield to the event loop, then continue executing wasm with the deadline
+        extended by `delta` ticks. Only valid during asynchronous calls.
+        """
+        return UpdateDeadline(delta, _UPDATE_DEADLINE_YIELD)
+
+
+# Values of `wasmtime_update_deadline_kind_t`.
+_UPDATE_DEADLINE_CONTINUE = 0
+_UPDATE_DEADLINE_YIELD = 1
+
+EPOCH_CALLBACKS: Slab[typing.Tuple[typing.Callable, "weakref.ref[Store]"]] = Slab()
+
+
+@CFUNCTYPE(c_size_t, POINTER(ffi.wasmtime_context_t), c_void_p, POINTER(c_uint64), POINTER(ffi.wasmtime_update_deadline_kind_t))
+def _epoch_deadline_callback(context, idx, delta_ret, kind_ret):  # type: ignore
+    store = StoreContext(context)
+    try:
+        callback, owner = EPOCH_CALLBACKS.get(idx or 0)
+        pystore = owner()
+        limit = None if pystore is None else pystore._deadline_limit
+        if limit is not None and pystore is not None and pystore.engine._epoch >= limit:
+            from ._trap import Trap
+            raise Trap("deadline of `Store.deadline` reached")
+        ret = callback(store)
+        if not isinstance(ret, UpdateDeadline):
+            ret = UpdateDeadline.continue_(ret)
+        delta = ret.delta
+        if pystore is not None:
+            epoch = pystore.engine._epoch
+            if limit is not None:
+                delta = max(min(delta, limit - epoch), 0)
+            pystore._epoch_deadline = epoch + delta
+        delta_ret[0] = delta
+        kind_ret[0] = ret.kind
+        return 0
+    except BaseException as e:
+        from ._func import STATE
+        STATE.last_exception = e
+        error = WasmtimeError("python exception")._consume()
+        return cast(error, c_void_p).value
+    finally:
+        store._invalidate()
+
+
+@CFUNCTYPE(None, c_void_p)
+def _epoch_deadline_callback_finalize(idx):  # type: ignore
+    EPOCH_CALLBACKS.deallocate(idx or 0)
+
+
 class StoreContext:
     __ptr: typing.Optional["ctypes._Pointer[ffi.wasmtime_context_t]"]
 
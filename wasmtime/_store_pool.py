@@ -0,0 +1,176 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from wasmtime import Engine, Store, Memory, MemorySnapshot, Global
+from ._instance import Instance
+from ._instance_pre import InstancePre
+
+
+class PooledStore:
+    """
+    A `Store` and instance checked out of a `StorePool`.
+
+    This is a context manager which returns itself to its pool on exit. If
+    the block raised an exception, such as a `Trap`, then the store is
+    discarded instead of being reused.
+    """
+
+    store: Store
+    instance: Instance
+    _pool: "StorePool"
+    _checked_out: bool
+    _memories: List[Tuple[Memory, MemorySnapshot]]
+    _globals: List[Tuple[Global, Any]]
+
+    def __init__(self, pool: "StorePool", store: Store, instance: Instance):
+        self.store = store
+        self.instance = instance
+        self._pool = pool
+        self._checked_out = True
+        self._memories = []
+        self._globals = []
+        for item in instance.exports(store).values():
+            if isinstance(item, Memory):
+                self._memories.append((item, item.snapshot(store)))
+            elif isinstance(item, Global) and item.type(store).mutable:
+                self._globals.append((item, item.value(store)))
+
+    def release(self, discard: bool = False) -> None:
+        """
+        Returns this store to its pool, or drops it if `discard` is true.
+
+        Releasing a store which has already been released does nothing.
+        """
+        if not self._checked_out:
+            return
+        self._checked_out = False
+        self._pool._release(self, discard)
+
+    def _memory_size(self) -> int:
+        return sum(memory.data_len(self.store) for memory, _ in self._memories)
+
+    def _reset(self) -> None:
+        store = self.store
+        for memory, snapshot in self._memories:
+            memory.restore(store, snapshot)
+        for g, value in self._globals:
+            g.set_value(store, value)
+
+    def __enter__(self) -> "PooledStore":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        self.release(discard=exc_type is not None)
+
+
+class StorePool:
+    """
+    A bounded pool of ready-to-use stores, each holding an instance created
+    from the same `InstancePre`.
+
+    Creating a `Store`, configuring it and instantiating a module for every
+    request is comparatively expensive. A pool instead hands out an idle
+    store from a previous request, after resetting its exported memories and
+    mutable globals to their state just after instantiation. State which
+    isn't reachable through exports, such as non-exported globals or tables,
+    is not reset, so modules used with a pool should keep all per-request
+    state in memory or exported globals.
+
+    Stores which trapped, or whose memories grew beyond `max_memory` bytes,
+    are discarded rather than reused. At most `size` idle stores are kept, and
+    the least recently used ones are dropped beyond that.
+    """
+
+    _engine: Engine
+    _instance_pre: InstancePre
+    _size: int
+    _setup: Optional[Callable[[Store], None]]
+    _fuel: Optional[int]
+    _epoch_deadline: Optional[int]
+    _max_memory: Optional[int]
+    _idle: Deque[PooledStore]
+    _lock: threading.Lock
+
+    def __init__(self,
+                 engine: Engine,
+                 instance_pre: InstancePre,
+                 size: int = 8,
+                 setup: Optional[Callable[[Store], None]] = None,
+                 fuel: Optional[int] = None,
+                 epoch_deadline: Optional[int] = None,
+                 max_memory: Optional[int] = None):
+        """
+        Creates an empty pool of stores in `engine` which instantiate
+        `instance_pre`.
+
+        `setup` is called with each new store before instantiation, for
+        example to configure WASI with `Store.set_wasi` or limits with
+        `Store.set_limits`. If given, `fuel` and `epoch_deadline` are applied
+        to each store whenever it's checked out, requiring
+        `Config.consume_fuel` and `Config.epoch_interruption` respectively.
+        """
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self._engine = engine
+        self._instance_pre = instance_pre
+        self._size = size
+        self._setup = setup
+        self._fuel = fuel
+        self._epoch_deadline = epoch_deadline
+        self._max_memory = max_memory
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def checkout(self) -> PooledStore:
+        """
+        Returns the most recently used idle store, or creates a new one if
+        there are none.
+
+        The result should be used as a context manager, or handed back with
+        `PooledStore.release`, when the caller is done with it.
+        """
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+        if entry is not None:
+            entry._checked_out = True
+            self._configure(entry.store)
+            return entry
+        store = Store(self._engine)
+        if self._setup is not None:
+            self._setup(store)
+        self._configure(store)
+        instance = self._instance_pre.instantiate(store)
+        # Instantiation may have consumed fuel, so hand out a full budget.
+        self._configure(store)
+        return PooledStore(self, store, instance)
+
+    def idle(self) -> int:
+        """
+        Returns the number of idle stores currently held by this pool.
+        """
+        return len(self._idle)
+
+    def clear(self) -> None:
+        """
+        Drops all idle stores.
+        """
+        with self._lock:
+            self._idle.clear()
+
+    def _configure(self, store: Store) -> None:
+        if self._fuel is not None:
+            store.set_fuel(self._fuel)
+        if self._epoch_deadline is not None:
+            store.set_epoch_deadline(self._epoch_deadline)
+
+    def _release(self, entry: PooledStore, discard: bool) -> None:
+        if discard or self._size == 0:
+            return
+        if self._max_memory is not None and entry._memory_size() > self._max_memory:
+            return
+        entry._reset()
+        with self._lock:
+            self._idle.append(entry)
+            while len(self._idle) > self._size:
+                self._idle.popleft()
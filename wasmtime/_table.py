@@ -1,20 +1,22 @@
 import ctypes
 
 from . import _ffi as ffi
-from wasmtime import TableType, Store, WasmtimeError, Val
+from wasmtime import TableType, Store, WasmtimeError, Val, ValType
 from typing import Optional, Any
 from ._store import Storelike
 
 
 class Table:
     _table: ffi.wasmtime_table_t
+    _element: Optional[ValType]
 
     def __init__(self, store: Store, ty: TableType, init: Any):
         """
         Creates a new table within `store` with the specified `ty`.
         """
 
-        init_val = Val._convert_to_raw(store, ty.element, init)
+        element = ty.element
+        init_val = Val._convert_to_raw(store, element, init)
 
         table = ffi.wasmtime_table_t()
         error = ffi.wasmtime_table_new(store._context(), ty.ptr(), ctypes.byref(init_val), ctypes.byref(table))
@@ -22,11 +24,13 @@ class Table:
         if error:
             raise WasmtimeError._from_ptr(error)
         self._table = table
+        self._element = element
 
     @classmethod
     def _from_raw(cls, table: ffi.wasmtime_table_t) -> "Table":
         ty: "Table" = cls.__new__(cls)
         ty._table = table
+        ty._element = None
         return ty
 
     def type(self, store: Storelike) -> TableType:
@@ -37,6 +41,13 @@ class Table:
         ptr = ffi.wasmtime_table_type(store._context(), ctypes.byref(self._table))
         return TableType._from_ptr(ptr, None)
 
+    def _element_type(self, store: Storelike) -> ValType:
+        # The element type of a table never changes, so only look it up once.
+        element = self._element
+        if element is None:
+            element = self._element = self.type(store).element
+        return element
+
     def size(self, store: Storelike) -> int:
         """
         Gets the size, in elements, of this table
@@ -51,7 +62,7 @@ class Table:
         Raises a `WasmtimeError` if the table could not be grown.
         Returns the previous size of the table otherwise.
         """
-        init_val = Val._convert_to_raw(store, self.type(store).element, init)
+        init_val = Val._convert_to_raw(store, self._element_type(store), init)
         prev = ctypes.c_uint64(0)
         error = ffi.wasmtime_table_grow(store._context(), ctypes.byref(self._table), ctypes.c_uint64(amt), ctypes.byref(init_val), ctypes.byref(prev))
         ffi.wasmtime_val_unroot(ctypes.byref(init_val))
@@ -95,7 +106,7 @@ class Table:
 
         Raises a `WasmtimeError` if `idx` is out of bounds.
         """
-        value = Val._convert_to_raw(store, self.type(store).element, val)
+        value = Val._convert_to_raw(store, self._element_type(store), val)
         error = ffi.wasmtime_table_set(store._context(), ctypes.byref(self._table), idx, ctypes.byref(value))
         ffi.wasmtime_val_unroot(ctypes.byref(value))
         if error:
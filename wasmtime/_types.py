@@ -1,6 +1,6 @@
 import ctypes
 from ctypes import POINTER, byref
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, cast
 
 from wasmtime import Managed, WasmtimeError
 
@@ -9,6 +9,7 @@ from . import _ffi as ffi
 
 class ValType(Managed["ctypes._Pointer[ffi.wasm_valtype_t]"]):
     _owner: Optional[Any]
+    _kind: int
 
     def _delete(self, ptr: "ctypes._Pointer[ffi.wasm_valtype_t]") -> None:
         # If this is owned by another object we don't free it since that object
@@ -16,35 +17,47 @@ class ValType(Managed["ctypes._Pointer[ffi.wasm_valtype_t]"]):
         if self._owner is None:
             ffi.wasm_valtype_delete(ptr)
 
+    def close(self) -> None:
+        # Interned types are shared process-wide and are never deallocated.
+        if self._owner is _INTERNED:
+            return
+        super().close()
+
+    @classmethod
+    def _interned(cls, kind: int) -> "ValType":
+        """
+        Returns the process-wide `ValType` for `kind`, creating it on first
+        use.
+        """
+        ty = _INTERNED_TYPES.get(kind)
+        if ty is None:
+            ty = ValType._from_ptr(ffi.wasm_valtype_new(kind), _INTERNED)
+            ty = _INTERNED_TYPES.setdefault(kind, ty)
+        return ty
+
     @classmethod
     def i32(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_I32)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_I32.value)
 
     @classmethod
     def i64(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_I64)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_I64.value)
 
     @classmethod
     def f32(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_F32)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_F32.value)
 
     @classmethod
     def f64(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_F64)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_F64.value)
 
     @classmethod
     def externref(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_ANYREF)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_ANYREF.value)
 
     @classmethod
     def funcref(cls) -> "ValType":
-        ptr = ffi.wasm_valtype_new(ffi.WASM_FUNCREF)
-        return ValType._from_ptr(ptr, None)
+        return cls._interned(ffi.WASM_FUNCREF.value)
 
     def __init__(self) -> None:
         raise WasmtimeError("cannot construct directly")
@@ -56,14 +69,15 @@ class ValType(Managed["ctypes._Pointer[ffi.wasm_valtype_t]"]):
         ty: "ValType" = cls.__new__(cls)
         ty._set_ptr(ptr)
         ty._owner = owner
+        # `wasm_valkind_t` is a simple ctypes type, so ctypes already converts
+        # the result to an `int` despite the declared return type.
+        ty._kind = cast(int, ffi.wasm_valtype_kind(ptr))
         return ty
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ValType):
             return False
-        kind1 = ffi.wasm_valtype_kind(self.ptr())
-        kind2 = ffi.wasm_valtype_kind(other.ptr())
-        return kind1 == kind2
+        return self._kind == other._kind
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
@@ -71,8 +85,11 @@ class ValType(Managed["ctypes._Pointer[ffi.wasm_valtype_t]"]):
     def __repr__(self) -> str:
         return str(self)
 
+    def __hash__(self) -> int:
+        return hash(self._kind)
+
     def __str__(self) -> str:
-        kind = ffi.wasm_valtype_kind(self.ptr())
+        kind = self._kind
         if kind == ffi.WASM_I32.value:
             return 'i32'
         if kind == ffi.WASM_I64.value:
@@ -85,7 +102,7 @@ class ValType(Managed["ctypes._Pointer[ffi.wasm_valtype_t]"]):
             return 'anyref'
         if kind == ffi.WASM_FUNCREF.value:
             return 'funcref'
-        return 'ValType(%d)' % kind.value
+        return 'ValType(%d)' % kind
 
     @classmethod
     def _from_list(cls, items: "ctypes._Pointer[ffi.wasm_valtype_vec_t]", owner: Optional[Any]) -> List["ValType"]:
@@ -103,7 +120,13 @@ def take_owned_valtype(ty: ValType) -> "ctypes._Pointer[ffi.wasm_valtype_t]":
     #
     # Trying to expose this as an implementation detail by sneaking out
     # types and having some be "taken" feels pretty weird
-    return ffi.wasm_valtype_new(ffi.wasm_valtype_kind(ty.ptr()))
+    return ffi.wasm_valtype_new(ty._kind)
+
+
+# Marker used as the `_owner` of interned `ValType` instances, which are kept
+# alive for the lifetime of the process.
+_INTERNED = object()
+_INTERNED_TYPES: Dict[int, ValType] = {}
 
 
 class FuncType(Managed["ctypes._Pointer[ffi.wasm_functype_t]"]):
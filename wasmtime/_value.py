@@ -29,7 +29,7 @@ def _unintern(idx: int) -> typing.Any:
 
 
 class Val:
-    _kind: ffi.wasmtime_valkind_t
+    _kind: int
     _val: typing.Any
 
     @classmethod
@@ -40,7 +40,7 @@ class Val:
         if not isinstance(val, int):
             raise TypeError("expected an integer")
         val = ffi.wasmtime_valunion_t(i32=val).i32
-        return Val(ffi.WASMTIME_I32, val)
+        return Val(ffi.WASMTIME_I32.value, val)
 
     @classmethod
     def i64(cls, val: int) -> "Val":
@@ -50,7 +50,7 @@ class Val:
         if not isinstance(val, int):
             raise TypeError("expected an integer")
         val = ffi.wasmtime_valunion_t(i64=val).i64
-        return Val(ffi.WASMTIME_I64, val)
+        return Val(ffi.WASMTIME_I64.value, val)
 
     @classmethod
     def f32(cls, val: float) -> "Val":
@@ -60,7 +60,7 @@ class Val:
         if not isinstance(val, float):
             raise TypeError("expected a float")
         val = ffi.wasmtime_valunion_t(f32=val).f32
-        return Val(ffi.WASMTIME_F32, val)
+        return Val(ffi.WASMTIME_F32.value, val)
 
     @classmethod
     def f64(cls, val: float) -> "Val":
@@ -70,15 +70,15 @@ class Val:
         if not isinstance(val, float):
             raise TypeError("expected a float")
         val = ffi.wasmtime_valunion_t(f64=val).f64
-        return Val(ffi.WASMTIME_F64, val)
+        return Val(ffi.WASMTIME_F64.value, val)
 
     @classmethod
     def externref(cls, extern: typing.Optional[typing.Any]) -> "Val":
-        return Val(ffi.WASMTIME_EXTERNREF, extern)
+        return Val(ffi.WASMTIME_EXTERNREF.value, extern)
 
     @classmethod
     def funcref(cls, f: "typing.Optional[wasmtime.Func]") -> "Val":
-        return Val(ffi.WASMTIME_FUNCREF, f)
+        return Val(ffi.WASMTIME_FUNCREF.value, f)
 
     @classmethod
     def ref_null(cls, ty: ValType) -> "Val":
@@ -87,13 +87,15 @@ class Val:
 
         Raise an exception if `ty` is not a reference type.
         """
-        if ty == ValType.externref():
+        if ty._kind == ffi.WASM_ANYREF.value:
             return Val.externref(None)
-        if ty == ValType.funcref():
+        if ty._kind == ffi.WASM_FUNCREF.value:
             return Val.funcref(None)
         raise WasmtimeError("Invalid reference type for `ref_null`: %s" % ty)
 
-    def __init__(self, kind: ffi.wasmtime_valkind_t, val: typing.Any):
+    def __init__(self, kind: typing.Union[int, ffi.wasmtime_valkind_t], val: typing.Any):
+        if not isinstance(kind, int):
+            kind = kind.value
         self._kind = kind
         self._val = val
 
@@ -105,28 +107,14 @@ class Val:
     @classmethod
     def _convert_to_raw(cls, store: 'Storelike', ty: ValType, val: typing.Any) -> ffi.wasmtime_val_t:
         if isinstance(val, Val):
-            if ty != val.type:
+            if _WASMTIME_KINDS.get(ty._kind) != val._kind:
                 raise TypeError("wrong type of `Val` provided")
             return val._new_raw(store)
-        if ty == ValType.externref():
-            return Val.externref(val)._new_raw(store)
-        elif isinstance(val, int):
-            if ty == ValType.i32():
-                return Val.i32(val)._new_raw(store)
-            if ty == ValType.i64():
-                return Val.i64(val)._new_raw(store)
-        elif isinstance(val, float):
-            if ty == ValType.f32():
-                return Val.f32(val)._new_raw(store)
-            if ty == ValType.f64():
-                return Val.f64(val)._new_raw(store)
-        elif isinstance(val, wasmtime.Func):
-            return Val.funcref(val)._new_raw(store)
-        elif val is None:
-            if ty == ValType.externref():
-                return Val.externref(None)._new_raw(store)
-            if ty == ValType.funcref():
-                return Val.funcref(None)._new_raw(store)
+        convert = _TO_RAW.get(ty._kind)
+        if convert is not None:
+            ret = convert(store, val)
+            if ret is not None:
+                return ret
         raise TypeError("don't know how to convert %r to %s" % (val, ty))
 
     def _new_raw(self, store: 'Storelike') -> ffi.wasmtime_val_t:
@@ -194,7 +182,7 @@ class Val:
         """
         Get the 32-bit integer value of this value, or `None` if it's not an i32
         """
-        if self._kind == ffi.WASMTIME_I32:
+        if self._kind == ffi.WASMTIME_I32.value:
             assert(isinstance(self._val, int))
             return self._val
         else:
@@ -204,7 +192,7 @@ class Val:
         """
         Get the 64-bit integer value of this value, or `None` if it's not an i64
         """
-        if self._kind == ffi.WASMTIME_I64:
+        if self._kind == ffi.WASMTIME_I64.value:
             assert(isinstance(self._val, int))
             return self._val
         else:
@@ -214,7 +202,7 @@ class Val:
         """
         Get the 32-bit float value of this value, or `None` if it's not an f32
         """
-        if self._kind == ffi.WASMTIME_F32:
+        if self._kind == ffi.WASMTIME_F32.value:
             assert(isinstance(self._val, float))
             return self._val
         else:
@@ -224,7 +212,7 @@ class Val:
         """
         Get the 64-bit float value of this value, or `None` if it's not an f64
         """
-        if self._kind == ffi.WASMTIME_F64:
+        if self._kind == ffi.WASMTIME_F64.value:
             assert(isinstance(self._val, float))
             return self._val
         else:
@@ -235,7 +223,7 @@ class Val:
         Get the extern data referenced by this `externref` value, or `None` if
         it's not an `externref`.
         """
-        if self._kind == ffi.WASMTIME_EXTERNREF:
+        if self._kind == ffi.WASMTIME_EXTERNREF.value:
             return self._val
         else:
             return None
@@ -245,7 +233,7 @@ class Val:
         Get the function that this `funcref` value is referencing, or `None` if
         this is not a `funcref` value, or is a null reference.
         """
-        if self._kind == ffi.WASMTIME_FUNCREF:
+        if self._kind == ffi.WASMTIME_FUNCREF.value:
             assert(isinstance(self._val, wasmtime.Func))
             return self._val
         else:
@@ -256,23 +244,57 @@ class Val:
         """
         Returns the `ValType` corresponding to this `Val`
         """
-        kind = self._kind
-        if kind == ffi.WASMTIME_I32:
-            return ValType.i32()
-        elif kind == ffi.WASMTIME_I64:
-            return ValType.i64()
-        elif kind == ffi.WASMTIME_F32:
-            return ValType.f32()
-        elif kind == ffi.WASMTIME_F64:
-            return ValType.f64()
-        elif kind == ffi.WASMTIME_V128:
+        kind = _WASM_KINDS.get(self._kind)
+        if kind is not None:
+            return ValType._interned(kind)
+        elif self._kind == ffi.WASMTIME_V128.value:
             raise Exception("unimplemented v128 type")
-        elif kind == ffi.WASMTIME_EXTERNREF:
-            return ValType.externref()
-        elif kind == ffi.WASMTIME_FUNCREF:
-            return ValType.funcref()
         else:
-            raise Exception("unknown kind %d" % kind.value)
+            raise Exception("unknown kind %d" % self._kind)
+
+
+def _numeric_to_raw(kind: int, field: str, ty: type) -> typing.Callable[['Storelike', typing.Any], typing.Optional[ffi.wasmtime_val_t]]:
+    def convert(store: 'Storelike', val: typing.Any) -> typing.Optional[ffi.wasmtime_val_t]:
+        if not isinstance(val, ty):
+            return None
+        ret = ffi.wasmtime_val_t(kind=kind)
+        setattr(ret.of, field, val)
+        return ret
+    return convert
+
+
+def _externref_to_raw(store: 'Storelike', val: typing.Any) -> typing.Optional[ffi.wasmtime_val_t]:
+    return Val.externref(val)._new_raw(store)
+
+
+def _funcref_to_raw(store: 'Storelike', val: typing.Any) -> typing.Optional[ffi.wasmtime_val_t]:
+    if val is not None and not isinstance(val, wasmtime.Func):
+        return None
+    return Val.funcref(val)._new_raw(store)
+
+
+# Conversions from arbitrary Python values to raw values, indexed by the kind
+# of the `ValType` being converted to. Each returns `None` if the value can't
+# be converted.
+_TO_RAW: typing.Dict[int, typing.Callable[['Storelike', typing.Any], typing.Optional[ffi.wasmtime_val_t]]] = {
+    ffi.WASM_I32.value: _numeric_to_raw(ffi.WASMTIME_I32.value, 'i32', int),
+    ffi.WASM_I64.value: _numeric_to_raw(ffi.WASMTIME_I64.value, 'i64', int),
+    ffi.WASM_F32.value: _numeric_to_raw(ffi.WASMTIME_F32.value, 'f32', float),
+    ffi.WASM_F64.value: _numeric_to_raw(ffi.WASMTIME_F64.value, 'f64', float),
+    ffi.WASM_ANYREF.value: _externref_to_raw,
+    ffi.WASM_FUNCREF.value: _funcref_to_raw,
+}
+
+# Mappings between the kinds of `ValType` and the kinds of `Val`.
+_WASMTIME_KINDS = {
+    ffi.WASM_I32.value: ffi.WASMTIME_I32.value,
+    ffi.WASM_I64.value: ffi.WASMTIME_I64.value,
+    ffi.WASM_F32.value: ffi.WASMTIME_F32.value,
+    ffi.WASM_F64.value: ffi.WASMTIME_F64.value,
+    ffi.WASM_ANYREF.value: ffi.WASMTIME_EXTERNREF.value,
+    ffi.WASM_FUNCREF.value: ffi.WASMTIME_FUNCREF.value,
+}
+_WASM_KINDS = {v: k for k, v in _WASMTIME_KINDS.items()}
 
 
 # This needs to be imported so that mypy understands `wasmtime.Func` in typings,
@@ -0,0 +1,169 @@
+"""
+Ahead-of-time compilation of WebAssembly modules and components.
+
+Run as `python -m wasmtime.compile SRC OUT` to compile every `.wasm` file
+found under the directory `SRC` into a serialized artifact at the same
+relative path under `OUT`, with the extension `.cwasm`. Artifacts can then be
+loaded with `Module.deserialize_file` or `Component.deserialize_file` by an
+`Engine` created with the same configuration, which maps them into memory
+instead of compiling anything.
+
+A `manifest.json` is also written to `OUT` recording the SHA-256 of each
+source and artifact, along with a fingerprint of the configuration used, so
+deployments can check that artifacts are up to date. Run with `--help` for
+the available options.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import typing
+from pathlib import Path
+
+from wasmtime import Config, Engine, Module, WasmtimeError
+from wasmtime.component import Component
+from ._module import CompileResult
+from ._module_cache import _engine_fingerprint, _write_atomic
+
+# Name of the manifest written to the output directory.
+MANIFEST = 'manifest.json'
+
+# Extension of the artifacts written to the output directory.
+ARTIFACT_SUFFIX = '.cwasm'
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Runs the command line interface with `argv`, defaulting to
+    `sys.argv[1:]`, and returns the process exit code: non-zero if any file
+    failed to compile.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        config = _config(args)
+    except (WasmtimeError, ValueError) as e:
+        parser.error(str(e))
+    try:
+        failures = compile_directory(Engine(config), args.src, args.out, max_workers=args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
+    return 1 if failures else 0
+
+
+def compile_directory(engine: Engine,
+                      src: typing.Union[str, os.PathLike],
+                      out: typing.Union[str, os.PathLike],
+                      max_workers: typing.Optional[int] = None) -> int:
+    """
+    Compiles every `.wasm` file under `src` with `engine`, writing artifacts
+    and a manifest to `out`.
+
+    Returns the number of files which failed to compile, each of which is
+    reported on stderr. Raises a `ValueError` if `src` isn't a directory or
+    contains no `.wasm` files, rather than writing an empty manifest.
+    """
+    src = Path(src)
+    out = Path(out)
+    if not src.is_dir():
+        raise ValueError("`{}` is not a directory".format(src))
+    sources = sorted(p for p in src.rglob('*.wasm') if p.is_file())
+    if not sources:
+        raise ValueError("no `.wasm` files found in `{}`".format(src))
+    binaries = [p.read_bytes() for p in sources]
+    components = [_is_component(wasm) for wasm in binaries]
+
+    # Modules and components are compiled as separate batches, then the
+    # results are put back into the order of `sources`.
+    module_indices = [i for i, c in enumerate(components) if not c]
+    component_indices = [i for i, c in enumerate(components) if c]
+    results: typing.List[CompileResult] = [CompileResult(None, None)] * len(sources)
+    modules = Module.compile_many(engine, [binaries[i] for i in module_indices], max_workers=max_workers)
+    for i, module in zip(module_indices, modules):
+        results[i] = module
+    comps = Component.compile_many(engine, [binaries[i] for i in component_indices], max_workers=max_workers)
+    for i, comp in zip(component_indices, comps):
+        results[i] = comp
+
+    artifacts = []
+    failures = 0
+    for path, wasm, component, result in zip(sources, binaries, components, results):
+        name = path.relative_to(src)
+        if result.error is not None:
+            print("failed to compile {}: {}".format(name, result.error), file=sys.stderr)
+            failures += 1
+            continue
+        assert(result.value is not None)
+        artifact = name.with_suffix(ARTIFACT_SUFFIX)
+        data = result.value.serialize()
+        result.value.close()
+        (out / artifact).parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(str(out / artifact), data)
+        artifacts.append({
+            'source': name.as_posix(),
+            'source_sha256': hashlib.sha256(wasm).hexdigest(),
+            'artifact': artifact.as_posix(),
+            'artifact_sha256': hashlib.sha256(data).hexdigest(),
+            'kind': 'component' if component else 'module',
+        })
+
+    manifest = {
+        'engine': _engine_fingerprint(engine),
+        'artifacts': artifacts,
+    }
+    out.mkdir(parents=True, exist_ok=True)
+    _write_atomic(str(out / MANIFEST), (json.dumps(manifest, indent=2) + '\n').encode('utf-8'))
+    return failures
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m wasmtime.compile',
+        description='Precompiles a directory of WebAssembly modules and components.')
+    parser.add_argument('src', help='directory to search for `.wasm` files')
+    parser.add_argument('out', help='directory to write artifacts and the manifest to')
+    parser.add_argument('--target', help='target triple to compile for, defaulting to the host')
+    parser.add_argument('-O', '--opt-level', choices=['none', 'speed', 'speed_and_size'],
+                        help='Cranelift optimization level')
+    parser.add_argument('--enable', metavar='FEATURE', action='append', default=[],
+                        help='enable a wasm feature, such as `simd` for `Config.wasm_simd`')
+    parser.add_argument('--disable', metavar='FEATURE', action='append', default=[],
+                        help='disable a wasm feature')
+    parser.add_argument('--cranelift-flag', metavar='FLAG[=VALUE]', action='append', default=[],
+                        help='enable, or set, a Cranelift flag')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='number of modules to compile in parallel, defaulting to one per CPU')
+    return parser
+
+
+def _config(args: argparse.Namespace) -> Config:
+    config = Config()
+    if args.target is not None:
+        config.target = args.target
+    if args.opt_level is not None:
+        config.cranelift_opt_level = args.opt_level
+    for names, enable in [(args.enable, True), (args.disable, False)]:
+        for name in names:
+            attr = 'wasm_' + name.replace('-', '_')
+            if not isinstance(getattr(Config, attr, None), property):
+                raise ValueError("unknown wasm feature `{}`".format(name))
+            setattr(config, attr, enable)
+    for flag in args.cranelift_flag:
+        key, sep, value = flag.partition('=')
+        if sep:
+            config.cranelift_flag_set(key, value)
+        else:
+            config.cranelift_flag_enable(key)
+    return config
+
+
+def _is_component(wasm: bytes) -> bool:
+    # Modules and components share a magic number, but components use a
+    # different layer in the upper half of the version field.
+    return wasm[:4] == b'\0asm' and wasm[6:8] != b'\0\0'
+
+
+if __name__ == '__main__':
+    sys.exit(main())
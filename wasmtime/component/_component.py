@@ -3,9 +3,13 @@ from .._wat2wasm import _to_wasm
 from ._types import ComponentType
 import ctypes
 from wasmtime import Engine, wat2wasm, WasmtimeError, Managed, Module
+from .._module import CompileResult, CompileSource, _compile_many
 import typing
 from os import PathLike
 
+if typing.TYPE_CHECKING:
+    from .._module_cache import ModuleCache
+
 
 class ExportIndex(Managed["ctypes._Pointer[ffi.wasmtime_component_export_index_t]"]):
 
@@ -37,6 +41,22 @@ class Component(Managed["ctypes._Pointer[ffi.wasmtime_component_t]"]):
             contents = f.read()
         return cls(engine, contents)
 
+    @classmethod
+    def compile_many(cls,
+                     engine: Engine,
+                     sources: typing.Iterable[CompileSource],
+                     max_workers: typing.Optional[int] = None,
+                     cache: typing.Optional["ModuleCache"] = None) -> typing.List[CompileResult["Component"]]:
+        """
+        Compiles many components in parallel, in the same way as
+        `Module.compile_many`.
+        """
+        def load(wasm: typing.Union[str, bytes]) -> "Component":
+            if cache is not None:
+                return cache.load_component(engine, wasm)
+            return cls(engine, wasm)
+        return _compile_many(load, sources, max_workers)
+
     def __init__(self, engine: Engine, wasm: typing.Union[str, bytes, bytearray]):
         if not isinstance(engine, Engine):
             raise TypeError("expected an Engine")
@@ -64,7 +84,7 @@ class Component(Managed["ctypes._Pointer[ffi.wasmtime_component_t]"]):
         return ty
 
     @classmethod
-    def deserialize(cls, engine: Engine, encoded: typing.Union[bytes, bytearray]) -> 'Component':
+    def deserialize(cls, engine: Engine, encoded: typing.Any) -> 'Component':
         """
         Deserializes bytes previously created by `Component.serialize`.
 
@@ -72,20 +92,15 @@ class Component(Managed["ctypes._Pointer[ffi.wasmtime_component_t]"]):
         by a serialized component. This will only succeed if the bytes were
         previously created by the same version of `wasmtime` as well as the
         same configuration within `Engine`.
-        """
 
-        if not isinstance(encoded, (bytes, bytearray)):
-            raise TypeError("expected bytes")
+        `encoded` may be any object supporting the buffer protocol, such as
+        `bytes`, a `memoryview` or an `mmap.mmap`, and its contents are passed
+        to wasmtime without being copied.
+        """
 
         ptr = ctypes.POINTER(ffi.wasmtime_component_t)()
-
-        # TODO: can the copy be avoided here? I can't for the life of me
-        # figure this out.
-        error = ffi.wasmtime_component_deserialize(
-            engine.ptr(),
-            (ctypes.c_uint8 * len(encoded)).from_buffer_copy(encoded),
-            len(encoded),
-            ctypes.byref(ptr))
+        with ffi.borrow_buffer(encoded) as (buf, size):
+            error = ffi.wasmtime_component_deserialize(engine.ptr(), buf, size, ctypes.byref(ptr))
         if error:
             raise WasmtimeError._from_ptr(error)
         return cls._from_ptr(ptr)
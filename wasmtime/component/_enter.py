@@ -1,10 +1,18 @@
 from contextlib import contextmanager
 import ctypes
+import threading
 from .. import _ffi as ffi, StoreContext, WasmtimeError
 from typing import Optional, Callable
 
 
-LAST_EXCEPTION: Optional[Exception] = None
+class ThreadState(threading.local):
+    # An exception raised by a host function, to be re-raised once wasm
+    # returns back to Python. Kept per-thread since host functions run on the
+    # thread that entered wasm.
+    last_exception: Optional[Exception] = None
+
+
+STATE = ThreadState()
 
 
 def catch_exceptions(store_raw: 'ctypes._Pointer[ffi.wasmtime_context_t]', func: Callable[[StoreContext], None]) -> ctypes.c_size_t:
@@ -15,8 +23,7 @@ def catch_exceptions(store_raw: 'ctypes._Pointer[ffi.wasmtime_context_t]', func:
     except WasmtimeError as e:
         exception = e
     except Exception as e:
-        global LAST_EXCEPTION
-        LAST_EXCEPTION = e
+        STATE.last_exception = e
         exception = WasmtimeError("python exception")
     finally:
         store._invalidate()
@@ -35,9 +42,8 @@ def enter_wasm(func: Callable[[], 'ctypes._Pointer[ffi.wasmtime_error_t]']) -> N
 
 
 def maybe_raise_last_exn() -> None:
-    global LAST_EXCEPTION
-    if LAST_EXCEPTION is None:
+    exn = STATE.last_exception
+    if exn is None:
         return
-    exn = LAST_EXCEPTION
-    LAST_EXCEPTION = None
+    STATE.last_exception = None
     raise exn